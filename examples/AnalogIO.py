@@ -110,7 +110,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        dwf = DigilentWaveformsLibrary()
+        dwf = DigilentWaveformsLibrary.shared()
         with find_demo_device(dwf, args.serial_number) as device:
             demo_analog_io_api(device.analogIO)
             demo_analog_io_continuous_readout(device.analogIO)
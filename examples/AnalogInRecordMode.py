@@ -19,7 +19,9 @@ When using the AnalogIn instrument with the "Record" acquisition mode, we prepar
 
 Next, we enter a loop where we continuously fetch data from the instrument by calling analogIn.status(True).
 This is repeated until analogIn.status() returns DwfState.Done. Note that this last status() call also transfers
-acquisition data that needs to be processed.
+acquisition data that needs to be processed. The analogIn.recordStream() generator implements this loop, yielding
+chunks of samples as they arrive; the analogIn.recordCapture() method, used in this demo, builds on the same loop
+to deliver a recording of the configured length.
 
 After the status() call, we get information on the acquisition status by calling statusRecord(). This call
 returns three numbers: counts of available, lost, and corrupted samples.
@@ -36,28 +38,29 @@ suggest that the way to handle nonzero "lost" samples is to skip over them; this
 Assuming the lost and corrupt counts are zero, the 'available' count gives the number of valid samples available in
 the local (PC-side) buffer. These samples can be obtained using calls to statusData(), statusData2(), or
 statusData16(). The pydwf library implements these functions by having them allocate a sufficiently-sized local
-numpy array, reading the sample data into it, and returning that array.
-
-At the end of the acquisition, i.e., after the status() function returns DwfState.Done, these sub-arrays are
-concatenated to deliver the full sample record of the acquisition.
-
-At that point, we discard all but the last (record_length * sample_frequency) samples that constitute the requested
-recording length. The preceding samples were received from the device, but the first few samples may be garbled,
-and the total number of samples received will generally exceed the number of samples requested, sometimes by a
-considerable margin.
-
-The discarding process is also needed to make sure that the trigger position is in a predictable and reproducable
-place. After discarding the first samples of the acquisition to get the requested length, the first remaining
-sample is at the time, measured in seconds, returned by the analogIn.triggerPositionStatus() call, relative to
-the trigger moment.
+numpy array, reading the sample data into it, and returning that array. To read several channels at once, the
+statusDataMulti() convenience method reads the samples of all channels into a single 2D array, which may be a slice
+of a larger, preallocated array.
+
+At the end of the acquisition, i.e., after the status() function returns DwfState.Done, we need only the last
+(record_length * sample_frequency) samples that constitute the requested recording length. The preceding samples
+were received from the device, but the first few samples may be garbled, and the total number of samples received
+will generally exceed the number of samples requested, sometimes by a considerable margin.
+
+The recordCapture() method therefore reads the samples into a ring buffer of exactly the requested length,
+overwriting the oldest samples as newer samples arrive. When the acquisition is done, the ring buffer is rotated in
+place so the samples are in chronological order. This keeps the memory use bounded by the size of the recording.
+
+Keeping only the last samples is also needed to make sure that the trigger position is in a predictable and
+reproducable place. The first sample of the recording is at the time, measured in seconds, returned by the
+analogIn.triggerPositionStatus() call, relative to the trigger moment.
 """
 
 import argparse
 import time
-import numpy as np
 import matplotlib.pyplot as plt
 
-from pydwf import DigilentWaveformsLibrary, AnalogOutNode, FUNC, ACQMODE, TRIGSRC, TRIGTYPE, DwfTriggerSlope, DwfState, FILTER
+from pydwf import DigilentWaveformsLibrary, AnalogOutNode, FUNC, ACQMODE, TRIGSRC, TRIGTYPE, DwfTriggerSlope, FILTER
 from demo_utilities import find_demo_device, DemoDeviceNotFoundError
 
 def configure_analog_output(analogOut, analog_out_frequency, analog_out_amplitude, analog_out_offset):
@@ -91,9 +94,11 @@ def configure_analog_output(analogOut, analog_out_frequency, analog_out_amplitud
     analogOut.configure(CH1, True)
 
 
-def run_demo(analogIn, sample_frequency, record_length, trigger_flag, signal_frequency):
+def run_demo(device, sample_frequency, record_length, trigger_flag, signal_frequency):
     """Set up analog output, configure the analog input, and perform repeated acquisitions and present them graphically."""
 
+    analogIn = device.analogIn
+
     if trigger_flag:
         trigger_position = -0.5 * record_length # Position of first sample relative to the trigger. Setting it to -0.5 * record_length puts the trigger halfway the capture window.
         trigger_level    = 0.0                  # Trigger level in Volts.
@@ -105,25 +110,28 @@ def run_demo(analogIn, sample_frequency, record_length, trigger_flag, signal_fre
 
     channels = (CH1, CH2)
 
-    for channel_index in channels:
-        analogIn.channelEnableSet(channel_index, True)
-        analogIn.channelFilterSet(channel_index, FILTER.Decimate)
-        analogIn.channelRangeSet (channel_index, 5.0)
+    # Apply all settings in a single configuration of the instrument, rather than configuring it for every setting.
+    with device.configTransaction():
 
-    analogIn.acquisitionModeSet(ACQMODE.Record)
-    analogIn.frequencySet      (sample_frequency)
-    analogIn.recordLengthSet   (record_length)
+        for channel_index in channels:
+            analogIn.channelEnableSet(channel_index, True)
+            analogIn.channelFilterSet(channel_index, FILTER.Decimate)
+            analogIn.channelRangeSet (channel_index, 5.0)
 
-    if trigger_flag:
-        # Set up trigger for the analog input instrument.
-        # We will trigger on the rising transitions of CH2 (the "cosine" channel) through 0V.
-        analogIn.triggerSourceSet(TRIGSRC.DetectorAnalogIn)
-        analogIn.triggerChannelSet(CH2)
-        analogIn.triggerTypeSet(TRIGTYPE.Edge)
-        analogIn.triggerConditionSet(DwfTriggerSlope.Rise)
-        analogIn.triggerPositionSet(trigger_position)
-        analogIn.triggerLevelSet(trigger_level)
-        analogIn.triggerHysteresisSet(0.010) # Configure a small amount of hysteresis to make sure we only see rising edges.
+        analogIn.acquisitionModeSet(ACQMODE.Record)
+        analogIn.frequencySet      (sample_frequency)
+        analogIn.recordLengthSet   (record_length)
+
+        if trigger_flag:
+            # Set up trigger for the analog input instrument.
+            # We will trigger on the rising transitions of CH2 (the "cosine" channel) through 0V.
+            analogIn.triggerSourceSet(TRIGSRC.DetectorAnalogIn)
+            analogIn.triggerChannelSet(CH2)
+            analogIn.triggerTypeSet(TRIGTYPE.Edge)
+            analogIn.triggerConditionSet(DwfTriggerSlope.Rise)
+            analogIn.triggerPositionSet(trigger_position)
+            analogIn.triggerLevelSet(trigger_level)
+            analogIn.triggerHysteresisSet(0.010) # Configure a small amount of hysteresis to make sure we only see rising edges.
 
     # Calculate number of samples for each acquisition.
     num_samples = round(sample_frequency * record_length)
@@ -137,63 +145,23 @@ def run_demo(analogIn, sample_frequency, record_length, trigger_flag, signal_fre
 
         print("[{}] Recording {} samples ...".format(acquisition_nr, num_samples))
 
-        # Inner loop: single acquisition, receive data from AnalogIn instrument and display it.
-
-        samples = []
-
-        total_samples_lost = total_samples_corrupted = 0
-
-        analogIn.configure(False, True)  # Start acquisition sequence.
-
-        while True:
-
-            status = analogIn.status(True)
-            (current_samples_available, current_samples_lost, current_samples_corrupted) = analogIn.statusRecord()
-
-            total_samples_lost += current_samples_lost
-            total_samples_corrupted += current_samples_corrupted
-
-            if current_samples_lost != 0:
-                # Append NaN samples as placeholders for lost samples.
-                # This follows the Digilent example. We haven't verified yet that this is the proper way to handle lost samples.
-                lost_samples = np.full((current_samples_lost, 2), np.nan)
-                samples.append(lost_samples)
-
-            if current_samples_available != 0:
-                # Append samples read from both channels.
-                # Note that we read the samples seperately for each channel;
-                # We then put them into the same 2D array with shape (current_samples_available, 2).
-                current_samples = np.vstack([analogIn.statusData(channel_index, current_samples_available) for channel_index in channels]).transpose()
-                samples.append(current_samples)
-
-            if status == DwfState.Done:
-                # We received the last of the record samples.
-                # Note the time, in seconds, of the first valid sample, and break from the acquisition loop.
-                if trigger_flag:
-                    time_of_first_sample = analogIn.triggerPositionStatus()
-                else:
-                    time_of_first_sample = 0.0
-                break
-
-        if total_samples_lost != 0:
-            print("[{}] - WARNING - {} samples were lost! Reduce sample frequency.".format(acquisition_nr, total_samples_lost))
+        # Perform a single acquisition.
+        # The recordCapture() method starts the acquisition, polls the instrument until it is done, and
+        # returns the last 'num_samples' samples, in order. Lost samples are represented by NaN samples.
 
-        if total_samples_corrupted != 0:
-            print("[{}] - WARNING - {} samples could be corrupted! Reduce sample frequency.".format(acquisition_nr, total_samples_corrupted))
+        recording = analogIn.recordCapture(channels)
 
-        # Concatenate all acquired samples. The result is an (n, 2) array of sample values.
-        samples = np.concatenate(samples)
+        if recording.lost != 0:
+            print("[{}] - WARNING - {} samples were lost! Reduce sample frequency.".format(acquisition_nr, recording.lost))
 
-        if len(samples) > num_samples:
-            discard_count = len(samples) - num_samples
-            print("[{}] - NOTE - discarding oldest {} of {} samples ({:.1f}%); keeping {} samples.".format(
-                acquisition_nr,
-                discard_count, len(samples), 100.0 * discard_count /  len(samples), num_samples))
+        if recording.corrupt != 0:
+            print("[{}] - WARNING - {} samples could be corrupted! Reduce sample frequency.".format(acquisition_nr, recording.corrupt))
 
-            samples = samples[discard_count:]
+        # The samples are an (n, 2) array of sample values.
+        samples = recording.samples
 
-        # Calculate sample time of each of the samples.
-        t = time_of_first_sample + np.arange(len(samples)) / sample_frequency
+        # Calculate sample time of each of the samples, relative to the trigger.
+        t = recording.timeAxis()
 
         plt.clf()
         plt.grid()
@@ -237,14 +205,13 @@ def main():
 
     args = parser.parse_args()
 
-    dwf = DigilentWaveformsLibrary()
+    dwf = DigilentWaveformsLibrary.shared()
 
     try:
         # We select the first configuration with the highest available "AnalogInBufferSize" configuration parameter.
         with find_demo_device(dwf, configuration_fitness_func=lambda configuration_parameters: configuration_parameters["AnalogInBufferSize"]) as device:
 
             analogOut = device.analogOut
-            analogIn  = device.analogIn
 
             analog_out_frequency = 5 / args.record_length # We want to see 5 full cycles in the acquisition window.
             analog_out_amplitude = 2.5                    # Signal amplitude in Volt. The AnalogOut instrument can do 5 Vpp, so 2.5 V amplitude is maximum.
@@ -256,7 +223,7 @@ def main():
 
             time.sleep(2.0)  # Wait for a bit to ensure the stability of the analog output signals.
 
-            run_demo(analogIn, args.sample_frequency, args.record_length, args.trigger, analog_out_frequency)
+            run_demo(device, args.sample_frequency, args.record_length, args.trigger, analog_out_frequency)
     except DemoDeviceNotFoundError:
         print("Could not find demo device, exiting.")
 
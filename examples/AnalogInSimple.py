@@ -38,7 +38,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        dwf = DigilentWaveformsLibrary()
+        dwf = DigilentWaveformsLibrary.shared()
         with find_demo_device(dwf, args.serial_number) as device:
             demo_analog_input_instrument_api_simple(device.analogIn)
     except DemoDeviceNotFoundError:
@@ -5,7 +5,7 @@
 import argparse
 import numpy as np
 
-from pydwf import DigilentWaveformsLibrary, AnalogOutNode, FUNC, DwfState, TRIGSRC
+from pydwf import DigilentWaveformsLibrary, AnalogOutNode, FUNC, DwfState, TRIGSRC, PollScheduler
 from demo_utilities import find_demo_device, DemoDeviceNotFoundError
 
 
@@ -104,8 +104,13 @@ def demo_analog_output_instrument_api(analogOut, shape, sample_frequency, refres
 
     analogOut.configure(CH1, True) # Start channels 1 and 2.
 
+    # Rather than polling the channels continuously, poll them when about half of the device buffer has been played.
+    scheduler = PollScheduler.forAnalogOutPlay(analogOut, CH1, AnalogOutNode.Carrier)
+
     while True:
 
+        scheduler.wait()
+
         ch1_status = analogOut.status(CH1)
         ch2_status = analogOut.status(CH2)
 
@@ -114,6 +119,8 @@ def demo_analog_output_instrument_api(analogOut, shape, sample_frequency, refres
         (ch1_data_free, ch1_data_lost, ch1_data_corrupted) = analogOut.nodePlayStatus(CH1, AnalogOutNode.Carrier)
         (ch2_data_free, ch2_data_lost, ch2_data_corrupted) = analogOut.nodePlayStatus(CH2, AnalogOutNode.Carrier)
 
+        scheduler.update(ch1_data_lost + ch2_data_lost, ch1_data_corrupted + ch2_data_corrupted)
+
         if ch1_data_lost != 0 or ch1_data_corrupted != 0 or ch2_data_lost != 0 or ch2_data_corrupted != 0:
             print("ch1 status: {:10} {:10} {:10} ch2 status: {:10} {:10} {:10}".format(
                 ch1_data_free, ch1_data_lost, ch1_data_corrupted,
@@ -155,7 +162,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        dwf = DigilentWaveformsLibrary()
+        dwf = DigilentWaveformsLibrary.shared()
         # Select the device configuration with the largest value for AnalogOutBufferSize.
         with find_demo_device(dwf, configuration_fitness_func=lambda configuration_parameters: configuration_parameters["AnalogOutBufferSize"]) as device:
             demo_analog_output_instrument_api(device.analogOut, args.shape, args.sample_frequency, args.refresh_frequency, args.n_points, args.n_step, args.revolutions_per_sec)
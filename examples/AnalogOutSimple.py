@@ -58,7 +58,7 @@ def demo_fast_analog_out(analogOut):
 
 def main():
 
-    dwf = DigilentWaveformsLibrary()
+    dwf = DigilentWaveformsLibrary.shared()
 
     try:
         with find_demo_device(dwf) as device:
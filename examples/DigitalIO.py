@@ -104,7 +104,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        dwf = DigilentWaveformsLibrary()
+        dwf = DigilentWaveformsLibrary.shared()
         with find_demo_device(dwf, args.serial_number) as device:
             demo_digital_io_api(device.digitalIO)
     except DemoDeviceNotFoundError:
@@ -53,7 +53,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        dwf = DigilentWaveformsLibrary()
+        dwf = DigilentWaveformsLibrary.shared()
         with find_demo_device(dwf, args.serial_number) as device:
             demo_can_protocol_api(device.digitalCan)
     except DemoDeviceNotFoundError:
@@ -98,7 +98,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        dwf = DigilentWaveformsLibrary()
+        dwf = DigilentWaveformsLibrary.shared()
         with find_demo_device(dwf, args.serial_number) as device:
             set_positive_supply_voltage(device.analogIO, 3.3)
             demo_spi_protocol_api(device.digitalSpi)
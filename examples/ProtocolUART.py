@@ -51,7 +51,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        dwf = DigilentWaveformsLibrary()
+        dwf = DigilentWaveformsLibrary.shared()
         with find_demo_device(dwf, args.serial_number) as device:
             demo_uart_protocol_api(device.digitalUart)
     except DemoDeviceNotFoundError:
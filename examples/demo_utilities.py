@@ -1,19 +1,18 @@
-
-from pydwf import DwfEnumConfigInfo
-
 class DemoDeviceNotFoundError(Exception):
     pass
 
 def find_demo_device(dwf, serial_number_specified=None, configuration_fitness_func=None):
 
-    # The dwf.enum.count() function builds a table of connected devices that can be queried using the dwf.enum functions.
-    num_devices = dwf.enum.count()
+    # The dwf.enum.snapshot() function enumerates the connected devices, and gathers their information in a single pass.
+    snapshot = dwf.enum.snapshot()
+
+    num_devices = len(snapshot.devices)
 
     if num_devices == 0:
         print("No Digilent Waveforms devices found.")
         raise DemoDeviceNotFoundError()
 
-    serial_numbers_found = [dwf.enum.serialNumber(device_index) for device_index in range(num_devices)]
+    serial_numbers_found = [record.serial_number for record in snapshot.devices]
 
     if serial_number_specified is None:
         # A serial number was not specified.
@@ -44,21 +43,10 @@ def find_demo_device(dwf, serial_number_specified=None, configuration_fitness_fu
         return dwf.device.open(device_index)
 
     # User specified a 'configuration_fitness_func'.
-    # We will examine all configuration and pick the one that has the highest fitness.
-
-    num_config = dwf.enum.configCount(device_index)
-
-    best_configuration_index   = None
-    best_configuration_fitness = None
-
-    for configuration_index in range(num_config):
-
-        configuration_info = {configuration_parameter.name : dwf.enum.configInfo(configuration_index, configuration_parameter) for configuration_parameter in DwfEnumConfigInfo}
+    # We will pick the configuration that has the highest fitness.
 
-        configuration_fitness = configuration_fitness_func(configuration_info)
+    record = snapshot.devices[device_index]
 
-        if best_configuration_index is None or configuration_fitness > best_configuration_fitness:
-            best_configuration_index = configuration_index
-            best_configuration_fitness = configuration_fitness
+    best_configuration_index = record.bestConfiguration(lambda configuration: configuration_fitness_func(configuration._asdict()))
 
     return dwf.device.open(device_index, best_configuration_index)
@@ -0,0 +1,57 @@
+#! /usr/bin/env python3
+
+"""Benchmark the per-call overhead of the pydwf wrapper methods, using a stub DWF library.
+
+The stub library functions return immediately, so the measured times are the overhead of the Python wrapper
+and of ctypes. The 'device path' lines show the cost of reaching a library function via the device and library
+objects, as all wrapper methods used to do; the 'function table' lines show the cost of calling it through the
+function table of the instrument sub-API, as the wrapper methods do now.
+"""
+
+import timeit
+import ctypes
+
+from stub_dwf_library import rerun_with_stub_library
+
+
+def report(description: str, stmt: str, namespace: dict, number: int=200000) -> None:
+    timer = timeit.Timer(stmt, globals=namespace)
+    seconds = min(timer.repeat(repeat=5, number=number)) / number
+    print("{:60} {:8.1f} ns".format(description, seconds * 1e9))
+
+
+def benchmark_function_dispatch():
+
+    from pydwf import DigilentWaveformsLibrary
+
+    dwf = DigilentWaveformsLibrary()
+
+    with dwf.device.open(-1) as device:
+
+        namespace = {
+            "analogIn"  : device.analogIn,
+            "digitalIO" : device.digitalIO,
+            "c_double"  : ctypes.c_double(),
+            "c_uint"    : ctypes.c_uint()
+        }
+
+        print("Per-call overhead of the pydwf wrapper (stub library)")
+        print("=====================================================")
+        print()
+
+        report("FDwfAnalogInStatusSample via device path", "analogIn._device._dwf._lib.FDwfAnalogInStatusSample(analogIn._device._hdwf, 0, c_double)", namespace)
+        report("FDwfAnalogInStatusSample via function table", "analogIn._functions.FDwfAnalogInStatusSample(analogIn._hdwf, 0, c_double)", namespace)
+        report("analogIn.statusSample(0)", "analogIn.statusSample(0)", namespace)
+        print()
+        report("FDwfDigitalIOInputStatus via device path", "digitalIO._device._dwf._lib.FDwfDigitalIOInputStatus(digitalIO._device._hdwf, c_uint)", namespace)
+        report("FDwfDigitalIOInputStatus via function table", "digitalIO._functions.FDwfDigitalIOInputStatus(digitalIO._hdwf, c_uint)", namespace)
+        report("digitalIO.inputStatus()", "digitalIO.inputStatus()", namespace)
+        print()
+
+
+def main():
+    rerun_with_stub_library()
+    benchmark_function_dispatch()
+
+if __name__ == "__main__":
+    main()
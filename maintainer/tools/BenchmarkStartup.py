@@ -0,0 +1,67 @@
+#! /usr/bin/env python3
+
+"""Benchmark the startup time of pydwf, using a stub DWF library.
+
+This measures the wall-clock time of short-lived processes (importing pydwf, and running 'python -m pydwf version'),
+and, in-process, the time to instantiate a DigilentWaveformsLibrary. For reference, it also measures the time it takes
+to type-annotate all library functions, which DigilentWaveformsLibrary instantiation used to do up front.
+"""
+
+import sys
+import time
+import subprocess
+
+from stub_dwf_library import rerun_with_stub_library
+
+
+def report(description: str, seconds: float) -> None:
+    print("{:60} {:8.2f} ms".format(description, seconds * 1e3))
+
+
+def process_time(args, repeat: int=10) -> float:
+    """Return the shortest wall-clock time of running a Python process with the given arguments."""
+    durations = []
+    for i in range(repeat):
+        t1 = time.perf_counter()
+        subprocess.run([sys.executable] + args, check=True, stdout=subprocess.DEVNULL)
+        t2 = time.perf_counter()
+        durations.append(t2 - t1)
+    return min(durations)
+
+
+def benchmark_startup():
+
+    print("Startup time of pydwf (stub library)")
+    print("====================================")
+    print()
+
+    report("python -c pass", process_time(["-c", "pass"]))
+    report("python -c 'import numpy'", process_time(["-c", "import numpy"]))
+    report("python -c 'import pydwf'", process_time(["-c", "import pydwf"]))
+    report("python -m pydwf version", process_time(["-m", "pydwf", "version"]))
+    print()
+
+    import pydwf
+    from pydwf import DigilentWaveformsLibrary
+
+    t1 = time.perf_counter()
+    dwf = DigilentWaveformsLibrary()
+    t2 = time.perf_counter()
+    dwf.getVersion()
+    t3 = time.perf_counter()
+    for name in pydwf._dwf_function_prototypes():
+        getattr(dwf._lib, name)
+    t4 = time.perf_counter()
+
+    report("DigilentWaveformsLibrary() (first instance)", t2 - t1)
+    report("getVersion() (first call)", t3 - t2)
+    report("annotate all remaining library functions", t4 - t3)
+    print()
+
+
+def main():
+    rerun_with_stub_library()
+    benchmark_startup()
+
+if __name__ == "__main__":
+    main()
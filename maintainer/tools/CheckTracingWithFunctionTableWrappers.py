@@ -0,0 +1,69 @@
+#! /usr/bin/env python3
+
+"""Check, on the simulated library, that tracing sees the calls made through function table wrappers.
+
+The settings cache and configuration transactions wrap the function table of an instrument sub-API. The calls made
+through these wrappers must be recorded in a trace that is started while the wrappers are installed, and must no
+longer be recorded once tracing is disabled. The same holds after a wrapper is removed again.
+"""
+
+import sys
+
+from pydwf import DigilentWaveformsLibrary
+
+
+def calls(trace, name: str) -> int:
+    return trace.summary().get(name, {}).get("calls", 0)
+
+
+def check_tracing_with_function_table_wrappers() -> bool:
+
+    dwf = DigilentWaveformsLibrary(simulated=True)
+
+    failures = []
+
+    def check(description: str, condition: bool) -> None:
+        print("{:70} {}".format(description, "ok" if condition else "FAILED"))
+        if not condition:
+            failures.append(description)
+
+    with dwf.device.open(-1) as device:
+
+        analogIn = device.analogIn
+        analogIn.settings_cache.enabled = True
+
+        # Resolve the functions in the wrappers before tracing is enabled.
+        analogIn.frequencySet(1e6)
+        analogIn.statusSample(0)
+
+        with device.configTransaction():
+            trace = dwf.enableTracing()
+            analogIn.frequencySet(2e6)
+            analogIn.statusSample(0)
+
+        check("Set call through settings cache and transaction is traced", calls(trace, "FDwfAnalogInFrequencySet") == 1)
+        check("Status call through settings cache and transaction is traced", calls(trace, "FDwfAnalogInStatusSample") == 1)
+
+        dwf.disableTracing()
+        analogIn.frequencySet(3e6)
+        analogIn.statusSample(0)
+
+        check("Set call is not traced after tracing is disabled", calls(trace, "FDwfAnalogInFrequencySet") == 1)
+        check("Status call is not traced after tracing is disabled", calls(trace, "FDwfAnalogInStatusSample") == 1)
+
+        trace = dwf.enableTracing()
+        analogIn.settings_cache.enabled = False
+        analogIn.frequencySet(4e6)
+        dwf.disableTracing()
+
+        check("Set call is traced after the settings cache is removed", calls(trace, "FDwfAnalogInFrequencySet") == 1)
+
+    return len(failures) == 0
+
+
+def main():
+    if not check_tracing_with_function_table_wrappers():
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
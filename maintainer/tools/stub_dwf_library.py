@@ -0,0 +1,96 @@
+#! /usr/bin/env python3
+
+"""Build a stub 'libdwf.so' shared library, for benchmarking the Python wrapper without hardware or the real library.
+
+The stub exports all functions known to pydwf. All of them return success without doing anything, except for:
+
+- FDwfGetVersion, which returns the version expected by pydwf;
+- FDwfEnum, which reports a single device;
+- FDwfEnumDeviceType, which reports an Analog Discovery 2 (revision 2);
+- FDwfEnumSN, which reports serial number 'SN:0123456789AB';
+- FDwfDeviceOpen and FDwfDeviceConfigOpen, which return a valid device handle.
+
+Building the stub requires a C compiler ('cc', or the compiler given by the CC environment variable).
+This only works on Linux.
+"""
+
+import os
+import sys
+import tempfile
+import subprocess
+
+from pydwf.dwf_function_signatures import dwf_function_signatures, dwf_version
+
+_SPECIAL_FUNCTIONS = {
+    "FDwfGetVersion"       : "int FDwfGetVersion(char * szVersion) { strcpy(szVersion, \"{VERSION}\"); return 1; }",
+    "FDwfEnum"             : "int FDwfEnum(int enumfilter, int * pcDevice) { *pcDevice = 1; return 1; }",
+    "FDwfEnumDeviceType"   : "int FDwfEnumDeviceType(int idxDevice, int * pDeviceId, int * pDeviceRevision) { *pDeviceId = 3; *pDeviceRevision = 2; return 1; }",
+    "FDwfEnumSN"           : "int FDwfEnumSN(int idxDevice, char * szSN) { strcpy(szSN, \"SN:0123456789AB\"); return 1; }",
+    "FDwfDeviceOpen"       : "int FDwfDeviceOpen(int idxDevice, int * phdwf) { *phdwf = 1; return 1; }",
+    "FDwfDeviceConfigOpen" : "int FDwfDeviceConfigOpen(int idxDev, int idxCfg, int * phdwf) { *phdwf = 1; return 1; }"
+}
+
+
+def stub_library_source() -> str:
+    """Return the C source code of the stub library."""
+
+    class typespec_null:
+        def __getattr__(self, name):
+            return None
+
+    lines = ["#include <string.h>", ""]
+
+    for (name, restype, argtypes, obsolete_flag) in dwf_function_signatures(typespec_null()):
+        if name in _SPECIAL_FUNCTIONS:
+            lines.append(_SPECIAL_FUNCTIONS[name].replace("{VERSION}", dwf_version))
+        else:
+            # The calling convention allows a function to ignore its arguments.
+            lines.append("int {}() {{ return 1; }}".format(name))
+
+    return "\n".join(lines) + "\n"
+
+
+def build_stub_library(directory: str) -> str:
+    """Build the stub library as 'libdwf.so' in the given directory, and return its filename."""
+    source_filename = os.path.join(directory, "stub_dwf.c")
+    library_filename = os.path.join(directory, "libdwf.so")
+
+    with open(source_filename, "w") as fo:
+        fo.write(stub_library_source())
+
+    compiler = os.environ.get("CC", "cc")
+    subprocess.run([compiler, "-O2", "-shared", "-fPIC", "-o", library_filename, source_filename], check=True)
+
+    return library_filename
+
+
+def rerun_with_stub_library() -> None:
+    """Re-execute the current script with a freshly built stub library in the library search path.
+
+    The dynamic linker reads LD_LIBRARY_PATH only at process startup, so the script must be restarted to make
+    pydwf pick up the stub library. In the restarted script, this function returns immediately.
+    """
+    if "PYDWF_STUB_LIBRARY_DIR" in os.environ:
+        return
+
+    if not sys.platform.startswith("linux"):
+        raise RuntimeError("The stub library is only supported on Linux.")
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        build_stub_library(directory)
+
+        env = dict(os.environ)
+        env["PYDWF_STUB_LIBRARY_DIR"] = directory
+        env["LD_LIBRARY_PATH"] = os.pathsep.join(filter(None, [directory, env.get("LD_LIBRARY_PATH")]))
+
+        completed = subprocess.run([sys.executable] + sys.argv, env=env)
+
+    sys.exit(completed.returncode)
+
+
+def main():
+    sys.stdout.write(stub_library_source())
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,18 @@ This module is based on the C header file "dwf.h", version 3.16.3, as extracted
 size = 48191 bytes; md5sum = c77ad106f85cbad3aef5d61872351754.
 """
 
+import os
 import sys
+import time
+import functools
+import threading
+import weakref
+import contextlib
+import json
 import ctypes
 import enum
 import numpy as np
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Sequence, Iterator, Callable, NamedTuple, Union
 
 from .dwf_function_signatures import dwf_function_signatures, dwf_version as expected_dwf_version
 
@@ -390,6 +397,10 @@ class DigilentWaveformsLibraryError(PyDwfError):
         self.code = code
         self.msg = msg
 
+    def __reduce__(self):
+        # Needed to pickle the exception (e.g., to pass it from a device broker to a client), since __init__ takes arguments.
+        return (DigilentWaveformsLibraryError, (self.code, self.msg))
+
     def __str__(self) -> str:
         if self.code is None:
             error_string = "DWF Error (unspecified)"
@@ -402,6 +413,1090 @@ class DigilentWaveformsLibraryError(PyDwfError):
         return error_string
 
 
+def _prepare_output_array(out: Optional[np.ndarray], count: int, dtype) -> np.ndarray:
+    """Return a 1D array that can receive 'count' samples of the given dtype from a DWF library function.
+
+    If 'out' is None, a fresh array is allocated. Otherwise, 'out' is checked for suitability and returned as-is.
+    A suitable array has the exact dtype and shape, is C-contiguous, and is writeable; a contiguous slice of a
+    larger array qualifies.
+
+    Raises:
+        PyDwfError: the 'out' array is not suitable.
+    """
+    if out is None:
+        return np.empty(count, dtype=dtype)
+    if not isinstance(out, np.ndarray):
+        raise PyDwfError("Output buffer must be a numpy array, got {!r}.".format(type(out).__name__))
+    if out.dtype != dtype:
+        raise PyDwfError("Output buffer has dtype {}, expected {}.".format(out.dtype, np.dtype(dtype)))
+    if out.shape != (count,):
+        raise PyDwfError("Output buffer has shape {}, expected ({},).".format(out.shape, count))
+    if not out.flags.c_contiguous:
+        raise PyDwfError("Output buffer must be contiguous.")
+    if not out.flags.writeable:
+        raise PyDwfError("Output buffer must be writeable.")
+    return out
+
+
+def _prepare_output_bytes(out: Optional[np.ndarray], count_bytes: int) -> np.ndarray:
+    """Return an array that can receive 'count_bytes' bytes of raw sample data from a DWF library function.
+
+    If 'out' is None, a fresh array of bytes is allocated. Otherwise, 'out' may be a 1D array of any unsigned integer
+    dtype (e.g., np.uint16 for 16-bit digital samples), as long as it is contiguous, writeable, and exactly
+    'count_bytes' bytes in size.
+
+    Raises:
+        PyDwfError: the 'out' array is not suitable.
+    """
+    if out is None:
+        return np.empty(count_bytes, dtype='B')
+    if not isinstance(out, np.ndarray):
+        raise PyDwfError("Output buffer must be a numpy array, got {!r}.".format(type(out).__name__))
+    if out.dtype.kind != 'u':
+        raise PyDwfError("Output buffer has dtype {}, expected an unsigned integer dtype.".format(out.dtype))
+    if out.ndim != 1 or out.nbytes != count_bytes:
+        raise PyDwfError("Output buffer must be a 1D array of exactly {} bytes.".format(count_bytes))
+    if not out.flags.c_contiguous:
+        raise PyDwfError("Output buffer must be contiguous.")
+    if not out.flags.writeable:
+        raise PyDwfError("Output buffer must be writeable.")
+    return out
+
+
+class RecordChunk(NamedTuple):
+    """A chunk of samples delivered by a record-mode acquisition stream.
+
+    Samples that were lost by the device are represented by placeholder samples in the chunk, so that the running
+    sample 'index' always corresponds to the time elapsed since the start of the acquisition.
+    """
+    index: int           # Running index of the first sample in the chunk, counting lost samples.
+    samples: np.ndarray  # The sample data.
+    lost: int            # Number of lost samples reported by the device while this chunk was being collected.
+    corrupt: int         # Number of possibly corrupt samples reported by the device while this chunk was being collected.
+
+
+class AnalogInRecording(NamedTuple):
+    """The result of a record-mode acquisition of a fixed length, as returned by AnalogInAPI.recordCapture()."""
+    samples: np.ndarray          # The samples, as a (count, channels) array, oldest sample first.
+    sample_frequency: float      # The sample frequency, in samples per second.
+    time_of_first_sample: float  # Time of the first sample relative to the trigger, in seconds.
+    lost: int                    # Total number of lost samples reported during the acquisition.
+    corrupt: int                 # Total number of possibly corrupt samples reported during the acquisition.
+
+    def timeAxis(self) -> np.ndarray:
+        """Return the time of each sample relative to the trigger, in seconds."""
+        return self.time_of_first_sample + np.arange(len(self.samples)) / self.sample_frequency
+
+
+class AnalogInRawSamples:
+    """Raw AnalogIn samples, stored as 16-bit integers, with the scale and offset needed to convert them to Volts.
+
+    Instances are returned by AnalogInAPI.statusDataRaw() and AnalogInAPI.recordCaptureRaw(). Storing the raw samples
+    takes 2 bytes per sample, rather than 8 bytes per sample for Volts as 64-bit floats.
+
+    The 'raw' array has shape (count, channels). The voltage of a sample is raw * scale + offset, where 'scale' and
+    'offset' are per-channel arrays obtained from the channel range and offset settings at the time of acquisition.
+
+    The conversion to Volts is done on request only: by indexing (e.g., samples[1000:2000, 0]), by the volts() and
+    astype() methods, or when the object is passed to a numpy function. Large conversions are done in blocks, to
+    limit the size of temporary arrays.
+
+    Samples that were lost during a record-mode acquisition have no raw value. They are marked in the 'lost' array,
+    a (count, ) boolean array that is None if no samples were lost, and convert to NaN, as in a recording of Volts.
+    """
+
+    _CONVERSION_BLOCK_SIZE = 65536  # Number of samples per channel converted at a time.
+
+    def __init__(self, raw: np.ndarray, scale: np.ndarray, offset: np.ndarray, lost: Optional[np.ndarray]=None) -> None:
+        """Initialize an AnalogInRawSamples instance.
+
+        Args:
+            raw: The raw samples, as a (count, channels) int16 array.
+            scale: The per-channel scale factors, in Volts per raw unit.
+            offset: The per-channel offsets, in Volts.
+            lost: An optional (count, ) boolean array that is True for the samples that were lost.
+        """
+        self.raw = raw
+        self.scale = scale
+        self.offset = offset
+        self.lost = lost
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __repr__(self) -> str:
+        return "AnalogInRawSamples(shape={})".format(self.raw.shape)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """The shape of the samples."""
+        return self.raw.shape
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes occupied by the raw samples."""
+        return self.raw.nbytes
+
+    def __getitem__(self, key) -> np.ndarray:
+        """Return the indexed samples, in Volts.
+
+        The first index selects samples, the second index (if present) selects channels.
+        """
+        if not isinstance(key, tuple):
+            key = (key, )
+        if len(key) > 2:
+            raise IndexError("too many indices for AnalogInRawSamples")
+        channel_key = key[1] if len(key) == 2 else slice(None)
+        volts = self.raw[key] * self.scale[channel_key] + self.offset[channel_key]
+        if self.lost is not None:
+            # Broadcast the lost flags of the selected samples over the selected channels.
+            lost = self.lost[key[0]]
+            volts = np.where(np.reshape(lost, np.shape(lost) + (1, ) * (volts.ndim - np.ndim(lost))), np.nan, volts)[()]
+        return volts
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return self.volts(np.float64 if dtype is None else dtype)
+
+    def volts(self, dtype=np.float64, out: Optional[np.ndarray]=None) -> np.ndarray:
+        """Convert the samples to Volts.
+
+        Args:
+            dtype: The floating point type of the result, e.g. np.float64 or np.float32.
+            out: An optional preallocated destination array, with the same shape as the raw samples.
+
+        Returns:
+            The samples in Volts.
+        """
+        if out is None:
+            out = np.empty(self.raw.shape, dtype=dtype)
+        elif out.shape != self.raw.shape:
+            raise PyDwfError("Output buffer has shape {}, expected {}.".format(out.shape, self.raw.shape))
+
+        scale = self.scale.astype(out.dtype)
+        offset = self.offset.astype(out.dtype)
+
+        for start in range(0, len(self.raw), self._CONVERSION_BLOCK_SIZE):
+            block = out[start:start + self._CONVERSION_BLOCK_SIZE]
+            np.multiply(self.raw[start:start + self._CONVERSION_BLOCK_SIZE], scale, out=block)
+            block += offset
+
+        if self.lost is not None:
+            out[self.lost] = np.nan
+
+        return out
+
+    def astype(self, dtype) -> np.ndarray:
+        """Convert the samples to Volts, as an array of the given floating point type."""
+        return self.volts(dtype)
+
+    def blocks(self, block_size: Optional[int]=None, dtype=np.float64) -> Iterator[np.ndarray]:
+        """Yield the samples in Volts, in consecutive blocks of at most 'block_size' samples.
+
+        A single block array is reused for all blocks, so the caller should copy a block if it needs to keep it.
+        """
+        if block_size is None:
+            block_size = self._CONVERSION_BLOCK_SIZE
+        buffer = np.empty((min(block_size, len(self.raw)), ) + self.raw.shape[1:], dtype=dtype)
+        scale = self.scale.astype(dtype)
+        offset = self.offset.astype(dtype)
+        for start in range(0, len(self.raw), block_size):
+            raw = self.raw[start:start + block_size]
+            block = buffer[:len(raw)]
+            np.multiply(raw, scale, out=block)
+            block += offset
+            if self.lost is not None:
+                block[self.lost[start:start + block_size]] = np.nan
+            yield block
+
+
+def _record_chunks(polls: Iterator[Tuple[int, int, int, bool]], allocate, read, fill_value, chunk_hint: Optional[int]) -> Iterator[RecordChunk]:
+    """Turn the polls of a record-mode acquisition into a stream of RecordChunk tuples.
+
+    This is the common implementation of the AnalogIn and DigitalIn recordStream() methods.
+
+    Args:
+        polls: The (available, lost, corrupt, done) tuples of the acquisition, as produced by the instrument's _record_polls() method.
+               None items (see _paced_polls()) are passed through as None chunks.
+        allocate: Function that allocates a sample array for the given number of samples.
+        read: Function that reads 'count' available samples, starting at 'offset', into the given sample array.
+        fill_value: The placeholder value used for lost samples.
+        chunk_hint: The number of samples per chunk, or None to yield the samples as they become available.
+    """
+    index = 0  # Running sample index of the first sample in the current chunk.
+
+    if chunk_hint is None:
+        for poll in polls:
+            if poll is None:
+                yield None
+                continue
+            (available, lost, corrupt, done) = poll
+            if available != 0 or lost != 0:
+                samples = allocate(lost + available)
+                samples[:lost] = fill_value
+                read(0, available, samples[lost:])
+                yield RecordChunk(index, samples, lost, corrupt)
+                index += lost + available
+            elif corrupt != 0:
+                yield RecordChunk(index, allocate(0), 0, corrupt)
+        return
+
+    chunk = allocate(chunk_hint)
+    position = 0  # Number of samples in the current chunk.
+    chunk_lost = chunk_corrupt = 0
+
+    for poll in polls:
+
+        if poll is None:
+            yield None
+            continue
+
+        (available, lost, corrupt, done) = poll
+        chunk_corrupt += corrupt
+
+        # Insert placeholders for the lost samples, and read the available samples; both may span several chunks.
+        for (count, is_lost) in ((lost, True), (available, False)):
+            offset = 0
+            while offset != count:
+                n = min(count - offset, chunk_hint - position)
+                if is_lost:
+                    chunk[position:position + n] = fill_value
+                    chunk_lost += n
+                else:
+                    read(offset, n, chunk[position:position + n])
+                position += n
+                offset += n
+                if position == chunk_hint:
+                    yield RecordChunk(index, chunk, chunk_lost, chunk_corrupt)
+                    index += chunk_hint
+                    chunk = allocate(chunk_hint)
+                    position = chunk_lost = chunk_corrupt = 0
+
+    if position != 0 or chunk_lost != 0 or chunk_corrupt != 0:
+        yield RecordChunk(index, chunk[:position], chunk_lost, chunk_corrupt)
+
+
+def _paced_polls(polls: Iterator[Tuple[int, int, int, bool]]) -> Iterator[Optional[Tuple[int, int, int, bool]]]:
+    """Yield None before each poll of a record-mode acquisition, and then the poll.
+
+    Passed through _record_chunks(), the None items return control to the consumer of the stream before each poll,
+    e.g. to let an asynchronous consumer wait for the poll on its event loop, rather than on the thread that polls.
+    """
+    while True:
+        yield None
+        poll = next(polls, None)
+        if poll is None:
+            return
+        yield poll
+
+
+def _rotate_rows_left(a: np.ndarray, shift: int) -> None:
+    """Rotate each row of the C-contiguous 2D array 'a' left by 'shift' elements, in place.
+
+    A temporary buffer of at most half a row is used; the rest of the data is moved inside the row using memmove.
+    """
+    (num_rows, n) = a.shape
+    shift %= n
+    if shift == 0:
+        return
+    itemsize = a.itemsize
+    m = n - shift
+    tmp = np.empty(min(shift, m), dtype=a.dtype)
+    for row in a:
+        address = row.ctypes.data
+        if shift <= m:
+            tmp[:] = row[:shift]
+            ctypes.memmove(address, address + shift * itemsize, m * itemsize)
+            row[m:] = tmp
+        else:
+            tmp[:] = row[shift:]
+            ctypes.memmove(address + m * itemsize, address, shift * itemsize)
+            row[:m] = tmp
+
+
+class AcquisitionStatistics:
+    """Health statistics of the record-mode acquisitions of an AnalogIn or DigitalIn instrument.
+
+    Each AnalogIn and DigitalIn instrument has an instance of this class as its 'statistics' attribute.
+    Collection is disabled by default; it is enabled by setting the 'enabled' attribute to True, which takes
+    effect from the next acquisition on. The statistics accumulate over acquisitions until reset() is called.
+
+    Histograms are kept as lists of counts over power-of-two bins: bin k counts the values v for which
+    2**(k-1) <= v < 2**k, i.e., the values with bit length k. Durations are binned in microseconds. The lost and corrupt
+    sample counts are binned per poll, so bin 0 counts the polls that reported none.
+    """
+
+    _NUM_BINS = 40
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the statistics."""
+        self.polls = 0                  # Number of status polls.
+        self.samples_available = 0      # Total number of samples reported available.
+        self.samples_lost = 0           # Total number of samples reported lost.
+        self.samples_corrupt = 0        # Total number of samples reported corrupt.
+        self.polls_with_loss = 0        # Number of polls that reported lost or corrupt samples.
+        self.status_time = 0.0          # Total duration of the status calls, in seconds.
+        self.status_time_max = 0.0      # Longest status call, in seconds.
+        self.reads = 0                  # Number of statusData calls.
+        self.read_time = 0.0            # Total duration of the statusData calls, in seconds.
+        self.read_time_max = 0.0        # Longest statusData call, in seconds.
+        self.first_poll_time = None     # The time.perf_counter() value of the first poll.
+        self.last_poll_time = None      # The time.perf_counter() value of the last poll.
+        self.status_time_histogram = [0] * self._NUM_BINS
+        self.read_time_histogram = [0] * self._NUM_BINS
+        self.available_histogram = [0] * self._NUM_BINS
+        self.lost_histogram = [0] * self._NUM_BINS
+        self.corrupt_histogram = [0] * self._NUM_BINS
+
+    def recordPoll(self, duration: float, available: int, lost: int, corrupt: int) -> None:
+        """Add a status poll, taking 'duration' seconds, that reported the given sample counts."""
+        now = time.perf_counter()
+        if self.first_poll_time is None:
+            self.first_poll_time = now
+        self.last_poll_time = now
+        self.polls += 1
+        self.samples_available += available
+        self.available_histogram[min(available.bit_length(), self._NUM_BINS - 1)] += 1
+        self.lost_histogram[min(lost.bit_length(), self._NUM_BINS - 1)] += 1
+        self.corrupt_histogram[min(corrupt.bit_length(), self._NUM_BINS - 1)] += 1
+        if lost != 0 or corrupt != 0:
+            self.samples_lost += lost
+            self.samples_corrupt += corrupt
+            self.polls_with_loss += 1
+        self.status_time += duration
+        if duration > self.status_time_max:
+            self.status_time_max = duration
+        self.status_time_histogram[min(int(duration * 1e6).bit_length(), self._NUM_BINS - 1)] += 1
+
+    def recordRead(self, duration: float) -> None:
+        """Add a statusData call, taking 'duration' seconds."""
+        self.reads += 1
+        self.read_time += duration
+        if duration > self.read_time_max:
+            self.read_time_max = duration
+        self.read_time_histogram[min(int(duration * 1e6).bit_length(), self._NUM_BINS - 1)] += 1
+
+    def lostFraction(self) -> float:
+        """Return the fraction of samples that were lost."""
+        total = self.samples_available + self.samples_lost
+        return self.samples_lost / total if total != 0 else 0.0
+
+    def corruptFraction(self) -> float:
+        """Return the fraction of samples that were reported corrupt."""
+        total = self.samples_available + self.samples_lost
+        return self.samples_corrupt / total if total != 0 else 0.0
+
+    def throughput(self) -> float:
+        """Return the effective throughput between the first and the last poll, in samples per second."""
+        if self.first_poll_time is None or self.last_poll_time == self.first_poll_time:
+            return 0.0
+        return self.samples_available / (self.last_poll_time - self.first_poll_time)
+
+    def summary(self) -> dict:
+        """Return the statistics as a dictionary, e.g. for logging."""
+        return {
+            "polls": self.polls,
+            "samples_available": self.samples_available,
+            "samples_lost": self.samples_lost,
+            "samples_corrupt": self.samples_corrupt,
+            "polls_with_loss": self.polls_with_loss,
+            "lost_fraction": self.lostFraction(),
+            "corrupt_fraction": self.corruptFraction(),
+            "throughput": self.throughput(),
+            "status_time_mean": self.status_time / self.polls if self.polls != 0 else 0.0,
+            "status_time_max": self.status_time_max,
+            "read_time_mean": self.read_time / self.reads if self.reads != 0 else 0.0,
+            "read_time_max": self.read_time_max,
+            "status_time_histogram": list(self.status_time_histogram),
+            "read_time_histogram": list(self.read_time_histogram),
+            "available_histogram": list(self.available_histogram),
+            "lost_histogram": list(self.lost_histogram),
+            "corrupt_histogram": list(self.corrupt_histogram)
+        }
+
+
+class PollScheduler:
+    """Schedule the polls of a streaming acquisition (AnalogIn or DigitalIn record mode) or playback (AnalogOut play mode).
+
+    Polling the instrument continuously wastes a CPU core, while polling it too slowly lets the device buffer
+    overflow (or, for playback, run empty). The scheduler derives the time between polls from the sample frequency and
+    the size of the device buffer, aiming to let a given fraction of the buffer fill up (or drain) between polls.
+    The interval is measured from the start of one poll to the start of the next, so the time spent polling is part of it.
+
+    When lost or corrupt samples are reported, the fill fraction is halved (down to a minimum); otherwise, it slowly
+    recovers towards the target fill fraction.
+
+    A poll loop calls wait() before polling the instrument, and update() with the lost and corrupt counts reported by the poll.
+    """
+
+    def __init__(self, sample_frequency: float, buffer_size: int, fill_fraction: float=0.5, min_fill_fraction: float=0.05, recovery_rate: float=0.05) -> None:
+        """Initialize a PollScheduler.
+
+        Args:
+            sample_frequency: The sample frequency, in samples per second.
+            buffer_size: The size of the device buffer, in samples.
+            fill_fraction: The target fraction of the device buffer that fills up between polls.
+            min_fill_fraction: The lowest fill fraction that the scheduler falls back to when samples are lost.
+            recovery_rate: The fraction of the distance to the target fill fraction that is recovered with each poll
+                without lost or corrupt samples.
+        """
+        if sample_frequency <= 0.0 or buffer_size <= 0:
+            raise PyDwfError("Bad sample frequency ({!r}) or buffer size ({!r}).".format(sample_frequency, buffer_size))
+        if not 0.0 < min_fill_fraction <= fill_fraction <= 1.0:
+            raise PyDwfError("Bad fill fraction ({!r}) or minimum fill fraction ({!r}).".format(fill_fraction, min_fill_fraction))
+
+        self.sample_frequency = sample_frequency
+        self.buffer_size = buffer_size
+        self.target_fill_fraction = fill_fraction
+        self.min_fill_fraction = min_fill_fraction
+        self.recovery_rate = recovery_rate
+        self.fill_fraction = fill_fraction
+        self._poll_start = None
+
+    @classmethod
+    def forAnalogIn(cls, analogIn, fill_fraction: float=0.5) -> 'PollScheduler':
+        """Make a scheduler for the current sample frequency and buffer size of an AnalogIn instrument."""
+        return cls(analogIn.frequencyGet(), analogIn.bufferSizeGet(), fill_fraction)
+
+    @classmethod
+    def forDigitalIn(cls, digitalIn, fill_fraction: float=0.5) -> 'PollScheduler':
+        """Make a scheduler for the current sample frequency and buffer size of a DigitalIn instrument."""
+        sample_frequency = digitalIn.internalClockInfo() / digitalIn.dividerGet()
+        return cls(sample_frequency, digitalIn.bufferSizeGet(), fill_fraction)
+
+    @classmethod
+    def forAnalogOutPlay(cls, analogOut, channel_index: int, node: AnalogOutNode=AnalogOutNode.Carrier, fill_fraction: float=0.5) -> 'PollScheduler':
+        """Make a scheduler for an AnalogOut channel node in play mode.
+
+        For playback, the fill fraction is the fraction of the buffer that drains between polls.
+        The buffer size is the maximum number of samples reported by nodeDataInfo().
+        """
+        (dummy, buffer_size) = analogOut.nodeDataInfo(channel_index, node)
+        return cls(analogOut.nodeFrequencyGet(channel_index, node), buffer_size, fill_fraction)
+
+    def pollInterval(self) -> float:
+        """Return the time between the starts of consecutive polls, in seconds."""
+        return self.fill_fraction * self.buffer_size / self.sample_frequency
+
+    def delay(self) -> float:
+        """Return the time until the next poll is due, in seconds, or zero if it is due."""
+        if self._poll_start is None:
+            return 0.0
+        return max(0.0, self._poll_start + self.pollInterval() - time.perf_counter())
+
+    def wait(self) -> None:
+        """Sleep until the next poll is due, and mark the start of that poll."""
+        delay = self.delay()
+        if delay > 0.0:
+            time.sleep(delay)
+        self._poll_start = time.perf_counter()
+
+    def update(self, lost: int, corrupt: int) -> None:
+        """Update the schedule with the outcome of the poll that was started by the last call to wait()."""
+        if lost != 0 or corrupt != 0:
+            self.fill_fraction = max(self.min_fill_fraction, 0.5 * self.fill_fraction)
+        else:
+            self.fill_fraction += self.recovery_rate * (self.target_fill_fraction - self.fill_fraction)
+
+
+@functools.lru_cache(maxsize=None)
+def _dwf_function_prototypes() -> dict:
+    """Return a dictionary that maps the name of each known DWF library function to its (restype, argtypes) ctypes prototype."""
+    return {name: (restype, [argtype for (argname, argtype) in argtypes])
+            for (name, restype, argtypes, obsolete_flag) in dwf_function_signatures(_typespec_ctypes)}
+
+
+@functools.lru_cache(maxsize=None)
+def _dwf_buffer_transfers() -> dict:
+    """Return a dictionary that maps the name of each DWF library function that transfers a data buffer to a list of
+    (count_index, bits_per_element, bits_index) tuples, one per buffer argument.
+
+    The number of bytes transferred for a buffer is args[count_index] * bits / 8, where bits is either
+    bits_per_element, or, if bits_index is not None, args[bits_index].
+    """
+    transfers = {}
+    for (name, restype, argtypes, obsolete_flag) in dwf_function_signatures(_typespec_ctypes):
+        argnames = [argname for (argname, argtype) in argtypes]
+        terms = []
+        for (index, (argname, argtype)) in enumerate(argtypes):
+            if not argname.startswith(("rg", "sz")):
+                continue
+            if isinstance(argtype, type) and issubclass(argtype, ctypes._Pointer):  # pylint: disable=protected-access
+                bits_per_element = 8 * ctypes.sizeof(argtype._type_)
+            elif argtype in (ctypes.c_void_p, ctypes.c_char_p):
+                bits_per_element = 8
+            else:
+                continue  # Fixed-size string buffers are not data transfers.
+            # The element count is the first count argument following the buffer, or else the one preceding it.
+            count_candidates = [i for i in range(index + 1, len(argnames)) if argnames[i].startswith("c")]
+            count_candidates += [i for i in range(index - 1, 0, -1) if argnames[i].startswith("c")]
+            if not count_candidates:
+                continue
+            count_index = count_candidates[0]
+            bits_index = None
+            if argnames[count_index] == "countOfBits":
+                bits_per_element = 1
+            elif "bitPerSample" in argnames:
+                bits_index = argnames.index("bitPerSample")
+            terms.append((count_index, bits_per_element, bits_index))
+        if terms:
+            transfers[name] = terms
+    return transfers
+
+
+# The instrument sub-APIs of a device that have settings, as captured by DigilentWaveformsDevice.snapshot().
+_SETTINGS_INSTRUMENTS = ("analogIn", "analogOut", "analogIO", "digitalIO", "digitalIn", "digitalOut", "analogImpedance")
+
+# Settings that are applied before the other settings of their instrument, since they change the meaning of other settings.
+_SETTINGS_APPLIED_FIRST = ("FDwfAnalogInChannelAttenuationSet", )
+
+# Settings whose Set function doesn't take the values returned by their Get function, mapped to a function that
+# converts the values returned by the Get function to the values to pass to the Set function.
+_SETTINGS_SET_VALUES = {
+    # The noise buffer size follows the sample buffer size; its Set function only enables or disables the noise buffer.
+    "FDwfAnalogInNoiseSizeSet": lambda values: [int(values[0] != 0)]
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _instrument_settings(prefix: str) -> list:
+    """Return the settings of an instrument, i.e., the non-obsolete pairs of Get and Set functions with the given prefix.
+
+    The settings are returned as a list of (setting, get_name, set_name, index_args, output_types) tuples, in the order
+    in which they are applied. The setting is the function name without prefix and 'Get' suffix (e.g., 'ChannelRange'
+    or 'Output64'); index_args is the number of channel and node index arguments that follow the device handle; and
+    output_types are the ctypes types of the values. Settings that are also available as a 64-bit variant are omitted.
+    """
+    signatures = {name: obsolete_flag for (name, restype, argtypes, obsolete_flag) in dwf_function_signatures(_typespec_ctypes)}
+    prototypes = _dwf_function_prototypes()
+    settings = []
+    for (get_name, obsolete_flag) in signatures.items():
+        if obsolete_flag or not get_name.startswith(prefix) or not get_name.endswith(("Get", "Get64")):
+            continue
+        if get_name.endswith("Get"):
+            (set_name, setting) = (get_name[:-3] + "Set", get_name[len(prefix):-3])
+            if get_name + "64" in signatures:
+                continue
+        else:
+            (set_name, setting) = (get_name[:-5] + "Set64", get_name[len(prefix):-5] + "64")
+        if signatures.get(set_name, True):
+            continue
+        argtypes = prototypes[get_name][1]
+        index_args = sum(1 for argtype in argtypes[1:] if not issubclass(argtype, ctypes._Pointer))  # pylint: disable=protected-access
+        output_types = [argtype._type_ for argtype in argtypes[1 + index_args:]]
+        settings.append((setting, get_name, set_name, index_args, output_types))
+    settings.sort(key=lambda setting: setting[2] not in _SETTINGS_APPLIED_FIRST)
+    return settings
+
+
+class _AnnotatedLibrary:
+    """A ctypes library whose functions are type-annotated on first access.
+
+    Annotating all functions of the DWF library takes time, and most processes only use a small fraction of them.
+    This wrapper annotates a function when it is first looked up, and stores it as an attribute of the wrapper,
+    so that subsequent lookups don't go through __getattr__ again.
+    """
+
+    def __init__(self, lib: ctypes.CDLL) -> None:
+        self._cdll = lib
+
+    def __getattr__(self, name: str):
+        # Raises AttributeError if the function is not present in the shared library, e.g. when using an older version of the library.
+        func = getattr(self._cdll, name)
+        prototype = _dwf_function_prototypes().get(name)
+        if prototype is not None:
+            (func.restype, func.argtypes) = prototype
+        setattr(self, name, func)
+        return func
+
+
+class _FunctionTable:
+    """The DWF library functions whose names start with a given prefix, resolved once.
+
+    Each instrument sub-API calls the library through a function table, rather than looking up the function
+    via its device and library objects on every call; this reduces the per-call overhead of the wrappers.
+    A function is resolved (and type-annotated) on first use, and stored as an attribute of the table.
+    """
+
+    def __init__(self, lib: _AnnotatedLibrary, prefix: str) -> None:
+        self._annotated_library = lib
+        self._prefix = prefix
+        self._wrappers = weakref.WeakSet()  # The function table wrappers that wrap this table.
+
+    def __getattr__(self, name: str):
+        if not name.startswith(self._prefix):
+            raise AttributeError("Function {!r} is not part of the {!r} function table.".format(name, self._prefix))
+        func = getattr(self._annotated_library, name)
+        setattr(self, name, func)
+        return func
+
+    def _discard(self) -> None:
+        """Discard the functions resolved so far, in this table and in all wrappers stacked on top of it."""
+        for name in [name for name in vars(self) if not name.startswith("_")]:
+            delattr(self, name)
+        for wrapper in list(self._wrappers):
+            wrapper._discard()
+
+    def _rebind(self, lib) -> None:
+        """Resolve the functions of the table from another library object, e.g. when tracing is enabled or disabled."""
+        self._annotated_library = lib
+        self._discard()
+
+
+class _LibraryCallRecord:
+    """The call statistics of a single DWF library function."""
+
+    __slots__ = ("calls", "total_time", "max_time", "errors", "bytes")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0          # Number of calls.
+        self.total_time = 0.0   # Total duration of the calls, in seconds.
+        self.max_time = 0.0     # Longest call, in seconds.
+        self.errors = 0         # Number of calls that did not return success.
+        self.bytes = 0          # Number of bytes transferred in data buffers.
+
+
+class LibraryCallTrace:
+    """Per-function statistics of the calls made to the DWF library while tracing is enabled.
+
+    Tracing is enabled by DigilentWaveformsLibrary.enableTracing(), which returns the trace that collects the statistics.
+    For each library function, the trace counts the calls, their total and maximum duration (wall time, including
+    the Python wrapper's ctypes overhead), the calls that returned an error, and, for functions that transfer sample or
+    data buffers, the number of bytes transferred.
+
+    The statistics accumulate until reset() is called.
+    """
+
+    def __init__(self) -> None:
+        self._records = {}
+
+    def reset(self) -> None:
+        """Clear the statistics."""
+        # The records are referenced by the traced functions, so they are cleared rather than replaced.
+        for record in self._records.values():
+            record.reset()
+
+    def _traced_function(self, name: str, func):
+        """Return a function that calls 'func', recording its calls under the given name."""
+        record = self._records.get(name)
+        if record is None:
+            record = self._records[name] = _LibraryCallRecord()
+
+        transfers = _dwf_buffer_transfers().get(name)
+        perf_counter = time.perf_counter
+
+        def traced_function(*args):
+            t0 = perf_counter()
+            result = func(*args)
+            duration = perf_counter() - t0
+            record.calls += 1
+            record.total_time += duration
+            if duration > record.max_time:
+                record.max_time = duration
+            if result != _RESULT_SUCCESS:
+                record.errors += 1
+            if transfers is not None:
+                for (count_index, bits, bits_index) in transfers:
+                    if bits_index is not None:
+                        bits = args[bits_index]
+                    record.bytes += args[count_index] * bits // 8
+            return result
+
+        return traced_function
+
+    def summary(self) -> dict:
+        """Return the statistics of the functions that were called, as a dictionary keyed by function name, e.g. for logging."""
+        return {
+            name: {
+                "calls": record.calls,
+                "total_time": record.total_time,
+                "mean_time": record.total_time / record.calls,
+                "max_time": record.max_time,
+                "errors": record.errors,
+                "bytes": record.bytes
+            }
+            for (name, record) in sorted(self._records.items()) if record.calls != 0
+        }
+
+    def toJson(self, indent: Optional[int]=None) -> str:
+        """Return the statistics of the functions that were called as a JSON string."""
+        return json.dumps(self.summary(), indent=indent)
+
+    def table(self, sort_by: str="total_time") -> str:
+        """Return the statistics of the functions that were called as a text table.
+
+        Args:
+            sort_by: The statistic to sort on, in descending order: one of the keys of the dictionaries returned by
+                summary(), or 'name' to sort alphabetically.
+
+        Returns:
+            The table, with times in microseconds.
+        """
+        summary = self.summary()
+        if sort_by == "name":
+            names = sorted(summary)
+        else:
+            names = sorted(summary, key=lambda name: summary[name][sort_by], reverse=True)
+
+        width = max([len("function")] + [len(name) for name in names])
+        lines = ["{:{}}  {:>10}  {:>12}  {:>10}  {:>10}  {:>8}  {:>12}".format(
+            "function", width, "calls", "total [us]", "mean [us]", "max [us]", "errors", "bytes")]
+        for name in names:
+            stats = summary[name]
+            lines.append("{:{}}  {:10d}  {:12.1f}  {:10.2f}  {:10.2f}  {:8d}  {:12d}".format(
+                name, width, stats["calls"], stats["total_time"] * 1e6, stats["mean_time"] * 1e6, stats["max_time"] * 1e6,
+                stats["errors"], stats["bytes"]))
+        return "\n".join(lines)
+
+
+class _TracedLibrary:
+    """A DWF library whose functions record their calls in a LibraryCallTrace.
+
+    Like _AnnotatedLibrary, the wrapper resolves a function when it is first looked up, and stores it as an attribute.
+    """
+
+    def __init__(self, lib, trace: LibraryCallTrace) -> None:
+        self._traced_library = lib
+        self._trace = trace
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        func = self._trace._traced_function(name, getattr(self._traced_library, name))
+        setattr(self, name, func)
+        return func
+
+
+class _FunctionTableWrapper:
+    """A function table that wraps the function table of an instrument sub-API, to add behavior to some of its functions.
+
+    Wrappers are installed by replacing the '_functions' attribute of the sub-API, and can be stacked.
+    Like the function table itself, a wrapper resolves a function on first use and stores it as an attribute.
+    A wrapper registers itself with the table it wraps, so the functions it resolved are discarded when the
+    functions of that table change, e.g. when tracing is enabled or disabled.
+    Subclasses override the _wrap() method.
+    """
+
+    def __init__(self, table) -> None:
+        self._table = table
+        self._prefix = table._prefix
+        self._wrappers = weakref.WeakSet()
+        table._wrappers.add(self)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        func = self._wrap(name, getattr(self._table, name))
+        setattr(self, name, func)
+        return func
+
+    def _wrap(self, name: str, func):
+        """Return the function to call for the library function 'name'. By default, the function is passed through unchanged."""
+        return func
+
+    def _discard(self) -> None:
+        """Discard the functions resolved so far, in this wrapper and in all wrappers stacked on top of it."""
+        for name in [name for name in vars(self) if not name.startswith("_")]:
+            delattr(self, name)
+        for wrapper in list(self._wrappers):
+            wrapper._discard()
+
+    def _rebind(self, table) -> None:
+        """Wrap another function table, discarding the functions resolved so far."""
+        self._table._wrappers.discard(self)
+        self._table = table
+        table._wrappers.add(self)
+        self._discard()
+
+
+def _remove_function_table_wrapper(instrument, wrapper: _FunctionTableWrapper) -> None:
+    """Remove a function table wrapper from the function table (or stack of wrappers) of an instrument sub-API."""
+    if instrument._functions is wrapper:
+        instrument._functions = wrapper._table
+    else:
+        outer = instrument._functions
+        while outer._table is not wrapper:
+            outer = outer._table
+        outer._rebind(wrapper._table)
+    wrapper._table._wrappers.discard(wrapper)
+
+
+class _ConfigTransactionTable(_FunctionTableWrapper):
+    """A function table wrapper that keeps track of the instrument settings changed during a configuration transaction.
+
+    It wraps the function table of an instrument sub-API while DigilentWaveformsDevice.configTransaction() is active.
+    Successful calls of the instrument's Set functions mark the instrument as touched, in the 'touched' dictionary that
+    maps function name prefixes to sets of channel indices (only used for AnalogOut, where settings are per channel).
+    Calls to the instrument's Configure and Reset functions, which configure the instrument themselves, unmark it.
+    """
+
+    def __init__(self, table, touched: dict) -> None:
+        super().__init__(table)
+        self._touched = touched
+
+    def _wrap(self, name: str, func):
+        prefix = self._prefix
+        touched = self._touched
+        per_channel = (prefix == "FDwfAnalogOut")
+
+        if name.endswith(("Set", "Set64")):
+            def transaction_function(*args):
+                result = func(*args)
+                if result == _RESULT_SUCCESS:
+                    channels = touched.setdefault(prefix, set())
+                    if per_channel:
+                        channels.add(args[1])
+                return result
+            return transaction_function
+
+        if name in (prefix + "Configure", prefix + "Reset"):
+            def transaction_function(*args):
+                touched.pop(prefix, None)
+                return func(*args)
+            return transaction_function
+
+        return func
+
+
+class SettingsCache:
+    """A client-side cache of the settings of an instrument, that answers the instrument's Get methods without calling the library.
+
+    Each instrument sub-API that has settings (AnalogIn, AnalogOut, AnalogIO, DigitalIO, DigitalIn, DigitalOut,
+    and AnalogImpedance) has an instance of this class as its 'settings_cache' attribute. The cache is disabled by
+    default; it is enabled by setting its 'enabled' attribute to True.
+
+    While enabled, the first call of a Get method for a given setting (and channel, if applicable) calls the library,
+    and the value is cached; subsequent calls return the cached value. Since the device may adjust a value that is set
+    (e.g., a sample frequency, to one that the device can actually produce), and since many settings depend on others
+    (e.g., the AnalogIn noise buffer size on its buffer size), a successful call of a Set method discards all cached
+    settings of the instrument, so the next Get calls read back the values that the device actually uses.
+
+    While auto-configure is disabled, the device only adjusts the values that were set when the instrument is
+    configured, so a successful call of the instrument's configure() method discards the cached settings as well.
+    The instrument's reset() method, and the device's reset(), paramSet(), and autoConfigureSet() methods, also
+    clear the cache.
+
+    The cache assumes that the settings are only changed through this sub-API while it is enabled. For debugging, the
+    'strict' attribute can be set to True; in strict mode, every cached value that is returned is verified against the
+    library, and a PyDwfError is raised if they differ.
+
+    The 'hits' and 'misses' attributes count the Get calls that were answered from the cache, or not.
+    """
+
+    def __init__(self, instrument) -> None:
+        self._instrument = instrument
+        self._table = None
+        self._values = {}
+        self.strict = False
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is enabled."""
+        return self._table is not None
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        if enabled and self._table is None:
+            self._table = _SettingsCacheTable(self._instrument._functions, self)
+            self._instrument._functions = self._table
+        elif not enabled and self._table is not None:
+            _remove_function_table_wrapper(self._instrument, self._table)
+            self._table = None
+            self.clear()
+
+    def clear(self) -> None:
+        """Discard all cached settings."""
+        self._values.clear()
+
+
+class _SettingsCacheTable(_FunctionTableWrapper):
+    """A function table wrapper that answers an instrument's Get functions from a SettingsCache."""
+
+    def __init__(self, table, cache: SettingsCache) -> None:
+        super().__init__(table)
+        self._cache = cache
+
+    def _wrap(self, name: str, func):
+        values = self._cache._values
+        cache = self._cache
+
+        if name.endswith(("Get", "Get64")):
+
+            def cached_get(*args):
+                # The inputs (handle and channel or node indices) are plain values; the outputs are ctypes variables.
+                key = (name, ) + tuple(arg for arg in args if not isinstance(arg, ctypes._SimpleCData))
+                cached = values.get(key)
+                if cached is not None and not cache.strict:
+                    cache.hits += 1
+                    for (arg, value) in zip([arg for arg in args if isinstance(arg, ctypes._SimpleCData)], cached):
+                        arg.value = value
+                    return _RESULT_SUCCESS
+                result = func(*args)
+                if result == _RESULT_SUCCESS:
+                    actual = tuple(arg.value for arg in args if isinstance(arg, ctypes._SimpleCData))
+                    if cached is None:
+                        cache.misses += 1
+                        values[key] = actual
+                    elif cached != actual:
+                        raise PyDwfError("Settings cache mismatch for {}{}: cached value {}, actual value {}.".format(name, key[2:], cached, actual))
+                    else:
+                        cache.hits += 1
+                return result
+
+            return cached_get
+
+        if name.endswith(("Set", "Set64")) or name == self._prefix + "Configure":
+
+            # Many settings depend on others (e.g., the AnalogIn channel range on the channel attenuation, and
+            # the noise buffer size on the buffer size), so any change discards all cached settings.
+            def cached_set(*args):
+                result = func(*args)
+                if result == _RESULT_SUCCESS:
+                    values.clear()
+                return result
+
+            return cached_set
+
+        if name.endswith("Reset"):
+
+            def cached_reset(*args):
+                values.clear()
+                return func(*args)
+
+            return cached_reset
+
+        return func
+
+
+class EnumConfigurationInfo(NamedTuple):
+    """The parameters of a device configuration, as reported by EnumAPI.configInfo().
+
+    The fields are named after the DwfEnumConfigInfo values.
+    """
+    AnalogInChannelCount: int
+    AnalogOutChannelCount: int
+    AnalogIOChannelCount: int
+    DigitalInChannelCount: int
+    DigitalOutChannelCount: int
+    DigitalIOChannelCount: int
+    AnalogInBufferSize: int
+    AnalogOutBufferSize: int
+    DigitalInBufferSize: int
+    DigitalOutBufferSize: int
+
+
+class ConfigurationObjective(NamedTuple):
+    """A declarative objective for selecting a device configuration, used by EnumDeviceRecord.bestConfiguration().
+
+    Parameters are named after the fields of EnumConfigurationInfo. For example, to select the configuration with the
+    largest AnalogIn buffer that has at least 2 DigitalOut channels:
+
+        ConfigurationObjective(maximize="AnalogInBufferSize", minimum={"DigitalOutChannelCount": 2})
+    """
+    maximize: Optional[str] = None   # The parameter to maximize.
+    minimize: Optional[str] = None   # The parameter to minimize.
+    minimum: Optional[dict] = None   # Maps parameters to the minimum value they must have.
+    maximum: Optional[dict] = None   # Maps parameters to the maximum value they may have.
+
+    def scores(self, table: np.ndarray) -> np.ndarray:
+        """Return the score of each configuration in a configuration table, or -inf for configurations that don't qualify."""
+        scores = np.zeros(len(table))
+        if self.maximize is not None:
+            scores += table[:, _configuration_column(self.maximize)]
+        if self.minimize is not None:
+            scores -= table[:, _configuration_column(self.minimize)]
+        for (parameter, value) in (self.minimum or {}).items():
+            scores[table[:, _configuration_column(parameter)] < value] = -np.inf
+        for (parameter, value) in (self.maximum or {}).items():
+            scores[table[:, _configuration_column(parameter)] > value] = -np.inf
+        return scores
+
+
+def _configuration_column(parameter: str) -> int:
+    """Return the column of a configuration parameter in a configuration table."""
+    try:
+        return EnumConfigurationInfo._fields.index(parameter)
+    except ValueError:
+        raise PyDwfError("Unknown configuration parameter: {!r}.".format(parameter)) from None
+
+
+@functools.lru_cache(maxsize=64)
+def _configuration_table(configurations: Tuple[EnumConfigurationInfo, ...]) -> np.ndarray:
+    """Return the configurations as a read-only (configurations, parameters) array, computed once per set of configurations."""
+    table = np.array(configurations, dtype=np.int64).reshape(len(configurations), len(EnumConfigurationInfo._fields))
+    table.flags.writeable = False
+    return table
+
+
+class EnumDeviceRecord(NamedTuple):
+    """The information of an enumerated device, as gathered by EnumAPI.snapshot().
+
+    In a snapshot made with details=False, only the device_index and serial_number fields are set; the others are None.
+    """
+    device_index: int
+    device_type: Optional[DEVID]
+    device_version: Optional[DEVVER]
+    is_opened: Optional[bool]
+    user_name: Optional[str]
+    device_name: Optional[str]
+    serial_number: str
+    configurations: Optional[Tuple[EnumConfigurationInfo, ...]]
+
+    @property
+    def configurationTable(self) -> np.ndarray:
+        """The configurations as a read-only integer array, with a row per configuration and a column per EnumConfigurationInfo field."""
+        return _configuration_table(self.configurations)
+
+    def bestConfiguration(self, objective) -> int:
+        """Return the index of the configuration that best fits an objective.
+
+        Args:
+            objective: A ConfigurationObjective, or a function that returns a fitness score for an EnumConfigurationInfo.
+                       Of the configurations with the highest score, the first one is selected.
+
+        Returns:
+            The index of the selected configuration.
+
+        Raises:
+            PyDwfError: no configuration satisfies the objective.
+        """
+        if isinstance(objective, ConfigurationObjective):
+            scores = objective.scores(self.configurationTable)
+        else:
+            scores = np.array([objective(configuration) for configuration in self.configurations], dtype=np.float64)
+        if len(scores) == 0 or np.all(scores == -np.inf):
+            raise PyDwfError("No configuration of device {!r} satisfies the objective.".format(self.serial_number))
+        return int(np.argmax(scores))
+
+
+class EnumSnapshot(NamedTuple):
+    """The result of a device enumeration, as returned by EnumAPI.snapshot()."""
+    enumfilter: ENUMFILTER
+    timestamp: float  # The time.monotonic() value at which the enumeration was done.
+    devices: Tuple[EnumDeviceRecord, ...]
+    details: bool     # Whether the records hold all device information, or only the serial numbers.
+
+    @property
+    def age(self) -> float:
+        """The time since the enumeration was done, in seconds."""
+        return time.monotonic() - self.timestamp
+
+
+class DeviceOpenResult(NamedTuple):
+    """The result of opening a device, as returned by DeviceAPI.openMany()."""
+    target: Union[str, int]                       # The serial number or device index of the device.
+    device: Optional['DigilentWaveformsDevice']   # The opened device, or None if it couldn't be opened.
+    error: Optional[Exception]                    # The error that prevented the device from being opened, or None.
+
+
 class DigilentWaveformsLibrary:
     """Provide access to the DWF shared library functions.
 
@@ -414,25 +1509,60 @@ class DigilentWaveformsLibrary:
 
     In addition, the following two private helper methods are provided for the Python wrapper itself:
 
-    - The _annotate_function_signatures static method.
+    - The _function_table() method.
     - The _exception() method.
     """
 
-    def __init__(self, check_library_version: bool=True) -> None:
+    _shared_instances = {}
+    _shared_instances_lock = threading.Lock()
+
+    def __init__(self, check_library_version: bool=True, library_path: Optional[str]=None, simulated=None) -> None:
         """Initialize a DigilentWaveformsLibrary instance.
 
-        This function instantiates a ctypes library, type-annotates its functions, and instantiates 'enum' and 'device' fields
-        that can be used to access the device enumeration and device functions of the API.
+        This function instantiates a ctypes library, and instantiates 'enum' and 'device' fields that can be used to access the
+        device enumeration and device functions of the API. The library functions are type-annotated on first use.
+
+        Args:
+            check_library_version: If True, verify that the version of the shared library is the version that pydwf expects.
+            library_path: The filename of the DWF shared library to load. If None, the filename given by the
+                PYDWF_LIBRARY_PATH environment variable is used, if set; otherwise, the library is loaded from its
+                default location on the platform.
+            simulated: If True, use a simulated library that presents a single Analog Discovery 2 device, instead of
+                the DWF shared library; see the pydwf.dwf_simulator module. A SimulatedDwfLibrary instance can be passed
+                to use a specifically configured simulation. If None, the simulated library is used if the
+                PYDWF_SIMULATED environment variable is set to '1'.
+
+        Raises:
+            PyDwfError: the 'simulated' argument is not valid, or the library version doesn't match.
         """
-        if sys.platform.startswith("win"):
-            lib = ctypes.cdll.dwf
-        elif sys.platform.startswith("darwin"):
-            lib = ctypes.cdll.LoadLibrary("/Library/Frameworks/dwf.framework/dwf")
+        if simulated is None:
+            simulated = (os.environ.get("PYDWF_SIMULATED") == "1")
+
+        if library_path is None:
+            library_path = os.environ.get("PYDWF_LIBRARY_PATH")
+
+        if simulated is True:
+            # Imported here, so the simulator (and its data tables) are only loaded when needed.
+            from .dwf_simulator import SimulatedDwfLibrary
+            lib = SimulatedDwfLibrary()
+        elif simulated is not False:
+            from .dwf_simulator import SimulatedDwfLibrary
+            if not isinstance(simulated, SimulatedDwfLibrary):
+                raise PyDwfError("Bad 'simulated' argument: expected None, a bool, or a SimulatedDwfLibrary instance, got {!r}.".format(simulated))
+            lib = simulated
         else:
-            lib = ctypes.cdll.LoadLibrary("libdwf.so")
+            if library_path is not None:
+                lib = ctypes.cdll.LoadLibrary(library_path)
+            elif sys.platform.startswith("win"):
+                lib = ctypes.cdll.dwf
+            elif sys.platform.startswith("darwin"):
+                lib = ctypes.cdll.LoadLibrary("/Library/Frameworks/dwf.framework/dwf")
+            else:
+                lib = ctypes.cdll.LoadLibrary("libdwf.so")
+
+            lib = _AnnotatedLibrary(lib)
 
         if check_library_version:
-            # Note that the 'FDwfGetVersion' function has not been type-annotated yet.
             c_version = ctypes.create_string_buffer(32)
             result = lib.FDwfGetVersion(c_version)
             if result != _RESULT_SUCCESS:
@@ -441,29 +1571,99 @@ class DigilentWaveformsLibrary:
             if actual_dwf_version != expected_dwf_version:
                 raise PyDwfError("DWF library version mismatch: pydwf module expects {}, but actual library is version {}".format(expected_dwf_version, actual_dwf_version))
 
-        self._annotate_function_signatures(lib)
-
         self._lib = lib
+        self._function_tables = {}
+        self.trace = None
 
         self.enum = DigilentWaveformsLibrary.EnumAPI(self)
         self.device = DigilentWaveformsLibrary.DeviceAPI(self)
 
-    @staticmethod
-    def _annotate_function_signatures(lib: ctypes.CDLL) -> None:
-        """Add 'ctypes' return type and parameter type annotations for all known functions in the DWF shared library."""
+    @classmethod
+    def shared(cls, library_path: Optional[str]=None, simulated: Optional[bool]=None) -> 'DigilentWaveformsLibrary':
+        """Return a process-wide DigilentWaveformsLibrary instance for the given shared library.
 
-        function_signatures = dwf_function_signatures(_typespec_ctypes)
+        Note:
+            This is a convenience method that doesn't directly encapsulate a single function call of the library.
 
-        for (name, restype, argtypes, obsolete_flag) in function_signatures:
-            argtypes = [argtype for (argname, argtype) in argtypes]
-            try:
-                func = getattr(lib, name)
-                func.restype = restype
-                func.argtypes = argtypes
-            except AttributeError:
-                # Do not annotate functions that are not present in the shared library.
-                # This can happen, for example, when the Python binding is used with an older version of the shared library.
-                pass
+        The first call for a given library path instantiates the DigilentWaveformsLibrary, checking the library version;
+        subsequent calls return the same instance. The library path is resolved as for the constructor, so a library
+        path given by the PYDWF_LIBRARY_PATH environment variable (e.g., to use a stub library for testing) selects a
+        separate instance. Likewise, the simulated library has its own shared instance.
+
+        Args:
+            library_path: The filename of the DWF shared library, or None to use the default library.
+            simulated: If True, return the shared instance of the simulated library.
+                If None, the PYDWF_SIMULATED environment variable decides, as for the constructor.
+
+        Returns:
+            The shared DigilentWaveformsLibrary instance.
+
+        Raises:
+            PyDwfError: the library cannot be loaded, or its version doesn't match.
+        """
+        if simulated is None:
+            simulated = (os.environ.get("PYDWF_SIMULATED") == "1")
+
+        if library_path is None:
+            library_path = os.environ.get("PYDWF_LIBRARY_PATH")
+
+        key = None if simulated else library_path
+
+        with cls._shared_instances_lock:
+            instance = cls._shared_instances.get((key, simulated))
+            if instance is None:
+                instance = cls._shared_instances[(key, simulated)] = cls(library_path=library_path, simulated=simulated)
+            return instance
+
+    def enableTracing(self, trace: Optional[LibraryCallTrace]=None) -> LibraryCallTrace:
+        """Start recording per-function statistics of the calls made to the library.
+
+        Note:
+            This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+        Tracing applies to all calls made through this library instance, including those of devices that are already open.
+        While tracing is enabled, the trace is also available as the 'trace' attribute of the library instance.
+        If tracing is already enabled, it is restarted with the given trace.
+
+        Args:
+            trace: The trace to record the calls in. If None, a new LibraryCallTrace is made.
+
+        Returns:
+            The trace that records the calls.
+        """
+        self.disableTracing()
+        if trace is None:
+            trace = LibraryCallTrace()
+        self._lib = _TracedLibrary(self._lib, trace)
+        for table in self._function_tables.values():
+            table._rebind(self._lib)
+        self.trace = trace
+        return trace
+
+    def disableTracing(self) -> None:
+        """Stop recording the calls made to the library, removing the tracing overhead.
+
+        Note:
+            This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+        The statistics recorded so far remain available in the trace returned by enableTracing().
+        """
+        if self.trace is None:
+            return
+        self._lib = self._lib._traced_library
+        for table in self._function_tables.values():
+            table._rebind(self._lib)
+        self.trace = None
+
+    def _function_table(self, prefix: str) -> _FunctionTable:
+        """Return the table of library functions with the given name prefix, for use by an instrument sub-API.
+
+        Tables are made once per library instance, and shared by all devices.
+        """
+        table = self._function_tables.get(prefix)
+        if table is None:
+            table = self._function_tables[prefix] = _FunctionTable(self._lib, prefix)
+        return table
 
     def _exception(self) -> DigilentWaveformsLibraryError:
         """Return an exception describing the most recent error.
@@ -582,10 +1782,15 @@ class DigilentWaveformsLibrary:
         Version 3.16.3 of the DWF library has 12 'FDwfEnum' functions, 4 of which are obsolete.
 
         These functions are used to discover all connected, compatible devices.
+
+        In addition, the snapshot() convenience method gathers the information of all enumerated devices in one pass.
         """
 
         def __init__(self, dwf: 'DigilentWaveformsLibrary') -> None:
             self._dwf = dwf
+            self._snapshot = None
+            self.snapshot_ttl = 0.0  # The maximum age of a snapshot that is reused by snapshot(), in seconds.
+            self.cache = None  # An optional pydwf.enum_cache.EnumCache, used by snapshot() for device configurations.
 
         def count(self, enumfilter: Optional[ENUMFILTER]=None) -> int:
             """Build an internal list of detected devices filtered by the 'enumfilter' argument, and return the count of detected devices.
@@ -608,6 +1813,9 @@ class DigilentWaveformsLibrary:
             if enumfilter is None:
                 enumfilter = ENUMFILTER.All
 
+            # A new enumeration may change the device indices, so the last snapshot can no longer be reused.
+            self._snapshot = None
+
             c_device_count = _typespec_ctypes.c_int()
             result = self._dwf._lib.FDwfEnum(enumfilter.value, c_device_count)
             if result != _RESULT_SUCCESS:
@@ -615,6 +1823,92 @@ class DigilentWaveformsLibrary:
             device_count = c_device_count.value
             return device_count
 
+        def snapshot(self, enumfilter: Optional[ENUMFILTER]=None, max_age: Optional[float]=None, details: bool=True) -> EnumSnapshot:
+            """Enumerate the devices, and gather the information of each device and its configurations in a single pass.
+
+            Note:
+                This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+            Note:
+                This method can take several seconds to complete, unless the previous snapshot is reused.
+
+            Gathering the device details takes a dozen library calls per device, and ten more per device configuration.
+            If only the serial numbers are needed (e.g., to find a device), pass details=False; the records then only hold the
+            device index and serial number, which takes a single library call per device.
+
+            The previous snapshot is reused if it was made with the same filter, is at most 'max_age' seconds old, holds the
+            details if they are requested, and no other enumeration was done since. Since the device indices in a snapshot refer to the latest enumeration, the device indices
+            of a reused snapshot are still valid; but devices that were connected or disconnected since are not accounted for.
+
+            Args:
+                enumfilter: Specify which devices to enumerate. If not specified, enumerate all devices.
+                max_age: The maximum age of a snapshot to reuse, in seconds. If not specified, the 'snapshot_ttl'
+                         attribute is used, which is 0 by default (i.e., always enumerate).
+                details: If True, gather all information of each device, including its configurations.
+                         If False, only gather the serial numbers.
+
+            Returns:
+                The snapshot, with an EnumDeviceRecord for each device found.
+
+            Raises:
+                DigilentWaveformsLibraryError: the devices or their information cannot be enumerated.
+                PyDwfError: the serial number of a device isn't of the form 'SN:XXXXXXXXXXXX'.
+            """
+            if enumfilter is None:
+                enumfilter = ENUMFILTER.All
+
+            if max_age is None:
+                max_age = self.snapshot_ttl
+
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.enumfilter == enumfilter and snapshot.age <= max_age and (snapshot.details or not details):
+                return snapshot
+
+            timestamp = time.monotonic()
+
+            if not details:
+                num_devices = self.count(enumfilter)
+                devices = tuple(EnumDeviceRecord(device_index, None, None, None, None, None, self.serialNumber(device_index), None)
+                                for device_index in range(num_devices))
+                self._snapshot = EnumSnapshot(enumfilter, timestamp, devices, False)
+                return self._snapshot
+
+            cache = self.cache
+            if cache is not None:
+                cache.validate(self._dwf.getVersion())
+
+            num_devices = self.count(enumfilter)
+
+            devices = []
+            for device_index in range(num_devices):
+                (device_type, device_version) = self.deviceType(device_index)
+                serial_number = self.serialNumber(device_index)
+                configurations = None if cache is None else cache.configurations(serial_number, device_type, device_version)
+                if configurations is None:
+                    # The configuration list is built per device, so the configurations must be queried right after configCount().
+                    configurations = tuple(
+                        EnumConfigurationInfo(*(self.configInfo(config_index, info) for info in DwfEnumConfigInfo))
+                        for config_index in range(self.configCount(device_index))
+                    )
+                    if cache is not None:
+                        cache.store(serial_number, device_type, device_version, configurations)
+                devices.append(EnumDeviceRecord(
+                    device_index   = device_index,
+                    device_type    = device_type,
+                    device_version = device_version,
+                    is_opened      = self.deviceIsOpened(device_index),
+                    user_name      = self.userName(device_index),
+                    device_name    = self.deviceName(device_index),
+                    serial_number  = serial_number,
+                    configurations = configurations
+                ))
+
+            if cache is not None:
+                cache.save()
+
+            self._snapshot = EnumSnapshot(enumfilter, timestamp, tuple(devices), True)
+            return self._snapshot
+
         def deviceType(self, device_index: int)-> Tuple[DEVID, DEVVER]:
             """Return the device ID and version ID of the selected device.
 
@@ -876,6 +2170,8 @@ class DigilentWaveformsLibrary:
 
         The DeviceAPI class also provides the openBySerialNumber() convenience method.
         This is the recommended way to open a specific device.
+        The openBest() convenience method opens a device in the configuration that best fits an objective,
+        and the openMany() convenience method opens several devices concurrently.
         """
 
         def __init__(self, dwf: 'DigilentWaveformsLibrary') -> None:
@@ -926,7 +2222,15 @@ class DigilentWaveformsLibrary:
                 This is a convenience method that doesn't directly encapsulate a single function call of the library.
 
             Note:
-                This method takes several seconds to complete.
+                This method takes several seconds to complete, unless a recent enumeration is reused
+                (see EnumAPI.snapshot() and its 'snapshot_ttl' attribute).
+
+            Only the serial numbers of the enumerated devices are queried (see EnumAPI.snapshot() with details=False).
+
+            If an EnumCache is attached to the EnumAPI (its 'cache' attribute) and it knows the serial number, only devices of
+            the cached device type are enumerated. If the device isn't found among them, the cache entry is discarded as stale,
+            and all devices are enumerated. With a cache attached, the device details are gathered, so the cache learns the
+            device types; the configurations of a device are then only queried once.
 
             Args:
                 serial_number_sought: The serial number of the device to be opened.
@@ -939,15 +2243,238 @@ class DigilentWaveformsLibrary:
                 DigilentWaveformsLibraryError: an error occurred in the underlying API.
                 PyDwfError: the serial number specified was not found (likely) or it was found more than once (unlikely).
             """
-            num_devices = self._dwf.enum.count()  # Perform a device enumeration.
-            candidates = [device_index for device_index in range(num_devices) if self._dwf.enum.serialNumber(device_index) == serial_number_sought]
+            record = self._find_by_serial_number(serial_number_sought)
+            return self.open(record.device_index, config_index)
+
+        def openBest(self, serial_number_sought: str, objective) -> 'DigilentWaveformsDevice':
+            """Open a device identified by its serial number, in the configuration that best fits an objective.
+
+            Note:
+                This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+            The configurations are taken from the device's EnumDeviceRecord, and evaluated using its bestConfiguration()
+            method. Like openBySerialNumber(), this method reuses a recent enumeration and the EnumAPI's cache, if any.
+
+            Args:
+                serial_number_sought: The serial number of the device to be opened.
+                objective: A ConfigurationObjective, or a function that returns a fitness score for an EnumConfigurationInfo.
+
+            Returns:
+                The DigilentWaveformsDevice instance created as a result of this call.
+
+            Raises:
+                DigilentWaveformsLibraryError: an error occurred in the underlying API.
+                PyDwfError: the serial number specified was not found, or no configuration satisfies the objective.
+            """
+            record = self._find_by_serial_number(serial_number_sought, details=True)
+            return self.open(record.device_index, record.bestConfiguration(objective))
+
+        def _find_by_serial_number(self, serial_number_sought: str, details: bool=False) -> EnumDeviceRecord:
+            """Find the enumeration record of a device, as described in openBySerialNumber().
+
+            Unless 'details' is True, the record only holds the device index and serial number.
+            """
+            enum_api = self._dwf.enum
+            cache = enum_api.cache
+
+            enumfilter = None
+            if cache is not None:
+                details = True
+                cache.validate(self._dwf.getVersion())
+                device_type = cache.deviceType(serial_number_sought)
+                if device_type is not None and device_type.name in ENUMFILTER.__members__:
+                    # Only enumerate devices of the cached type. This also checks that the device is still present.
+                    enumfilter = ENUMFILTER[device_type.name]
+
+            snapshot = enum_api.snapshot(enumfilter, details=details)  # Perform a device enumeration, or reuse a recent one.
+            candidates = [record for record in snapshot.devices if record.serial_number == serial_number_sought]
+
+            if len(candidates) == 0 and enumfilter is not None:
+                # The cached device type is stale; enumerate all devices.
+                cache.forget(serial_number_sought)
+                cache.save()
+                snapshot = enum_api.snapshot(details=details)
+                candidates = [record for record in snapshot.devices if record.serial_number == serial_number_sought]
 
             if len(candidates) != 1:
                 raise PyDwfError("Cannot open Digilent device by serial number {!r}: {} candidates.".format(serial_number_sought, len(candidates)))
 
-            # We found a unique candidate. Open it.
-            device_index = candidates[0]
-            return self.open(device_index, config_index)
+            return candidates[0]
+
+        def openMany(self, targets: Sequence[Union[str, int]], config_selector: Optional[Callable[[EnumDeviceRecord], Optional[int]]]=None,
+                     max_workers: Optional[int]=None, retries: int=3, retry_delay: float=0.5) -> List[DeviceOpenResult]:
+            """Open several devices concurrently, identified by serial number or by enumeration index.
+
+            Note:
+                This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+            Opening a device takes about 2 seconds, most of which is spent inside the library, which releases the GIL.
+            This method opens the devices on a pool of worker threads, so opening a number of devices takes about as long
+            as opening the slowest one.
+
+            If a serial number or a 'config_selector' is given, the devices are looked up in a single EnumAPI.snapshot().
+            When opening a device fails with error DWFERC.ApiLockTimeout, which may happen when the library is busy
+            opening other devices, the open is retried after a delay that doubles after each retry.
+
+            The error code of a failed open is the last error of the library, which is shared by all threads of the
+            process, so it may be overwritten by another open that fails at the same time. Therefore, an open that
+            fails while other devices are being opened is first retried while no other open is in progress, and only
+            the error code of such an exclusive open decides whether it is retried again. Library calls made by other
+            threads of the process while the devices are being opened may still overwrite the error code.
+
+            A device that cannot be opened doesn't prevent the other devices from being opened; its error is reported in
+            the results. The caller is responsible for closing the devices that were opened.
+
+            Args:
+                targets: The devices to open, as serial numbers (str) or indices of the latest enumeration (int).
+                config_selector: If given, this function is called with the EnumDeviceRecord of each device, and returns
+                                 the index of the configuration to open, or None for the default configuration.
+                max_workers: The number of worker threads. If not specified, a thread is used per device.
+                retries: The maximum number of times that opening a device is retried.
+                retry_delay: The delay before the first retry, in seconds.
+
+            Returns:
+                A DeviceOpenResult for each target, in the order of the targets.
+
+            Raises:
+                DigilentWaveformsLibraryError: the devices cannot be enumerated.
+            """
+            # Imported here, since most users of the library don't need it.
+            import concurrent.futures
+
+            if max_workers is None:
+                max_workers = max(1, len(targets))
+
+            records = {}
+            serial_number_indices = {}
+            if config_selector is not None or any(isinstance(target, str) for target in targets):
+                snapshot = self._dwf.enum.snapshot(details=config_selector is not None)
+                for record in snapshot.devices:
+                    records[record.device_index] = record
+                    serial_number_indices.setdefault(record.serial_number, []).append(record.device_index)
+
+            def open_target(target: Union[str, int]) -> 'DigilentWaveformsDevice':
+                if isinstance(target, str):
+                    candidates = serial_number_indices.get(target, [])
+                    if len(candidates) != 1:
+                        raise PyDwfError("Cannot open Digilent device by serial number {!r}: {} candidates.".format(target, len(candidates)))
+                    device_index = candidates[0]
+                else:
+                    device_index = target
+
+                config_index = None
+                if config_selector is not None:
+                    if device_index not in records:
+                        raise PyDwfError("Cannot open Digilent device #{}: device not found.".format(device_index))
+                    config_index = config_selector(records[device_index])
+
+                exclusive = (max_workers == 1)
+                retry = 0
+                while True:
+                    try:
+                        return open_device(device_index, config_index, exclusive)
+                    except DigilentWaveformsLibraryError as exception:
+                        if not exclusive:
+                            # The error code may be that of another open; retry while no other open is in progress.
+                            exclusive = True
+                            continue
+                        if exception.code != DWFERC.ApiLockTimeout or retry >= retries:
+                            raise
+                    time.sleep(retry_delay * 2 ** retry)
+                    retry += 1
+
+            # The number of opens in progress, or -1 while an exclusive open is in progress.
+            opens_in_progress = 0
+            opens_condition = threading.Condition()
+
+            def open_device(device_index: int, config_index: Optional[int], exclusive: bool) -> 'DigilentWaveformsDevice':
+                nonlocal opens_in_progress
+                with opens_condition:
+                    if exclusive:
+                        opens_condition.wait_for(lambda: opens_in_progress == 0)
+                        opens_in_progress = -1
+                    else:
+                        opens_condition.wait_for(lambda: opens_in_progress >= 0)
+                        opens_in_progress += 1
+                try:
+                    return self.open(device_index, config_index)
+                finally:
+                    with opens_condition:
+                        opens_in_progress = 0 if exclusive else opens_in_progress - 1
+                        opens_condition.notify_all()
+
+            results = []
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pydwf-open") as executor:
+                futures = [executor.submit(open_target, target) for target in targets]
+                for (target, future) in zip(targets, futures):
+                    try:
+                        results.append(DeviceOpenResult(target, future.result(), None))
+                    except Exception as exception:  # pylint: disable=broad-except
+                        results.append(DeviceOpenResult(target, None, exception))
+            return results
+
+
+def _capability(method):
+    """Decorator for the methods that query a capability of the device, which is constant while the device is open.
+
+    The result is memoized per DigilentWaveformsDevice, keyed by the method and its arguments, so only the first call
+    with given arguments calls the library. Lists are returned as copies, so callers cannot modify the memoized value.
+    """
+
+    @functools.wraps(method)
+    def memoized_method(self, *args, **kwargs):
+        device = getattr(self, "_device", self)
+        key = (method.__qualname__, ) + args + tuple(sorted(kwargs.items()))
+        memo = device._capability_memo
+        if key in memo:
+            value = memo[key]
+        else:
+            value = memo[key] = method(self, *args, **kwargs)
+        return list(value) if isinstance(value, list) else value
+
+    memoized_method._is_capability = True
+    return memoized_method
+
+
+class DeviceCapabilities(NamedTuple):
+    """A snapshot of the capabilities of an open device, as returned by DigilentWaveformsDevice.capabilities.
+
+    Each field is a dictionary that maps the names of the capability methods of the device or of one of its instrument
+    sub-APIs to their results. For methods with a 'channel_index' argument, the result is a list with an entry per
+    channel. For methods that also take an AnalogOut node or an AnalogIO node index, that entry is a dictionary that maps
+    the nodes of the channel to results.
+    """
+    device: dict
+    analogIn: dict
+    analogOut: dict
+    analogIO: dict
+    digitalIO: dict
+    digitalIn: dict
+    digitalOut: dict
+
+
+def _capabilities_of(api, channels: Optional[Callable[[], int]]=None, nodes: Optional[Callable[[int], Iterator]]=None) -> dict:
+    """Collect the results of the capability methods of a device or instrument sub-API.
+
+    Args:
+        api: The device or instrument sub-API.
+        channels: Returns the number of channels, for methods that take a 'channel_index' argument.
+        nodes: Returns the nodes of a channel, for methods that also take a node argument.
+    """
+    capabilities = {}
+    for (name, method) in vars(type(api)).items():
+        if not getattr(method, "_is_capability", False):
+            continue
+        method = getattr(api, name)
+        num_args = method.__wrapped__.__code__.co_argcount - 1
+        if num_args == 0:
+            capabilities[name] = method()
+        elif num_args == 1:
+            capabilities[name] = [method(channel_index) for channel_index in range(channels())]
+        else:
+            capabilities[name] = [{node: method(channel_index, node) for node in nodes(channel_index)}
+                                  for channel_index in range(channels())]
+    return capabilities
 
 
 class DigilentWaveformsDevice:
@@ -982,6 +2509,10 @@ class DigilentWaveformsDevice:
 
         self._dwf = dwf
         self._hdwf = hdwf
+        self._executor = None
+        self._config_transaction = None
+        self._capability_memo = {}
+        self._capabilities = None
         self.analogIn = DigilentWaveformsDevice.AnalogInAPI(self)
         self.analogOut = DigilentWaveformsDevice.AnalogOutAPI(self)
         self.analogIO = DigilentWaveformsDevice.AnalogIOAPI(self)
@@ -1008,10 +2539,26 @@ class DigilentWaveformsDevice:
         Raises:
             DigilentWaveformsLibraryError: the device cannot be closed.
         """
+        if self._executor is not None:
+            # Let pending calls of the async methods finish before the handle becomes invalid.
+            self._executor.shutdown(wait=True)
+            self._executor = None
         result = self._dwf._lib.FDwfDeviceClose(self._hdwf)
         if result != _RESULT_SUCCESS:
             raise self._dwf._exception()
 
+    def _async_executor(self):
+        """Return the executor that runs the blocking library calls made by the async methods of this device.
+
+        The executor has a single worker thread, so calls to the device made from async code are serialized in the
+        order in which they were issued. It is created on first use and shut down when the device is closed.
+        """
+        if self._executor is None:
+            # Imported here, since most users of the library don't need it.
+            import concurrent.futures
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="pydwf-device")
+        return self._executor
+
     def autoConfigureSet(self, auto_configure: int) -> None:
         """Enable or disable the AutoConfig setting for a specific device.
 
@@ -1026,6 +2573,7 @@ class DigilentWaveformsDevice:
         Raises:
             DigilentWaveformsLibraryError: the value cannot be set.
         """
+        self._clear_settings_caches()
         result = self._dwf._lib.FDwfDeviceAutoConfigureSet(self._hdwf, auto_configure)
         if result != _RESULT_SUCCESS:
             raise self._dwf._exception()
@@ -1047,12 +2595,237 @@ class DigilentWaveformsDevice:
         auto_configure = c_auto_configure.value
         return auto_configure
 
+    @contextlib.contextmanager
+    def configTransaction(self, restart_running: bool=False):
+        """Return a context manager that defers the configuration of the device's instruments until the end of the block.
+
+        Note:
+            This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+        With auto-configure enabled (the default), each call of an instrument Set function configures the instrument,
+        which costs a round trip to the device. Inside the block, auto-configure is disabled; on leaving the block,
+        each instrument whose settings were changed is configured once, and the previous auto-configure setting is restored:
+
+            with device.configTransaction():
+                analogIn.channelRangeSet(0, 5.0)
+                analogIn.frequencySet(1e6)
+                ...
+
+        The AnalogOut instrument is configured per channel with start value 3, which makes the library apply the settings
+        without starting or stopping the channel. The AnalogIO and DigitalIO instruments are configured by configure().
+        The AnalogIn, DigitalIn, DigitalOut, and AnalogImpedance instruments are configured without starting them, so an
+        acquisition or signal generation that is in progress is stopped. If 'restart_running' is True, the status of these
+        instruments is checked first, and an instrument that is running (i.e., in a state other than DwfState.Ready or
+        DwfState.Done) is configured and restarted; this costs an additional round trip per instrument, and restarts the
+        acquisition or signal generation that is in progress.
+
+        Instruments that are configured or reset explicitly inside the block are not configured again.
+        The protocol APIs (UART, SPI, I2C, CAN) are not affected by auto-configure, and apply their settings immediately.
+
+        If the block raises an exception, the instruments are not configured, but the auto-configure setting is restored.
+        A nested transaction on the same device joins the enclosing transaction.
+
+        Args:
+            restart_running: If True, restart the instruments that were running when the block ends.
+
+        Raises:
+            DigilentWaveformsLibraryError: the auto-configure setting cannot be changed, or an instrument cannot be configured.
+        """
+        if self._config_transaction is not None:
+            yield
+            return
+
+        auto_configure = self.autoConfigureGet()
+        self.autoConfigureSet(0)
+
+        instruments = (self.analogIn, self.analogOut, self.analogIO, self.digitalIO, self.digitalIn, self.digitalOut, self.analogImpedance)
+        touched = {}
+        tables = [_ConfigTransactionTable(instrument._functions, touched) for instrument in instruments]
+        for (instrument, table) in zip(instruments, tables):
+            instrument._functions = table
+        self._config_transaction = touched
+
+        try:
+            yield
+        except BaseException:
+            self._end_config_transaction(instruments, tables)
+            self.autoConfigureSet(auto_configure)
+            raise
+
+        self._end_config_transaction(instruments, tables)
+        try:
+            running = dict.fromkeys(touched, False)
+            if restart_running:
+                # Record which instruments are running before any of them is configured.
+                status_functions = {
+                    "FDwfAnalogIn"        : lambda: self.analogIn.status(False),
+                    "FDwfDigitalIn"       : lambda: self.digitalIn.status(False),
+                    "FDwfDigitalOut"      : self.digitalOut.status,
+                    "FDwfAnalogImpedance" : self.analogImpedance.status
+                }
+                for prefix in touched:
+                    if prefix in status_functions:
+                        running[prefix] = status_functions[prefix]() not in (DwfState.Ready, DwfState.Done)
+
+            for (prefix, channels) in touched.items():
+                if prefix == "FDwfAnalogIn":
+                    self.analogIn.configure(True, running[prefix])
+                elif prefix == "FDwfDigitalIn":
+                    self.digitalIn.configure(True, running[prefix])
+                elif prefix == "FDwfAnalogOut":
+                    for channel_index in sorted(channels):
+                        self.analogOut.configure(channel_index, 3)
+                elif prefix == "FDwfDigitalOut":
+                    self.digitalOut.configure(running[prefix])
+                elif prefix == "FDwfAnalogImpedance":
+                    self.analogImpedance.configure(int(running[prefix]))
+                elif prefix == "FDwfAnalogIO":
+                    self.analogIO.configure()
+                elif prefix == "FDwfDigitalIO":
+                    self.digitalIO.configure()
+        finally:
+            self.autoConfigureSet(auto_configure)
+
+    def _end_config_transaction(self, instruments, tables) -> None:
+        """Remove the function table wrappers that were installed for a configuration transaction."""
+        for (instrument, table) in zip(instruments, tables):
+            _remove_function_table_wrapper(instrument, table)
+        self._config_transaction = None
+
+    def snapshot(self) -> dict:
+        """Capture the settings of the device's instruments.
+
+        Note:
+            This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+        The snapshot covers every setting that can be read back and set, of the AnalogIn, AnalogOut, AnalogIO,
+        DigitalIO, DigitalIn, DigitalOut, and AnalogImpedance instruments, for each channel and node where applicable.
+        Settings that the device doesn't support (i.e., whose Get function fails) are left out.
+
+        The snapshot is a dictionary that maps instrument names (e.g., 'analogIn') to lists of [setting, indices, values]
+        entries, e.g. ['ChannelRange', [0], [5.0]]. The setting is the name of the library function without prefix and
+        'Get' suffix; indices are the channel and node indices, and values are the raw values of the setting. The snapshot
+        consists of plain lists, strings, and numbers, so it can be stored as JSON, and restored using apply().
+
+        Returns:
+            The snapshot.
+
+        Raises:
+            DigilentWaveformsLibraryError: the channels or nodes of an instrument cannot be retrieved.
+        """
+        snapshot = {}
+        for name in _SETTINGS_INSTRUMENTS:
+            instrument = getattr(self, name)
+            entries = []
+            for (setting, get_name, set_name, index_args, output_types) in _instrument_settings(instrument._functions._prefix):
+                for indices in self._setting_indices(name, index_args):
+                    values = self._get_setting(instrument, get_name, indices, output_types)
+                    if values is not None:
+                        entries.append([setting, list(indices), values])
+            snapshot[name] = entries
+        return snapshot
+
+    def apply(self, snapshot: dict) -> int:
+        """Restore the instrument settings captured by snapshot().
+
+        Note:
+            This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+        Each setting in the snapshot is compared to the current value (which is served from the instrument's settings
+        cache, if it is enabled), and only the settings that differ are set, in the order in which they appear in the
+        snapshot. Settings that change the meaning of other settings (i.e., the AnalogIn channel attenuation, which
+        scales the channel range and offset) are compared and set first; the other settings are compared after that.
+        The changes are made in a configTransaction(), so each instrument that has changed settings is configured once.
+
+        The snapshot may also be a subset of a snapshot, e.g., a recipe that holds only the settings of interest.
+
+        Args:
+            snapshot: The snapshot, as returned by snapshot().
+
+        Returns:
+            The number of settings that were changed.
+
+        Raises:
+            PyDwfError: the snapshot refers to an unknown instrument or setting, or an entry has the wrong number
+                of indices or values.
+            DigilentWaveformsLibraryError: a setting cannot be changed, or an instrument cannot be configured.
+        """
+        first_entries = []
+        other_entries = []
+        for (name, entries) in snapshot.items():
+            if name not in _SETTINGS_INSTRUMENTS:
+                raise PyDwfError("Unknown instrument in snapshot: {!r}.".format(name))
+            instrument = getattr(self, name)
+            settings = {setting[0]: setting for setting in _instrument_settings(instrument._functions._prefix)}
+            for entry in entries:
+                if len(entry) != 3:
+                    raise PyDwfError("Bad snapshot entry for instrument {!r}: {!r}.".format(name, entry))
+                (setting, indices, values) = entry
+                if setting not in settings:
+                    raise PyDwfError("Unknown setting in snapshot: {}.{}.".format(name, setting))
+                (setting, get_name, set_name, index_args, output_types) = settings[setting]
+                if len(indices) != index_args or len(values) != len(output_types):
+                    raise PyDwfError("Bad snapshot entry for {}.{}: expected {} indices and {} values, got {!r} and {!r}.".format(
+                        name, setting, index_args, len(output_types), indices, values))
+                entry = (instrument, get_name, set_name, list(indices), output_types, list(values))
+                (first_entries if set_name in _SETTINGS_APPLIED_FIRST else other_entries).append(entry)
+
+        num_changes = 0
+        with contextlib.ExitStack() as stack:
+            for entries in (first_entries, other_entries):
+                changes = []
+                for (instrument, get_name, set_name, indices, output_types, values) in entries:
+                    set_values = _SETTINGS_SET_VALUES.get(set_name, list)
+                    current_values = self._get_setting(instrument, get_name, indices, output_types)
+                    if current_values is None or set_values(current_values) != set_values(values):
+                        changes.append((instrument, set_name, indices, set_values(values)))
+                if changes and num_changes == 0:
+                    stack.enter_context(self.configTransaction())
+                for (instrument, set_name, indices, values) in changes:
+                    result = getattr(instrument._functions, set_name)(self._hdwf, *indices, *values)
+                    if result != _RESULT_SUCCESS:
+                        raise self._dwf._exception()
+                num_changes += len(changes)
+
+        return num_changes
+
+    def _setting_indices(self, name: str, index_args: int) -> list:
+        """Return the channel and node indices for which the settings of an instrument with 'index_args' indices exist."""
+        if index_args == 0:
+            return [()]
+        instrument = getattr(self, name)
+        if name in ("analogIn", "analogIO"):
+            channels = range(instrument.channelCount())
+        elif name in ("analogOut", "digitalOut"):
+            channels = range(instrument.count())
+        else:
+            raise PyDwfError("Instrument {!r} has no channels.".format(name))
+        if index_args == 1:
+            return [(channel_index, ) for channel_index in channels]
+        if name == "analogOut":
+            return [(channel_index, node.value) for channel_index in channels for node in instrument.nodeInfo(channel_index)]
+        return [(channel_index, node_index) for channel_index in channels for node_index in range(instrument.channelInfo(channel_index))]
+
+    def _get_setting(self, instrument, get_name: str, indices, output_types) -> Optional[list]:
+        """Read a setting using its Get function, returning its values, or None if the Get function fails."""
+        outputs = [output_type() for output_type in output_types]
+        result = getattr(instrument._functions, get_name)(self._hdwf, *indices, *outputs)
+        if result != _RESULT_SUCCESS:
+            return None
+        return [output.value for output in outputs]
+
+    def _clear_settings_caches(self) -> None:
+        """Discard the cached settings of all instruments, before a device-level change of their settings."""
+        for instrument in (self.analogIn, self.analogOut, self.analogIO, self.digitalIO, self.digitalIn, self.digitalOut, self.analogImpedance):
+            instrument.settings_cache.clear()
+
     def reset(self) -> None:
         """Reset and configure (by default, having auto configure enabled) all device and instrument parameters to default values.
 
         Raises:
             DigilentWaveformsLibraryError: the device cannot be reset.
         """
+        self._clear_settings_caches()
         result = self._dwf._lib.FDwfDeviceReset(self._hdwf)
         if result != _RESULT_SUCCESS:
             raise self._dwf._exception()
@@ -1070,6 +2843,7 @@ class DigilentWaveformsDevice:
         if result != _RESULT_SUCCESS:
             raise self._dwf._exception()
 
+    @_capability
     def triggerInfo(self) -> List[TRIGSRC]:
         """Return the supported trigger source options for the global trigger bus.
 
@@ -1132,6 +2906,7 @@ class DigilentWaveformsDevice:
         if result != _RESULT_SUCCESS:
             raise self._dwf._exception()
 
+    @_capability
     def triggerSlopeInfo(self) -> List[DwfTriggerSlope]:
         """Return the supported trigger slope options.
 
@@ -1152,6 +2927,33 @@ class DigilentWaveformsDevice:
         slope_list = [slope for slope in DwfTriggerSlope if slope_bitset & (1 << slope.value)]
         return slope_list
 
+    @property
+    def capabilities(self) -> DeviceCapabilities:
+        """A snapshot of the capabilities of the device and its instruments.
+
+        The capabilities are the results of the methods that return values that are constant for the opened device
+        configuration, such as the frequencyInfo(), bufferSizeInfo() and channelRangeSteps() methods of the AnalogIn
+        instrument, or the triggerInfo() method of the device. These methods memoize their results, so they only call the
+        library the first time they are called with given arguments.
+
+        Note:
+            This is a convenience property that doesn't directly encapsulate a single function call of the library.
+        """
+        if self._capabilities is None:
+            analogOut = self.analogOut
+            analogIO = self.analogIO
+            digitalOut = self.digitalOut
+            self._capabilities = DeviceCapabilities(
+                device     = _capabilities_of(self),
+                analogIn   = _capabilities_of(self.analogIn, self.analogIn.channelCount),
+                analogOut  = _capabilities_of(analogOut, analogOut.count, analogOut.nodeInfo),
+                analogIO   = _capabilities_of(analogIO, analogIO.channelCount, lambda channel_index: range(analogIO.channelInfo(channel_index))),
+                digitalIO  = _capabilities_of(self.digitalIO),
+                digitalIn  = _capabilities_of(self.digitalIn),
+                digitalOut = _capabilities_of(digitalOut, digitalOut.count)
+            )
+        return self._capabilities
+
     def paramSet(self, parameter: DwfParam, value: int) -> None:
         """Configure a device parameter.
 
@@ -1162,6 +2964,7 @@ class DigilentWaveformsDevice:
         Raises:
             DigilentWaveformsLibraryError: the specified device parameter cannot be set to the specified value.
         """
+        self._clear_settings_caches()
         result = self._dwf._lib.FDwfDeviceParamSet(self._hdwf, parameter.value, value)
         if result != _RESULT_SUCCESS:
             raise self._dwf._exception()
@@ -1190,14 +2993,27 @@ class DigilentWaveformsDevice:
         """Provides wrappers for the 'FDwfAnalogIn' API calls.
 
         Version 3.16.3 of the DWF library has 93 'FDwfAnalogIn' functions, 1 of which (FDwfAnalogInTriggerSourceInfo) is obsolete.
+
+        In addition, the statusDataMulti() convenience method reads the samples of several channels into a single 2D array.
         """
 
         def __init__(self, device: 'DigilentWaveformsDevice') -> None:
             self._device = device
+            self._hdwf = device._hdwf
+            self._functions = device._dwf._function_table("FDwfAnalogIn")
+            self.settings_cache = SettingsCache(self)
+            self._scratch = None  # Reusable sample buffer, used by statusDataMulti() for non-contiguous destinations.
+            self.statistics = AcquisitionStatistics()
+
+        def _scratch_array(self, count: int, dtype: np.dtype) -> np.ndarray:
+            """Return a contiguous scratch array of the given size and dtype, reusing earlier allocations where possible."""
+            if self._scratch is None or self._scratch.dtype != dtype or len(self._scratch) < count:
+                self._scratch = np.empty(count, dtype=dtype)
+            return self._scratch[:count]
 
         def reset(self) -> None:
             """Reset and configure (by default, having auto configure enabled) all AnalogIn instrument parameters to default values."""
-            result = self._device._dwf._lib.FDwfAnalogInReset(self._device._hdwf)
+            result = self._functions.FDwfAnalogInReset(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -1206,13 +3022,13 @@ class DigilentWaveformsDevice:
 
             To reset the Auto trigger timeout, set reconfigure to True.
             """
-            result = self._device._dwf._lib.FDwfAnalogInConfigure(self._device._hdwf, reconfigure, start)
+            result = self._functions.FDwfAnalogInConfigure(self._hdwf, reconfigure, start)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerForce(self) -> None:
             """Force assertion of instrument trigger."""
-            result = self._device._dwf._lib.FDwfAnalogInTriggerForce(self._device._hdwf)
+            result = self._functions.FDwfAnalogInTriggerForce(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -1223,7 +3039,7 @@ class DigilentWaveformsDevice:
             For Single acquisition mode, the data will be read only when the acquisition is finished.
             """
             c_status = _typespec_ctypes.DwfState()
-            result = self._device._dwf._lib.FDwfAnalogInStatus(self._device._hdwf, read_data, c_status)
+            result = self._functions.FDwfAnalogInStatus(self._hdwf, read_data, c_status)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             status_ = DwfState(c_status.value)
@@ -1232,7 +3048,7 @@ class DigilentWaveformsDevice:
         def statusSamplesLeft(self) -> int:
             """Retrieve the number of samples left in the acquisition."""
             c_samples_left = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInStatusSamplesLeft(self._device._hdwf, c_samples_left)
+            result = self._functions.FDwfAnalogInStatusSamplesLeft(self._hdwf, c_samples_left)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             samples_left = c_samples_left.value
@@ -1246,7 +3062,7 @@ class DigilentWaveformsDevice:
             c_sec_utc = _typespec_ctypes.c_unsigned_int()
             c_tick = _typespec_ctypes.c_unsigned_int()
             c_ticks_per_second = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfAnalogInStatusTime(self._device._hdwf, c_sec_utc, c_tick, c_ticks_per_second)
+            result = self._functions.FDwfAnalogInStatusTime(self._hdwf, c_sec_utc, c_tick, c_ticks_per_second)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             sec_utc = c_sec_utc.value
@@ -1261,7 +3077,7 @@ class DigilentWaveformsDevice:
                The actual number of samples transferred and reported back here is equal to max(16, bufferSizeGet()).
             """
             c_samples_valid = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInStatusSamplesValid(self._device._hdwf, c_samples_valid)
+            result = self._functions.FDwfAnalogInStatusSamplesValid(self._hdwf, c_samples_valid)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             samples_valid = c_samples_valid.value
@@ -1273,7 +3089,7 @@ class DigilentWaveformsDevice:
             This is needed in ScanScreen acquisition mode to display the scan bar.
             """
             c_index_write = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInStatusIndexWrite(self._device._hdwf, c_index_write)
+            result = self._functions.FDwfAnalogInStatusIndexWrite(self._hdwf, c_index_write)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             index_write = c_index_write.value
@@ -1282,13 +3098,13 @@ class DigilentWaveformsDevice:
         def statusAutoTriggered(self) -> bool:
             """Verify if the current acquisition is auto triggered."""
             c_auto_triggered = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInStatusAutoTriggered(self._device._hdwf, c_auto_triggered)
+            result = self._functions.FDwfAnalogInStatusAutoTriggered(self._hdwf, c_auto_triggered)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             auto_triggered = bool(c_auto_triggered.value)
             return auto_triggered
 
-        def statusData(self, channel_index: int, count: int) -> np.ndarray:
+        def statusData(self, channel_index: int, count: int, out: Optional[np.ndarray]=None) -> np.ndarray:
             """Retrieve the acquired data samples from the specified channel_index on the AnalogIn instrument.
 
             This function returns samples as voltages, calculated as follows:
@@ -1296,14 +3112,17 @@ class DigilentWaveformsDevice:
             voltages = raw_samples / 65536.0 * analogIn.channelRangeGet(channel_index) + analogIn.channelOffsetGet(channel_index)
 
             Note that the applied calibration is channel-dependent.
+
+            If 'out' is given, the samples are written into it and it is returned; no new array is allocated.
+            It must be a contiguous, writeable np.float64 array of length 'count' (a contiguous slice of a larger array is fine).
             """
-            samples = np.empty(count, dtype=np.float64)
-            result = self._device._dwf._lib.FDwfAnalogInStatusData(self._device._hdwf, channel_index, samples.ctypes.data_as(_typespec_ctypes.c_double_ptr), count)
+            samples = _prepare_output_array(out, count, np.float64)
+            result = self._functions.FDwfAnalogInStatusData(self._hdwf, channel_index, samples.ctypes.data_as(_typespec_ctypes.c_double_ptr), count)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             return samples
 
-        def statusData2(self, channel_index: int, offset: int, count: int) -> np.ndarray:
+        def statusData2(self, channel_index: int, offset: int, count: int, out: Optional[np.ndarray]=None) -> np.ndarray:
             """Retrieve the acquired data samples from the specified AnalogIn instrument channel.
 
             This function returns samples as voltages, calculated as follows:
@@ -1311,50 +3130,140 @@ class DigilentWaveformsDevice:
             voltages = raw_samples / 65536.0 * analogIn.channelRangeGet(channel_index) + analogIn.channelOffsetGet(channel_index)
 
             Note that the applied calibration is channel-dependent.
+
+            If 'out' is given, the samples are written into it and it is returned; no new array is allocated.
+            It must be a contiguous, writeable np.float64 array of length 'count'.
             """
-            samples = np.empty(count, dtype=np.float64)
-            result = self._device._dwf._lib.FDwfAnalogInStatusData2(self._device._hdwf, channel_index, samples.ctypes.data_as(_typespec_ctypes.c_double_ptr), offset, count)
+            samples = _prepare_output_array(out, count, np.float64)
+            result = self._functions.FDwfAnalogInStatusData2(self._hdwf, channel_index, samples.ctypes.data_as(_typespec_ctypes.c_double_ptr), offset, count)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             return samples
 
-        def statusData16(self, channel_index: int, offset: int, count: int) -> np.ndarray:
+        def statusData16(self, channel_index: int, offset: int, count: int, out: Optional[np.ndarray]=None) -> np.ndarray:
             """Retrieve the acquired data samples from the specified AnalogIn instrument channel.
 
             This function returns raw, signed 16-bit samples. To convert these to voltages, use the following:
 
             voltages = raw_samples / 65536.0 * analogIn.channelRangeGet(channel_index) + analogIn.channelOffsetGet(channel_index)
+
+            If 'out' is given, the samples are written into it and it is returned; no new array is allocated.
+            It must be a contiguous, writeable np.int16 array of length 'count'.
             """
-            samples = np.empty(count, dtype=np.int16)
-            result = self._device._dwf._lib.FDwfAnalogInStatusData16(self._device._hdwf, channel_index, samples.ctypes.data_as(_typespec_ctypes.c_short_ptr), offset, count)
+            samples = _prepare_output_array(out, count, np.int16)
+            result = self._functions.FDwfAnalogInStatusData16(self._hdwf, channel_index, samples.ctypes.data_as(_typespec_ctypes.c_short_ptr), offset, count)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             return samples
 
-        def statusNoise(self, channel_index: int, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        def statusNoise(self, channel_index: int, count: int, out: Optional[Tuple[np.ndarray, np.ndarray]]=None) -> Tuple[np.ndarray, np.ndarray]:
             """Retrieve the acquired data samples from the specified channel_index on the AnalogIn instrument.
 
             It copies the data samples to the provided buffer.
+
+            If 'out' is given, it must be a (noise_min, noise_max) tuple of contiguous, writeable np.float64 arrays of length 'count'.
             """
-            noise_min = np.empty(count, dtype=np.float64)
-            noise_max = np.empty(count, dtype=np.float64)
-            result = self._device._dwf._lib.FDwfAnalogInStatusNoise(self._device._hdwf, channel_index, noise_min.ctypes.data_as(_typespec_ctypes.c_double_ptr), noise_max.ctypes.data_as(_typespec_ctypes.c_double_ptr), count)
+            (noise_min, noise_max) = (None, None) if out is None else out
+            noise_min = _prepare_output_array(noise_min, count, np.float64)
+            noise_max = _prepare_output_array(noise_max, count, np.float64)
+            result = self._functions.FDwfAnalogInStatusNoise(self._hdwf, channel_index, noise_min.ctypes.data_as(_typespec_ctypes.c_double_ptr), noise_max.ctypes.data_as(_typespec_ctypes.c_double_ptr), count)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             return (noise_min, noise_max)
 
-        def statusNoise2(self, channel_index: int, offset: int, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        def statusNoise2(self, channel_index: int, offset: int, count: int, out: Optional[Tuple[np.ndarray, np.ndarray]]=None) -> Tuple[np.ndarray, np.ndarray]:
             """Retrieve the acquired data samples from the specified channel_index on the AnalogIn instrument.
 
             It copies the data samples to the provided buffer.
+
+            If 'out' is given, it must be a (noise_min, noise_max) tuple of contiguous, writeable np.float64 arrays of length 'count'.
             """
-            noise_min = np.empty(count, dtype=np.float64)
-            noise_max = np.empty(count, dtype=np.float64)
-            result = self._device._dwf._lib.FDwfAnalogInStatusNoise2(self._device._hdwf, channel_index, noise_min.ctypes.data_as(_typespec_ctypes.c_double_ptr), noise_max.ctypes.data_as(_typespec_ctypes.c_double_ptr), offset, count)
+            (noise_min, noise_max) = (None, None) if out is None else out
+            noise_min = _prepare_output_array(noise_min, count, np.float64)
+            noise_max = _prepare_output_array(noise_max, count, np.float64)
+            result = self._functions.FDwfAnalogInStatusNoise2(self._hdwf, channel_index, noise_min.ctypes.data_as(_typespec_ctypes.c_double_ptr), noise_max.ctypes.data_as(_typespec_ctypes.c_double_ptr), offset, count)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             return (noise_min, noise_max)
 
+        def statusDataMulti(self, channels: Sequence[int], offset: int, count: int, dtype=np.float64, interleaved: bool=True, out: Optional[np.ndarray]=None) -> np.ndarray:
+            """Retrieve the acquired data samples from several AnalogIn instrument channels into a single 2D array.
+
+            Note:
+                This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+            For each channel, the samples are read by a single FDwfAnalogInStatusData2 call (for dtype np.float64, i.e.,
+            voltages) or FDwfAnalogInStatusData16 call (for dtype np.int16, i.e., raw samples), directly into the result array.
+
+            If 'interleaved' is True, the result has shape (count, len(channels)); otherwise it has the planar shape (len(channels), count).
+
+            The DWF library writes the samples of a channel as a contiguous block. For the interleaved layout, the
+            array allocated by this method is therefore stored in column-major (Fortran) order, which makes each channel
+            column contiguous. Use np.ascontiguousarray() on the result if a row-major array is needed.
+
+            If 'out' is given, the samples are written into it and it is returned; no new array is allocated.
+            It must be a writeable array of the requested dtype and shape. Channels whose destination column or row
+            is contiguous are read directly into it; other channels are read into a reusable scratch buffer and copied.
+
+            Args:
+                channels: The AnalogIn channel indices to read.
+                offset: The index of the first sample to read.
+                count: The number of samples to read per channel.
+                dtype: Either np.float64 (samples in Volts) or np.int16 (raw samples).
+                interleaved: Select the (count, channels) layout if True, or the (channels, count) layout if False.
+                out: An optional preallocated destination array.
+
+            Returns:
+                The 2D array of samples.
+
+            Raises:
+                DigilentWaveformsLibraryError: the samples cannot be retrieved.
+                PyDwfError: the dtype is not supported, or the 'out' array is not suitable.
+            """
+            dtype = np.dtype(dtype)
+            if dtype == np.float64:
+                status_data_function = self._functions.FDwfAnalogInStatusData2
+                c_sample_ptr = _typespec_ctypes.c_double_ptr
+            elif dtype == np.int16:
+                status_data_function = self._functions.FDwfAnalogInStatusData16
+                c_sample_ptr = _typespec_ctypes.c_short_ptr
+            else:
+                raise PyDwfError("Unsupported sample dtype {}, expected float64 or int16.".format(dtype))
+
+            num_channels = len(channels)
+            shape = (count, num_channels) if interleaved else (num_channels, count)
+
+            if out is None:
+                out = np.empty((num_channels, count), dtype=dtype)
+                if interleaved:
+                    out = out.T
+            else:
+                if not isinstance(out, np.ndarray):
+                    raise PyDwfError("Output buffer must be a numpy array, got {!r}.".format(type(out).__name__))
+                if out.dtype != dtype:
+                    raise PyDwfError("Output buffer has dtype {}, expected {}.".format(out.dtype, dtype))
+                if out.shape != shape:
+                    raise PyDwfError("Output buffer has shape {}, expected {}.".format(out.shape, shape))
+                if not out.flags.writeable:
+                    raise PyDwfError("Output buffer must be writeable.")
+
+            hdwf = self._hdwf
+
+            for (k, channel_index) in enumerate(channels):
+                destination = out[:, k] if interleaved else out[k]
+                if destination.flags.c_contiguous:
+                    result = status_data_function(hdwf, channel_index, destination.ctypes.data_as(c_sample_ptr), offset, count)
+                    if result != _RESULT_SUCCESS:
+                        raise self._device._dwf._exception()
+                else:
+                    scratch = self._scratch_array(count, dtype)
+                    result = status_data_function(hdwf, channel_index, scratch.ctypes.data_as(c_sample_ptr), offset, count)
+                    if result != _RESULT_SUCCESS:
+                        raise self._device._dwf._exception()
+                    destination[...] = scratch
+
+            return out
+
         def statusSample(self, channel_index: int) -> float:
             """Get the last ADC conversion sample from the specified AnalogIn instrument channel, in Volt.
 
@@ -1362,7 +3271,7 @@ class DigilentWaveformsDevice:
                   which inhibits transfer of bulk sample data.
             """
             c_sample = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInStatusSample(self._device._hdwf, channel_index, c_sample)
+            result = self._functions.FDwfAnalogInStatusSample(self._hdwf, channel_index, c_sample)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             sample = c_sample.value
@@ -1380,7 +3289,7 @@ class DigilentWaveformsDevice:
             c_dataAvailable = _typespec_ctypes.c_int()
             c_dataLost = _typespec_ctypes.c_int()
             c_dataCorrupt = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInStatusRecord(self._device._hdwf, c_dataAvailable, c_dataLost, c_dataCorrupt)
+            result = self._functions.FDwfAnalogInStatusRecord(self._hdwf, c_dataAvailable, c_dataLost, c_dataCorrupt)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             dataAvailable = c_dataAvailable.value
@@ -1388,6 +3297,422 @@ class DigilentWaveformsDevice:
             dataCorrupt = c_dataCorrupt.value
             return (dataAvailable, dataLost, dataCorrupt)
 
+        def _record_polls(self, poll_interval: float=0.0, scheduler: Optional[PollScheduler]=None, should_stop: Optional[Callable[[], bool]]=None) -> Iterator[Tuple[int, int, int, bool]]:
+            """Poll a running record acquisition until it is done.
+
+            For each poll, the instrument status is fetched (including its sample data) and an
+            (available, lost, corrupt, done) tuple is yielded. The caller should read the available samples before
+            resuming the generator. If a 'scheduler' is given, it determines when to poll; otherwise, if 'poll_interval'
+            is nonzero, the generator sleeps that many seconds between polls.
+
+            If a 'should_stop' function is given, it is called before each poll; if it returns True, the acquisition
+            is stopped and the generator returns, even if the instrument is still waiting for its trigger.
+
+            This is the inner loop of all record-mode acquisitions, so it calls the library directly, reusing its
+            ctypes variables, rather than going through the status() and statusRecord() methods.
+            """
+            functions = self._functions
+            hdwf = self._hdwf
+            c_status = _typespec_ctypes.DwfState()
+            c_available = _typespec_ctypes.c_int()
+            c_lost = _typespec_ctypes.c_int()
+            c_corrupt = _typespec_ctypes.c_int()
+            done_value = DwfState.Done.value
+
+            statistics = self.statistics if self.statistics.enabled else None
+
+            while True:
+                if scheduler is not None:
+                    scheduler.wait()
+                if should_stop is not None and should_stop():
+                    self.configure(False, False)
+                    return
+                if statistics is not None:
+                    t0 = time.perf_counter()
+                if functions.FDwfAnalogInStatus(hdwf, True, c_status) != _RESULT_SUCCESS:
+                    raise self._device._dwf._exception()
+                if statistics is not None:
+                    t1 = time.perf_counter()
+                if functions.FDwfAnalogInStatusRecord(hdwf, c_available, c_lost, c_corrupt) != _RESULT_SUCCESS:
+                    raise self._device._dwf._exception()
+                if statistics is not None:
+                    statistics.recordPoll(t1 - t0, c_available.value, c_lost.value, c_corrupt.value)
+                if scheduler is not None:
+                    scheduler.update(c_lost.value, c_corrupt.value)
+                done = (c_status.value == done_value)
+                yield (c_available.value, c_lost.value, c_corrupt.value, done)
+                if done:
+                    return
+                if scheduler is None and poll_interval > 0.0:
+                    time.sleep(poll_interval)
+
+        def recordStream(self, channels: Sequence[int], chunk_hint: Optional[int]=None, dtype=np.float64, start: bool=True, poll_interval: float=0.0, allocate: Optional[Callable[[int], np.ndarray]]=None, scheduler: Optional[PollScheduler]=None, should_stop: Optional[Callable[[], bool]]=None) -> Iterator[RecordChunk]:
+            """Perform a record-mode acquisition, yielding the acquired samples as a stream of chunks.
+
+            Note:
+                This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+            The instrument should be configured for record mode (see acquisitionModeSet() and recordLengthSet())
+            before the stream is started. The generator polls the instrument until it reports DwfState.Done.
+
+            Each chunk holds the samples of all requested channels as a (count, len(channels)) array, laid out as
+            returned by statusDataMulti(). Samples that were reported lost by statusRecord() are represented by NaN
+            (for dtype np.float64) or 0 (for dtype np.int16) placeholder samples, and are counted in the chunk's
+            'lost' field.
+
+            If 'chunk_hint' is None, a chunk is yielded for each poll that delivered new samples, containing
+            all samples that were available. Otherwise, chunks of exactly 'chunk_hint' samples are yielded, except
+            for the last chunk, which holds the remainder.
+
+            Every chunk is a freshly allocated array that the caller may keep, unless an 'allocate' function is given.
+            In that case, it is called with a sample count to provide the (count, len(channels)) destination array for
+            the next chunk. This allows the samples to be read directly into their final location (e.g., a memory-mapped file).
+
+            Args:
+                channels: The AnalogIn channel indices to read.
+                chunk_hint: The number of samples per chunk, or None to yield the samples as they become available.
+                dtype: Either np.float64 (samples in Volts) or np.int16 (raw samples).
+                start: If True, start the acquisition by calling configure(False, True) before polling.
+                poll_interval: Time to sleep between polls, in seconds. If zero, the instrument is polled continuously.
+                allocate: Optional function that provides the sample array for each chunk.
+                scheduler: Optional PollScheduler that determines when to poll; it takes precedence over 'poll_interval'.
+                should_stop: Optional function that is called before each poll; if it returns True, the acquisition is stopped
+                             and the stream ends after the samples acquired so far.
+
+            Yields:
+                RecordChunk tuples.
+
+            Raises:
+                DigilentWaveformsLibraryError: the acquisition failed.
+                PyDwfError: the dtype or chunk size is not supported.
+            """
+            return self._record_stream(channels, chunk_hint, dtype, start, allocate, self._record_polls(poll_interval, scheduler, should_stop))
+
+        def _record_stream(self, channels: Sequence[int], chunk_hint: Optional[int], dtype, start: bool, allocate: Optional[Callable[[int], np.ndarray]],
+                           polls: Iterator[Optional[Tuple[int, int, int, bool]]]) -> Iterator[Optional[RecordChunk]]:
+            """Turn the given polls of a record-mode acquisition into a stream of chunks, as described for recordStream()."""
+            dtype = np.dtype(dtype)
+            if dtype not in (np.float64, np.int16):
+                raise PyDwfError("Unsupported sample dtype {}, expected float64 or int16.".format(dtype))
+            if chunk_hint is not None and chunk_hint <= 0:
+                raise PyDwfError("Bad chunk size: {!r}.".format(chunk_hint))
+
+            fill_value = np.nan if dtype == np.float64 else 0
+            num_channels = len(channels)
+            status_data_multi = self.statusDataMulti
+
+            if allocate is None:
+                def allocate(count: int) -> np.ndarray:
+                    return np.empty((num_channels, count), dtype=dtype).T
+
+            statistics = self.statistics if self.statistics.enabled else None
+
+            def read(offset: int, count: int, out: np.ndarray) -> None:
+                if statistics is None:
+                    status_data_multi(channels, offset, count, dtype, True, out)
+                else:
+                    t0 = time.perf_counter()
+                    status_data_multi(channels, offset, count, dtype, True, out)
+                    statistics.recordRead(time.perf_counter() - t0)
+
+            if start:
+                self.configure(False, True)
+
+            return _record_chunks(polls, allocate, read, fill_value, chunk_hint)
+
+        def recordCapture(self, channels: Sequence[int], dtype=np.float64, start: bool=True, scheduler: Optional[PollScheduler]=None) -> AnalogInRecording:
+            """Perform a record-mode acquisition of the configured record length, and return the samples.
+
+            Note:
+                This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+            The instrument should be configured for record mode with a nonzero record length before calling this method.
+
+            The device generally delivers more samples than the requested record length; only the last
+            round(recordLengthGet() * frequencyGet()) samples constitute the recording. This method reads the samples
+            directly into a ring buffer of exactly that size, overwriting the oldest samples as it goes. Once the
+            acquisition is done, the ring buffer is rotated in place, so that the samples are returned in order
+            without needing a second copy of the recording.
+
+            Samples that were reported lost are represented by NaN (for dtype np.float64) or 0 (for dtype np.int16).
+
+            The samples are returned as a (count, len(channels)) array in column-major order, as statusDataMulti() does.
+            If the instrument is triggered, the 'time_of_first_sample' of the result is obtained from
+            triggerPositionStatus(); otherwise it is zero.
+
+            Args:
+                channels: The AnalogIn channel indices to read.
+                dtype: Either np.float64 (samples in Volts) or np.int16 (raw samples).
+                start: If True, start the acquisition by calling configure(False, True) before polling.
+                scheduler: Optional PollScheduler that determines when to poll. By default, the instrument is polled continuously.
+
+            Returns:
+                The recording.
+
+            Raises:
+                DigilentWaveformsLibraryError: the acquisition failed.
+                PyDwfError: the record length is not set, or the dtype is not supported.
+            """
+            (recording, lost) = self._record_capture(channels, dtype, start, scheduler)
+            return recording
+
+        def _record_capture(self, channels: Sequence[int], dtype, start: bool, scheduler: Optional[PollScheduler]) -> Tuple[AnalogInRecording, Optional[np.ndarray]]:
+            """Perform the acquisition of recordCapture(), also returning a boolean array that marks the lost samples.
+
+            The array is None if no samples were lost.
+            """
+            dtype = np.dtype(dtype)
+            if dtype not in (np.float64, np.int16):
+                raise PyDwfError("Unsupported sample dtype {}, expected float64 or int16.".format(dtype))
+
+            sample_frequency = self.frequencyGet()
+            num_samples = round(self.recordLengthGet() * sample_frequency)
+            if num_samples <= 0:
+                raise PyDwfError("Record capture requires a nonzero record length.")
+
+            fill_value = np.nan if dtype == np.float64 else 0
+            ring = np.empty((len(channels), num_samples), dtype=dtype)
+            lost_ring = None  # Marks the lost samples in the ring buffer, once samples are lost.
+            status_data_multi = self.statusDataMulti
+            statistics = self.statistics if self.statistics.enabled else None
+
+            total = 0  # Total number of samples written to the ring buffer, including lost samples.
+            total_lost = total_corrupt = 0
+
+            if start:
+                self.configure(False, True)
+
+            for (available, lost, corrupt, done) in self._record_polls(scheduler=scheduler):
+
+                total_lost += lost
+                total_corrupt += corrupt
+
+                # Write placeholders for the lost samples. Only the last 'num_samples' of them can end up in the recording.
+                skip = max(0, lost - num_samples)
+                total += skip
+                lost -= skip
+                if lost != 0 and lost_ring is None:
+                    lost_ring = np.zeros((1, num_samples), dtype=np.bool_)
+                while lost != 0:
+                    position = total % num_samples
+                    n = min(lost, num_samples - position)
+                    ring[:, position:position + n] = fill_value
+                    lost_ring[0, position:position + n] = True
+                    total += n
+                    lost -= n
+
+                # Read the available samples. If there are more than fit in the ring buffer, skip the oldest ones.
+                offset = max(0, available - num_samples)
+                total += offset
+                while offset != available:
+                    position = total % num_samples
+                    n = min(available - offset, num_samples - position)
+                    if lost_ring is not None:
+                        lost_ring[0, position:position + n] = False
+                    if statistics is None:
+                        status_data_multi(channels, offset, n, dtype, False, ring[:, position:position + n])
+                    else:
+                        t0 = time.perf_counter()
+                        status_data_multi(channels, offset, n, dtype, False, ring[:, position:position + n])
+                        statistics.recordRead(time.perf_counter() - t0)
+                    total += n
+                    offset += n
+
+            if total < num_samples:
+                # The acquisition delivered fewer samples than expected.
+                ring = ring[:, :total]
+                if lost_ring is not None:
+                    lost_ring = lost_ring[:, :total]
+            else:
+                # Rotate the ring buffer, so that the oldest sample comes first.
+                _rotate_rows_left(ring, total % num_samples)
+                if lost_ring is not None:
+                    _rotate_rows_left(lost_ring, total % num_samples)
+
+            if self.triggerSourceGet() != TRIGSRC.None_:
+                time_of_first_sample = self.triggerPositionStatus()
+            else:
+                time_of_first_sample = 0.0
+
+            recording = AnalogInRecording(ring.T, sample_frequency, time_of_first_sample, total_lost, total_corrupt)
+            return (recording, None if lost_ring is None or not lost_ring.any() else lost_ring[0])
+
+        def _poll_interval(self, fill_fraction: float) -> float:
+            """Return the time it takes for the acquisition to fill the given fraction of the instrument's buffer, in seconds."""
+            return fill_fraction * self.bufferSizeGet() / self.frequencyGet()
+
+        async def acquireSingleAsync(self, channels: Sequence[int], dtype=np.float64, start: bool=True) -> np.ndarray:
+            """Perform a single acquisition, and return the samples of the selected channels.
+
+            Note:
+                This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+            This is a coroutine. The library calls are made on the device's executor thread, so they don't block the
+            event loop. In between calls to status(), the coroutine sleeps for a quarter of the time it takes to
+            fill the instrument's buffer (limited to the range 1 ms .. 100 ms), rather than polling continuously.
+
+            The instrument should be configured for single acquisition mode before calling this method.
+
+            Args:
+                channels: The AnalogIn channel indices to read.
+                dtype: Either np.float64 (samples in Volts) or np.int16 (raw samples).
+                start: If True, start the acquisition by calling configure(False, True) before polling.
+
+            Returns:
+                A (bufferSize, len(channels)) array of samples, as returned by statusDataMulti().
+
+            Raises:
+                DigilentWaveformsLibraryError: the acquisition failed.
+            """
+            # Imported here, since most users of the library don't need it.
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+            executor = self._device._async_executor()
+
+            buffer_size = await loop.run_in_executor(executor, self.bufferSizeGet)
+            poll_interval = await loop.run_in_executor(executor, self._poll_interval, 0.25)
+            poll_interval = min(max(poll_interval, 0.001), 0.100)
+
+            if start:
+                await loop.run_in_executor(executor, self.configure, False, True)
+
+            while await loop.run_in_executor(executor, self.status, True) != DwfState.Done:
+                await asyncio.sleep(poll_interval)
+
+            return await loop.run_in_executor(executor, self.statusDataMulti, channels, 0, buffer_size, dtype)
+
+        async def recordStreamAsync(self, channels: Sequence[int], chunk_hint: Optional[int]=None, dtype=np.float64, start: bool=True, fill_fraction: float=0.5):
+            """Perform a record-mode acquisition, yielding the acquired samples as an asynchronous stream of chunks.
+
+            Note:
+                This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+            This is the async counterpart of recordStream(), to be used as 'async for chunk in analogIn.recordStreamAsync(...)'.
+            The library calls are made on the device's executor thread, so they don't block the event loop. The polls are
+            scheduled by a PollScheduler that targets the given fill fraction of the instrument's buffer; in between
+            polls, the coroutine waits on the event loop, so the executor remains available to other async calls to the device.
+
+            If the consumer stops iterating before the acquisition is done, the instrument is stopped.
+
+            Args:
+                channels: The AnalogIn channel indices to read.
+                chunk_hint: The number of samples per chunk, or None to yield the samples as they become available.
+                dtype: Either np.float64 (samples in Volts) or np.int16 (raw samples).
+                start: If True, start the acquisition by calling configure(False, True) before polling.
+                fill_fraction: The target fraction of the instrument's buffer that fills up between polls.
+
+            Yields:
+                RecordChunk tuples.
+
+            Raises:
+                DigilentWaveformsLibraryError: the acquisition failed.
+                PyDwfError: the dtype is not supported.
+            """
+            # Imported here, since most users of the library don't need it.
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+            executor = self._device._async_executor()
+
+            scheduler = await loop.run_in_executor(executor, PollScheduler.forAnalogIn, self, fill_fraction)
+            polls = _paced_polls(self._record_polls(scheduler=scheduler))
+            stream = await loop.run_in_executor(executor, self._record_stream, channels, chunk_hint, dtype, start, None, polls)
+
+            end = object()
+            done = False
+            try:
+                while True:
+                    chunk = await loop.run_in_executor(executor, next, stream, end)
+                    if chunk is end:
+                        done = True
+                        return
+                    if chunk is None:
+                        # The next poll is pending; wait until it is due, so the scheduler doesn't sleep on the executor.
+                        delay = scheduler.delay()
+                        while delay > 0.0:
+                            await asyncio.sleep(delay)
+                            delay = scheduler.delay()
+                        continue
+                    yield chunk
+            finally:
+                await loop.run_in_executor(executor, stream.close)
+                if not done:
+                    await loop.run_in_executor(executor, self.configure, False, False)
+
+        def channelScaling(self, channels: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+            """Get the scale and offset that convert raw samples of the given channels to Volts.
+
+            Note:
+                This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+            The raw samples, as returned by statusData16(), span the channel range over the full 16-bit interval.
+            The voltage of a raw sample is therefore raw * (range / 65536) + offset.
+
+            Args:
+                channels: The AnalogIn channel indices.
+
+            Returns:
+                The per-channel scale factors and offsets, as float64 arrays.
+
+            Raises:
+                DigilentWaveformsLibraryError: the channel settings cannot be retrieved.
+            """
+            scale = np.array([self.channelRangeGet(channel_index) for channel_index in channels]) / 65536.0
+            offset = np.array([self.channelOffsetGet(channel_index) for channel_index in channels], dtype=np.float64)
+            return (scale, offset)
+
+        def statusDataRaw(self, channels: Sequence[int], offset: int, count: int) -> AnalogInRawSamples:
+            """Retrieve the acquired data samples from several AnalogIn instrument channels as raw 16-bit samples.
+
+            Note:
+                This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+            The samples are read using statusDataMulti() with dtype np.int16, and returned together with the scale and
+            offset of each channel, which are queried with every call. Conversion to Volts is deferred until requested.
+
+            Args:
+                channels: The AnalogIn channel indices to read.
+                offset: The index of the first sample to read.
+                count: The number of samples to read per channel.
+
+            Returns:
+                The raw samples.
+
+            Raises:
+                DigilentWaveformsLibraryError: the samples or channel settings cannot be retrieved.
+            """
+            (scale, channel_offset) = self.channelScaling(channels)
+            raw = self.statusDataMulti(channels, offset, count, np.int16)
+            return AnalogInRawSamples(raw, scale, channel_offset)
+
+        def recordCaptureRaw(self, channels: Sequence[int], start: bool=True, scheduler: Optional[PollScheduler]=None) -> AnalogInRecording:
+            """Perform a record-mode acquisition of the configured record length, and return the raw samples.
+
+            Note:
+                This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+            This behaves as recordCapture() with dtype np.int16, but the 'samples' of the returned recording are an
+            AnalogInRawSamples instance, holding the scale and offset of each channel as they were when the acquisition
+            started. Lost samples are represented by raw value 0, and are marked in the 'lost' array of the samples,
+            so they convert to NaN, as in the recording returned by recordCapture() with dtype np.float64.
+
+            Args:
+                channels: The AnalogIn channel indices to read.
+                start: If True, start the acquisition by calling configure(False, True) before polling.
+                scheduler: Optional PollScheduler that determines when to poll. By default, the instrument is polled continuously.
+
+            Returns:
+                The recording.
+
+            Raises:
+                DigilentWaveformsLibraryError: the acquisition failed.
+                PyDwfError: the record length is not set.
+            """
+            (scale, offset) = self.channelScaling(channels)
+            (recording, lost) = self._record_capture(channels, np.int16, start, scheduler)
+            return recording._replace(samples=AnalogInRawSamples(recording.samples, scale, offset, lost))
+
         # Acquisition configuration:
 
         def recordLengthSet(self, length: float) -> None:
@@ -1395,24 +3720,25 @@ class DigilentWaveformsDevice:
 
             With length of zero, the recording will run indefinitely.
             """
-            result = self._device._dwf._lib.FDwfAnalogInRecordLengthSet(self._device._hdwf, length)
+            result = self._functions.FDwfAnalogInRecordLengthSet(self._hdwf, length)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def recordLengthGet(self) -> float:
             """Get the current Record length in seconds."""
             c_length = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInRecordLengthGet(self._device._hdwf, c_length)
+            result = self._functions.FDwfAnalogInRecordLengthGet(self._hdwf, c_length)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             length = c_length.value
             return length
 
+        @_capability
         def frequencyInfo(self) -> Tuple[float, float]:
             """Retrieve the minimum and maximum configurable ADC sample frequency, in Hz"""
             c_frequency_min = _typespec_ctypes.c_double()
             c_frequency_max = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInFrequencyInfo(self._device._hdwf, c_frequency_min, c_frequency_max)
+            result = self._functions.FDwfAnalogInFrequencyInfo(self._hdwf, c_frequency_min, c_frequency_max)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             frequency_min = c_frequency_min.value
@@ -1421,7 +3747,7 @@ class DigilentWaveformsDevice:
 
         def frequencySet(self, sample_frequency: float) -> None:
             """Set the sample frequency for the instrument."""
-            result = self._device._dwf._lib.FDwfAnalogInFrequencySet(self._device._hdwf, sample_frequency)
+            result = self._functions.FDwfAnalogInFrequencySet(self._hdwf, sample_frequency)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -1432,26 +3758,28 @@ class DigilentWaveformsDevice:
             individually configured for each channel with the `channelFilterSet` function.
             """
             c_sample_frequency = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInFrequencyGet(self._device._hdwf, c_sample_frequency)
+            result = self._functions.FDwfAnalogInFrequencyGet(self._hdwf, c_sample_frequency)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             sample_frequency = c_sample_frequency.value
             return sample_frequency
 
+        @_capability
         def bitsInfo(self) -> int:
             """Retrieve the number of bits used by the AnalogIn ADC."""
             c_num_bits = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInBitsInfo(self._device._hdwf, c_num_bits)
+            result = self._functions.FDwfAnalogInBitsInfo(self._hdwf, c_num_bits)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             num_bits = c_num_bits.value
             return num_bits
 
+        @_capability
         def bufferSizeInfo(self) -> Tuple[int, int]:
             """Returns the minimum and maximum allowable buffer size for the instrument, in samples."""
             c_buffer_size_min = _typespec_ctypes.c_int()
             c_buffer_size_max = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInBufferSizeInfo(self._device._hdwf, c_buffer_size_min, c_buffer_size_max)
+            result = self._functions.FDwfAnalogInBufferSizeInfo(self._hdwf, c_buffer_size_min, c_buffer_size_max)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             buffer_size_min = c_buffer_size_min.value
@@ -1464,14 +3792,14 @@ class DigilentWaveformsDevice:
             The actual buffer size configured will be clipped by the bufferSizeInfo() values.
             The actual value configured can be read back by calling bufferSizeGet().
             """
-            result = self._device._dwf._lib.FDwfAnalogInBufferSizeSet(self._device._hdwf, buffer_size)
+            result = self._functions.FDwfAnalogInBufferSizeSet(self._hdwf, buffer_size)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def bufferSizeGet(self) -> int:
             """Return the used AnalogIn instrument buffer size, in samples."""
             c_buffer_size = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInBufferSizeGet(self._device._hdwf, c_buffer_size)
+            result = self._functions.FDwfAnalogInBufferSizeGet(self._hdwf, c_buffer_size)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             buffer_size = c_buffer_size.value
@@ -1480,7 +3808,7 @@ class DigilentWaveformsDevice:
         def noiseSizeInfo(self) -> int:
             """Return the maximum noise buffer size for the AnalogIn instrument, in samples."""
             c_nSizeMax = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInNoiseSizeInfo(self._device._hdwf, c_nSizeMax)
+            result = self._functions.FDwfAnalogInNoiseSizeInfo(self._hdwf, c_nSizeMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             nSizeMax = c_nSizeMax.value
@@ -1496,7 +3824,7 @@ class DigilentWaveformsDevice:
 
                   If enabled, the noise buffer size is always the size of the regular (sample) buffer divided by 8.
             """
-            result = self._device._dwf._lib.FDwfAnalogInNoiseSizeSet(self._device._hdwf, int(enable_noise_buffer))
+            result = self._functions.FDwfAnalogInNoiseSizeSet(self._hdwf, int(enable_noise_buffer))
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -1507,12 +3835,13 @@ class DigilentWaveformsDevice:
             size of 8192 and noise buffer size of 512, setting the sample buffer size to 4096 the noise buffer size will be 256.
             """
             c_noise_buffer_size = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInNoiseSizeGet(self._device._hdwf, c_noise_buffer_size)
+            result = self._functions.FDwfAnalogInNoiseSizeGet(self._hdwf, c_noise_buffer_size)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             noise_buffer_size = c_noise_buffer_size.value
             return noise_buffer_size
 
+        @_capability
         def acquisitionModeInfo(self) -> List[ACQMODE]:
             """Return the supported AnalogIn acquisition modes.
 
@@ -1537,7 +3866,7 @@ class DigilentWaveformsDevice:
             """
 
             c_acquisition_mode_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInAcquisitionModeInfo(self._device._hdwf, c_acquisition_mode_bitset)
+            result = self._functions.FDwfAnalogInAcquisitionModeInfo(self._hdwf, c_acquisition_mode_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             acquisition_mode_bitset = c_acquisition_mode_bitset.value
@@ -1546,14 +3875,14 @@ class DigilentWaveformsDevice:
 
         def acquisitionModeSet(self, acquisition_mode: ACQMODE) -> None:
             """Set the acquisition mode."""
-            result = self._device._dwf._lib.FDwfAnalogInAcquisitionModeSet(self._device._hdwf, acquisition_mode.value)
+            result = self._functions.FDwfAnalogInAcquisitionModeSet(self._hdwf, acquisition_mode.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def acquisitionModeGet(self) -> ACQMODE:
             """Get the acquisition mode."""
             c_acquisition_mode = _typespec_ctypes.ACQMODE()
-            result = self._device._dwf._lib.FDwfAnalogInAcquisitionModeGet(self._device._hdwf, c_acquisition_mode)
+            result = self._functions.FDwfAnalogInAcquisitionModeGet(self._hdwf, c_acquisition_mode)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             acquisition_mode = ACQMODE(c_acquisition_mode.value)
@@ -1561,10 +3890,11 @@ class DigilentWaveformsDevice:
 
         # Channel configuration:
 
+        @_capability
         def channelCount(self) -> int:
             """Read the number of AnalogIn channels of the device."""
             c_channel_count = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInChannelCount(self._device._hdwf, c_channel_count)
+            result = self._functions.FDwfAnalogInChannelCount(self._hdwf, c_channel_count)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             channel_count = c_channel_count.value
@@ -1572,22 +3902,23 @@ class DigilentWaveformsDevice:
 
         def channelEnableSet(self, channel_index: int, enable: bool) -> None:
             """Enable or disable the specified AnalogIn channel."""
-            result = self._device._dwf._lib.FDwfAnalogInChannelEnableSet(self._device._hdwf, channel_index, enable)
+            result = self._functions.FDwfAnalogInChannelEnableSet(self._hdwf, channel_index, enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def channelEnableGet(self, channel_index: int) -> bool:
             """Get the current enable/disable status of the specified AnalogIn channel."""
             c_enable = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInChannelEnableGet(self._device._hdwf, channel_index, c_enable)
+            result = self._functions.FDwfAnalogInChannelEnableGet(self._hdwf, channel_index, c_enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             enable = bool(c_enable.value)
             return enable
 
+        @_capability
         def channelFilterInfo(self) -> List[FILTER]:
             c_filter_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInChannelFilterInfo(self._device._hdwf, c_filter_bitset)
+            result = self._functions.FDwfAnalogInChannelFilterInfo(self._hdwf, c_filter_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             filter_bitset = c_filter_bitset.value
@@ -1595,24 +3926,25 @@ class DigilentWaveformsDevice:
             return filter_list
 
         def channelFilterSet(self, channel_index: int, filter_: FILTER) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInChannelFilterSet(self._device._hdwf, channel_index, filter_.value)
+            result = self._functions.FDwfAnalogInChannelFilterSet(self._hdwf, channel_index, filter_.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def channelFilterGet(self, channel_index: int) -> FILTER:
             c_filter = _typespec_ctypes.FILTER()
-            result = self._device._dwf._lib.FDwfAnalogInChannelFilterGet(self._device._hdwf, channel_index, c_filter)
+            result = self._functions.FDwfAnalogInChannelFilterGet(self._hdwf, channel_index, c_filter)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             filter_ = FILTER(c_filter.value)
             return filter_
 
+        @_capability
         def channelRangeInfo(self) -> Tuple[float, float, float]:
             """Return the actual, calibrated range of the channel."""
             c_voltsMin = _typespec_ctypes.c_double()
             c_voltsMax = _typespec_ctypes.c_double()
             c_nSteps = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInChannelRangeInfo(self._device._hdwf, c_voltsMin, c_voltsMax, c_nSteps)
+            result = self._functions.FDwfAnalogInChannelRangeInfo(self._hdwf, c_voltsMin, c_voltsMax, c_nSteps)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             voltsMin = c_voltsMin.value
@@ -1620,6 +3952,7 @@ class DigilentWaveformsDevice:
             nSteps = c_nSteps.value
             return (voltsMin, voltsMax, nSteps)
 
+        @_capability
         def channelRangeSteps(self) -> List[float]:
             """Return the configurable ranges of the channel, in Volt.
 
@@ -1627,7 +3960,7 @@ class DigilentWaveformsDevice:
             """
             c_rgVoltsStep = _typespec_ctypes.c_double_array_32()
             c_nSteps = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInChannelRangeSteps(self._device._hdwf, c_rgVoltsStep, c_nSteps)
+            result = self._functions.FDwfAnalogInChannelRangeSteps(self._hdwf, c_rgVoltsStep, c_nSteps)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             nSteps = c_nSteps.value
@@ -1636,14 +3969,14 @@ class DigilentWaveformsDevice:
 
         def channelRangeSet(self, channel_index: int, voltsRange: float) -> None:
             """Set the range setting of the channel, in Volt."""
-            result = self._device._dwf._lib.FDwfAnalogInChannelRangeSet(self._device._hdwf, channel_index, voltsRange)
+            result = self._functions.FDwfAnalogInChannelRangeSet(self._hdwf, channel_index, voltsRange)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def channelRangeGet(self, channel_index: int) -> float:
             """Get the range setting of the channel, in Volt."""
             c_voltsRange = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInChannelRangeGet(self._device._hdwf, channel_index, c_voltsRange)
+            result = self._functions.FDwfAnalogInChannelRangeGet(self._hdwf, channel_index, c_voltsRange)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             voltsRange = c_voltsRange.value
@@ -1654,7 +3987,7 @@ class DigilentWaveformsDevice:
             c_voltsMin = _typespec_ctypes.c_double()
             c_voltsMax = _typespec_ctypes.c_double()
             c_nSteps = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInChannelOffsetInfo(self._device._hdwf, c_voltsMin, c_voltsMax, c_nSteps)
+            result = self._functions.FDwfAnalogInChannelOffsetInfo(self._hdwf, c_voltsMin, c_voltsMax, c_nSteps)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             voltsMin = c_voltsMin.value
@@ -1664,52 +3997,52 @@ class DigilentWaveformsDevice:
 
         def channelOffsetSet(self, channel_index: int, voltOffset: float) -> None:
             """Set the channel offset, in Volt."""
-            result = self._device._dwf._lib.FDwfAnalogInChannelOffsetSet(self._device._hdwf, channel_index, voltOffset)
+            result = self._functions.FDwfAnalogInChannelOffsetSet(self._hdwf, channel_index, voltOffset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def channelOffsetGet(self, channel_index: int) -> float:
             c_voltOffset = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInChannelOffsetGet(self._device._hdwf, channel_index, c_voltOffset)
+            result = self._functions.FDwfAnalogInChannelOffsetGet(self._hdwf, channel_index, c_voltOffset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             voltOffset = c_voltOffset.value
             return voltOffset
 
         def channelAttenuationSet(self, channel_index: int, attenuation: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInChannelAttenuationSet(self._device._hdwf, channel_index, attenuation)
+            result = self._functions.FDwfAnalogInChannelAttenuationSet(self._hdwf, channel_index, attenuation)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def channelAttenuationGet(self, channel_index: int) -> float:
             c_attenuation = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInChannelAttenuationGet(self._device._hdwf, channel_index, c_attenuation)
+            result = self._functions.FDwfAnalogInChannelAttenuationGet(self._hdwf, channel_index, c_attenuation)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             attenuation = c_attenuation.value
             return attenuation
 
         def channelBandwidthSet(self, channel_index: int, bandwidth: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInChannelBandwidthSet(self._device._hdwf, channel_index, bandwidth)
+            result = self._functions.FDwfAnalogInChannelBandwidthSet(self._hdwf, channel_index, bandwidth)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def channelBandwidthGet(self, channel_index: int) -> float:
             c_bandwidth = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInChannelBandwidthGet(self._device._hdwf, channel_index, c_bandwidth)
+            result = self._functions.FDwfAnalogInChannelBandwidthGet(self._hdwf, channel_index, c_bandwidth)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             bandwidth = c_bandwidth.value
             return bandwidth
 
         def channelImpedanceSet(self, channel_index: int, impedance: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInChannelImpedanceSet(self._device._hdwf, channel_index, impedance)
+            result = self._functions.FDwfAnalogInChannelImpedanceSet(self._hdwf, channel_index, impedance)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def channelImpedanceGet(self, channel_index: int) -> float:
             c_impedance = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInChannelImpedanceGet(self._device._hdwf, channel_index, c_impedance)
+            result = self._functions.FDwfAnalogInChannelImpedanceGet(self._hdwf, channel_index, c_impedance)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             impedance = c_impedance.value
@@ -1718,13 +4051,13 @@ class DigilentWaveformsDevice:
         # Trigger configuration:
 
         def triggerSourceSet(self, trigger_source: TRIGSRC) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInTriggerSourceSet(self._device._hdwf, trigger_source.value)
+            result = self._functions.FDwfAnalogInTriggerSourceSet(self._hdwf, trigger_source.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerSourceGet(self) -> TRIGSRC:
             c_trigger_source = _typespec_ctypes.TRIGSRC()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerSourceGet(self._device._hdwf, c_trigger_source)
+            result = self._functions.FDwfAnalogInTriggerSourceGet(self._hdwf, c_trigger_source)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_source = TRIGSRC(c_trigger_source.value)
@@ -1734,7 +4067,7 @@ class DigilentWaveformsDevice:
             c_secMin = _typespec_ctypes.c_double()
             c_secMax = _typespec_ctypes.c_double()
             c_nSteps = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerPositionInfo(self._device._hdwf, c_secMin, c_secMax, c_nSteps)
+            result = self._functions.FDwfAnalogInTriggerPositionInfo(self._hdwf, c_secMin, c_secMax, c_nSteps)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secMin = c_secMin.value
@@ -1743,13 +4076,13 @@ class DigilentWaveformsDevice:
             return (secMin, secMax, nSteps)
 
         def triggerPositionSet(self, secPosition: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInTriggerPositionSet(self._device._hdwf, secPosition)
+            result = self._functions.FDwfAnalogInTriggerPositionSet(self._hdwf, secPosition)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerPositionGet(self) -> float:
             c_secPosition = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerPositionGet(self._device._hdwf, c_secPosition)
+            result = self._functions.FDwfAnalogInTriggerPositionGet(self._hdwf, c_secPosition)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secPosition = c_secPosition.value
@@ -1757,17 +4090,18 @@ class DigilentWaveformsDevice:
 
         def triggerPositionStatus(self) -> float:
             c_secPosition = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerPositionStatus(self._device._hdwf, c_secPosition)
+            result = self._functions.FDwfAnalogInTriggerPositionStatus(self._hdwf, c_secPosition)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secPosition = c_secPosition.value
             return secPosition
 
+        @_capability
         def triggerAutoTimeoutInfo(self) -> Tuple[float, float, float]:
             c_secMin = _typespec_ctypes.c_double()
             c_secMax = _typespec_ctypes.c_double()
             c_nSteps = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerAutoTimeoutInfo(self._device._hdwf, c_secMin, c_secMax, c_nSteps)
+            result = self._functions.FDwfAnalogInTriggerAutoTimeoutInfo(self._hdwf, c_secMin, c_secMax, c_nSteps)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secMin = c_secMin.value
@@ -1776,24 +4110,25 @@ class DigilentWaveformsDevice:
             return (secMin, secMax, nSteps)
 
         def triggerAutoTimeoutSet(self, secTimout: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInTriggerAutoTimeoutSet(self._device._hdwf, secTimout)
+            result = self._functions.FDwfAnalogInTriggerAutoTimeoutSet(self._hdwf, secTimout)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerAutoTimeoutGet(self) -> float:
             c_secTimeout = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerAutoTimeoutGet(self._device._hdwf, c_secTimeout)
+            result = self._functions.FDwfAnalogInTriggerAutoTimeoutGet(self._hdwf, c_secTimeout)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secTimeout = c_secTimeout.value
             return secTimeout
 
+        @_capability
         def triggerHoldOffInfo(self) -> Tuple[float, float, float]:
             # TODO: Typo 'nStep' (corrected)
             c_secMin = _typespec_ctypes.c_double()
             c_secMax = _typespec_ctypes.c_double()
             c_nSteps = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerHoldOffInfo(self._device._hdwf, c_secMin, c_secMax, c_nSteps)
+            result = self._functions.FDwfAnalogInTriggerHoldOffInfo(self._hdwf, c_secMin, c_secMax, c_nSteps)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secMin = c_secMin.value
@@ -1802,21 +4137,22 @@ class DigilentWaveformsDevice:
             return (secMin, secMax, nSteps)
 
         def triggerHoldOffSet(self, secHoldOff: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInTriggerHoldOffSet(self._device._hdwf, secHoldOff)
+            result = self._functions.FDwfAnalogInTriggerHoldOffSet(self._hdwf, secHoldOff)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerHoldOffGet(self) -> float:
             c_secHoldOff = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerHoldOffGet(self._device._hdwf, c_secHoldOff)
+            result = self._functions.FDwfAnalogInTriggerHoldOffGet(self._hdwf, c_secHoldOff)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secHoldOff = c_secHoldOff.value
             return secHoldOff
 
+        @_capability
         def triggerTypeInfo(self) -> List[TRIGTYPE]:
             c_trigger_type_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerTypeInfo(self._device._hdwf, c_trigger_type_bitset)
+            result = self._functions.FDwfAnalogInTriggerTypeInfo(self._hdwf, c_trigger_type_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_type_bitset = c_trigger_type_bitset.value
@@ -1824,22 +4160,23 @@ class DigilentWaveformsDevice:
             return trigger_type_list
 
         def triggerTypeSet(self, trigger_type: TRIGTYPE) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInTriggerTypeSet(self._device._hdwf, trigger_type.value)
+            result = self._functions.FDwfAnalogInTriggerTypeSet(self._hdwf, trigger_type.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerTypeGet(self) -> TRIGTYPE:
             c_trigger_type = _typespec_ctypes.TRIGTYPE()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerTypeGet(self._device._hdwf, c_trigger_type)
+            result = self._functions.FDwfAnalogInTriggerTypeGet(self._hdwf, c_trigger_type)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_type = TRIGTYPE(c_trigger_type.value)
             return trigger_type
 
+        @_capability
         def triggerChannelInfo(self) -> Tuple[int, int]:
             c_idxMin = _typespec_ctypes.c_int()
             c_idxMax = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerChannelInfo(self._device._hdwf, c_idxMin, c_idxMax)
+            result = self._functions.FDwfAnalogInTriggerChannelInfo(self._hdwf, c_idxMin, c_idxMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             idxMin = c_idxMin.value
@@ -1847,21 +4184,22 @@ class DigilentWaveformsDevice:
             return (idxMin, idxMax)
 
         def triggerChannelSet(self, channel_index: int) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInTriggerChannelSet(self._device._hdwf, channel_index)
+            result = self._functions.FDwfAnalogInTriggerChannelSet(self._hdwf, channel_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerChannelGet(self) -> int:
             c_channel_index = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerChannelGet(self._device._hdwf, c_channel_index)
+            result = self._functions.FDwfAnalogInTriggerChannelGet(self._hdwf, c_channel_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             channel_index = c_channel_index.value
             return channel_index
 
+        @_capability
         def triggerFilterInfo(self) -> List[FILTER]:
             c_filter_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerFilterInfo(self._device._hdwf, c_filter_bitset)
+            result = self._functions.FDwfAnalogInTriggerFilterInfo(self._hdwf, c_filter_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             filter_bitset = c_filter_bitset.value
@@ -1869,23 +4207,24 @@ class DigilentWaveformsDevice:
             return filter_list
 
         def triggerFilterSet(self, filter_: FILTER) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInTriggerFilterSet(self._device._hdwf, filter_.value)
+            result = self._functions.FDwfAnalogInTriggerFilterSet(self._hdwf, filter_.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerFilterGet(self) -> FILTER:
             c_filter = _typespec_ctypes.FILTER()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerFilterGet(self._device._hdwf, c_filter)
+            result = self._functions.FDwfAnalogInTriggerFilterGet(self._hdwf, c_filter)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             filter_ = FILTER(c_filter.value)
             return filter_
 
+        @_capability
         def triggerLevelInfo(self) -> Tuple[float, float, float]:
             c_voltsMin = _typespec_ctypes.c_double()
             c_voltsMax = _typespec_ctypes.c_double()
             c_nSteps = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerLevelInfo(self._device._hdwf, c_voltsMin, c_voltsMax, c_nSteps)
+            result = self._functions.FDwfAnalogInTriggerLevelInfo(self._hdwf, c_voltsMin, c_voltsMax, c_nSteps)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             voltsMin = c_voltsMin.value
@@ -1894,23 +4233,24 @@ class DigilentWaveformsDevice:
             return (voltsMin, voltsMax, nSteps)
 
         def triggerLevelSet(self, trigger_level: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInTriggerLevelSet(self._device._hdwf, trigger_level)
+            result = self._functions.FDwfAnalogInTriggerLevelSet(self._hdwf, trigger_level)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerLevelGet(self) -> float:
             c_trigger_level = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerLevelGet(self._device._hdwf, c_trigger_level)
+            result = self._functions.FDwfAnalogInTriggerLevelGet(self._hdwf, c_trigger_level)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_level = c_trigger_level.value
             return trigger_level
 
+        @_capability
         def triggerHysteresisInfo(self) -> Tuple[float, float, float]:
             c_voltsMin = _typespec_ctypes.c_double()
             c_voltsMax = _typespec_ctypes.c_double()
             c_nSteps = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerHysteresisInfo(self._device._hdwf, c_voltsMin, c_voltsMax, c_nSteps)
+            result = self._functions.FDwfAnalogInTriggerHysteresisInfo(self._hdwf, c_voltsMin, c_voltsMax, c_nSteps)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             voltsMin = c_voltsMin.value
@@ -1919,21 +4259,22 @@ class DigilentWaveformsDevice:
             return (voltsMin, voltsMax, nSteps)
 
         def triggerHysteresisSet(self, trigger_hysteresis: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInTriggerHysteresisSet(self._device._hdwf, trigger_hysteresis)
+            result = self._functions.FDwfAnalogInTriggerHysteresisSet(self._hdwf, trigger_hysteresis)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerHysteresisGet(self) -> float:
             c_trigger_hysteresis = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerHysteresisGet(self._device._hdwf, c_trigger_hysteresis)
+            result = self._functions.FDwfAnalogInTriggerHysteresisGet(self._hdwf, c_trigger_hysteresis)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_hysteresis = c_trigger_hysteresis.value
             return trigger_hysteresis
 
+        @_capability
         def triggerConditionInfo(self) -> List[DwfTriggerSlope]:
             c_trigger_condition_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerConditionInfo(self._device._hdwf, c_trigger_condition_bitset)
+            result = self._functions.FDwfAnalogInTriggerConditionInfo(self._hdwf, c_trigger_condition_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_condition_bitset = c_trigger_condition_bitset.value
@@ -1941,23 +4282,24 @@ class DigilentWaveformsDevice:
             return trigger_condition_list
 
         def triggerConditionSet(self, trigger_condition: DwfTriggerSlope) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInTriggerConditionSet(self._device._hdwf, trigger_condition.value)
+            result = self._functions.FDwfAnalogInTriggerConditionSet(self._hdwf, trigger_condition.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerConditionGet(self) -> DwfTriggerSlope:
             c_trigger_condition = _typespec_ctypes.DwfTriggerSlope()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerConditionGet(self._device._hdwf, c_trigger_condition)
+            result = self._functions.FDwfAnalogInTriggerConditionGet(self._hdwf, c_trigger_condition)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_condition = c_trigger_condition.value
             return DwfTriggerSlope(trigger_condition)
 
+        @_capability
         def triggerLengthInfo(self) -> Tuple[float, float, float]:
             c_secMin = _typespec_ctypes.c_double()
             c_secMax = _typespec_ctypes.c_double()
             c_nSteps = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerLengthInfo(self._device._hdwf, c_secMin, c_secMax, c_nSteps)
+            result = self._functions.FDwfAnalogInTriggerLengthInfo(self._hdwf, c_secMin, c_secMax, c_nSteps)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secMin = c_secMin.value
@@ -1966,21 +4308,22 @@ class DigilentWaveformsDevice:
             return (secMin, secMax, nSteps)
 
         def triggerLengthSet(self, secLength: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInTriggerLengthSet(self._device._hdwf, secLength)
+            result = self._functions.FDwfAnalogInTriggerLengthSet(self._hdwf, secLength)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerLengthGet(self) -> float:
             c_secLength = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerLengthGet(self._device._hdwf, c_secLength)
+            result = self._functions.FDwfAnalogInTriggerLengthGet(self._hdwf, c_secLength)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secLength = c_secLength.value
             return secLength
 
+        @_capability
         def triggerLengthConditionInfo(self) -> List[TRIGLEN]:
             c_triglen_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerLengthConditionInfo(self._device._hdwf, c_triglen_bitset)
+            result = self._functions.FDwfAnalogInTriggerLengthConditionInfo(self._hdwf, c_triglen_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             triglen_bitset = c_triglen_bitset.value
@@ -1988,13 +4331,13 @@ class DigilentWaveformsDevice:
             return triglen_list
 
         def triggerLengthConditionSet(self, trigger_length: TRIGLEN) -> None:
-            result = self._device._dwf._lib.FDwfAnalogInTriggerLengthConditionSet(self._device._hdwf, trigger_length.value)
+            result = self._functions.FDwfAnalogInTriggerLengthConditionSet(self._hdwf, trigger_length.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerLengthConditionGet(self) -> TRIGLEN:
             c_trigger_length = _typespec_ctypes.TRIGLEN()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerLengthConditionGet(self._device._hdwf, c_trigger_length)
+            result = self._functions.FDwfAnalogInTriggerLengthConditionGet(self._hdwf, c_trigger_length)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_length = TRIGLEN(c_trigger_length.value)
@@ -2002,14 +4345,14 @@ class DigilentWaveformsDevice:
 
         def samplingSourceSet(self, sampling_source: TRIGSRC) -> None:
             """Configure the AnalogIn acquisition sampling clock source."""
-            result = self._device._dwf._lib.FDwfAnalogInSamplingSourceSet(self._device._hdwf, sampling_source.value)
+            result = self._functions.FDwfAnalogInSamplingSourceSet(self._hdwf, sampling_source.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def samplingSourceGet(self) -> TRIGSRC:
             """Return the configured acquisition sampling clock source."""
             c_sampling_source = _typespec_ctypes.TRIGSRC()
-            result = self._device._dwf._lib.FDwfAnalogInSamplingSourceGet(self._device._hdwf, c_sampling_source)
+            result = self._functions.FDwfAnalogInSamplingSourceGet(self._hdwf, c_sampling_source)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             sampling_source = TRIGSRC(c_sampling_source.value)
@@ -2017,14 +4360,14 @@ class DigilentWaveformsDevice:
 
         def samplingSlopeSet(self, sampling_slope: DwfTriggerSlope) -> None:
             """Set the sampling clock slope for the instrument."""
-            result = self._device._dwf._lib.FDwfAnalogInSamplingSlopeSet(self._device._hdwf, sampling_slope.value)
+            result = self._functions.FDwfAnalogInSamplingSlopeSet(self._hdwf, sampling_slope.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def samplingSlopeGet(self) -> DwfTriggerSlope:
             """Return the sampling clock slope for the instrument."""
             c_sampling_slope = _typespec_ctypes.DwfTriggerSlope()
-            result = self._device._dwf._lib.FDwfAnalogInSamplingSlopeGet(self._device._hdwf, c_sampling_slope)
+            result = self._functions.FDwfAnalogInSamplingSlopeGet(self._hdwf, c_sampling_slope)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             sampling_slope = DwfTriggerSlope(c_sampling_slope.value)
@@ -2032,14 +4375,14 @@ class DigilentWaveformsDevice:
 
         def samplingDelaySet(self, sampling_delay: float) -> None:
             """Set the sampling clock delay for the instrument, in seconds."""
-            result = self._device._dwf._lib.FDwfAnalogInSamplingDelaySet(self._device._hdwf, sampling_delay)
+            result = self._functions.FDwfAnalogInSamplingDelaySet(self._hdwf, sampling_delay)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def samplingDelayGet(self) -> float:
             """Return the configured sampling clock delay, in seconds."""
             c_sampling_delay = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogInSamplingDelayGet(self._device._hdwf, c_sampling_delay)
+            result = self._functions.FDwfAnalogInSamplingDelayGet(self._hdwf, c_sampling_delay)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             sampling_delay = c_sampling_delay.value
@@ -2051,7 +4394,7 @@ class DigilentWaveformsDevice:
             Note: This function is OBSOLETE. Use the generic DeviceAPI.triggerInfo() method instead.
             """
             c_trigger_source_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogInTriggerSourceInfo(self._device._hdwf, c_trigger_source_bitset)
+            result = self._functions.FDwfAnalogInTriggerSourceInfo(self._hdwf, c_trigger_source_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_source_bitset = c_trigger_source_bitset.value
@@ -2067,58 +4410,63 @@ class DigilentWaveformsDevice:
 
         def __init__(self, device: 'DigilentWaveformsDevice') -> None:
             self._device = device
+            self._hdwf = device._hdwf
+            self._functions = device._dwf._function_table("FDwfAnalogOut")
+            self.settings_cache = SettingsCache(self)
 
+        @_capability
         def count(self) -> int:
             c_cChannel = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutCount(self._device._hdwf, c_cChannel)
+            result = self._functions.FDwfAnalogOutCount(self._hdwf, c_cChannel)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             cChannel = c_cChannel.value
             return cChannel
 
         def masterSet(self, channel_index: int, master_index: int) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutMasterSet(self._device._hdwf, channel_index, master_index)
+            result = self._functions.FDwfAnalogOutMasterSet(self._hdwf, channel_index, master_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def masterGet(self, channel_index: int) -> int:
             c_master_index = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutMasterGet(self._device._hdwf, channel_index, c_master_index)
+            result = self._functions.FDwfAnalogOutMasterGet(self._hdwf, channel_index, c_master_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             master_index = c_master_index.value
             return master_index
 
         def triggerSourceSet(self, channel_index: int, trigger_source: TRIGSRC) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutTriggerSourceSet(self._device._hdwf, channel_index, trigger_source.value)
+            result = self._functions.FDwfAnalogOutTriggerSourceSet(self._hdwf, channel_index, trigger_source.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerSourceGet(self, channel_index: int) -> TRIGSRC:
             c_trigger_source = _typespec_ctypes.TRIGSRC()
-            result = self._device._dwf._lib.FDwfAnalogOutTriggerSourceGet(self._device._hdwf, channel_index, c_trigger_source)
+            result = self._functions.FDwfAnalogOutTriggerSourceGet(self._hdwf, channel_index, c_trigger_source)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_source = TRIGSRC(c_trigger_source.value)
             return trigger_source
 
         def triggerSlopeSet(self, channel_index: int, trigger_slope: DwfTriggerSlope) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutTriggerSlopeSet(self._device._hdwf, channel_index, trigger_slope.value)
+            result = self._functions.FDwfAnalogOutTriggerSlopeSet(self._hdwf, channel_index, trigger_slope.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerSlopeGet(self, channel_index: int) -> DwfTriggerSlope:
             c_trigger_slope = _typespec_ctypes.DwfTriggerSlope()
-            result = self._device._dwf._lib.FDwfAnalogOutTriggerSlopeGet(self._device._hdwf, channel_index, c_trigger_slope)
+            result = self._functions.FDwfAnalogOutTriggerSlopeGet(self._hdwf, channel_index, c_trigger_slope)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_slope = DwfTriggerSlope(c_trigger_slope.value)
             return trigger_slope
 
+        @_capability
         def runInfo(self, channel_index: int) -> Tuple[float, float]:
             c_secMin = _typespec_ctypes.c_double()
             c_secMax = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutRunInfo(self._device._hdwf, channel_index, c_secMin, c_secMax)
+            result = self._functions.FDwfAnalogOutRunInfo(self._hdwf, channel_index, c_secMin, c_secMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secMin = c_secMin.value
@@ -2126,13 +4474,13 @@ class DigilentWaveformsDevice:
             return (secMin, secMax)
 
         def runSet(self, channel_index: int, secRun: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutRunSet(self._device._hdwf, channel_index, secRun)
+            result = self._functions.FDwfAnalogOutRunSet(self._hdwf, channel_index, secRun)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def runGet(self, channel_index: int) -> float:
             c_secRun = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutRunGet(self._device._hdwf, channel_index, c_secRun)
+            result = self._functions.FDwfAnalogOutRunGet(self._hdwf, channel_index, c_secRun)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secRun = c_secRun.value
@@ -2140,16 +4488,17 @@ class DigilentWaveformsDevice:
 
         def runStatus(self, channel_index: int) -> float:
             c_secRun = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutRunStatus(self._device._hdwf, channel_index, c_secRun)
+            result = self._functions.FDwfAnalogOutRunStatus(self._hdwf, channel_index, c_secRun)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secRun = c_secRun.value
             return secRun
 
+        @_capability
         def waitInfo(self, channel_index: int) -> Tuple[float, float]:
             c_secMin = _typespec_ctypes.c_double()
             c_secMax = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutWaitInfo(self._device._hdwf, channel_index, c_secMin, c_secMax)
+            result = self._functions.FDwfAnalogOutWaitInfo(self._hdwf, channel_index, c_secMin, c_secMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secMin = c_secMin.value
@@ -2157,22 +4506,23 @@ class DigilentWaveformsDevice:
             return (secMin, secMax)
 
         def waitSet(self, channel_index: int, secWait: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutWaitSet(self._device._hdwf, channel_index, secWait)
+            result = self._functions.FDwfAnalogOutWaitSet(self._hdwf, channel_index, secWait)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def waitGet(self, channel_index: int) -> float:
             c_secWait = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutWaitGet(self._device._hdwf, channel_index, c_secWait)
+            result = self._functions.FDwfAnalogOutWaitGet(self._hdwf, channel_index, c_secWait)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secWait = c_secWait.value
             return secWait
 
+        @_capability
         def repeatInfo(self, channel_index: int) -> Tuple[int, int]:
             c_nMin = _typespec_ctypes.c_int()
             c_nMax = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutRepeatInfo(self._device._hdwf, channel_index, c_nMin, c_nMax)
+            result = self._functions.FDwfAnalogOutRepeatInfo(self._hdwf, channel_index, c_nMin, c_nMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             nMin = c_nMin.value
@@ -2180,13 +4530,13 @@ class DigilentWaveformsDevice:
             return (nMin, nMax)
 
         def repeatSet(self, channel_index: int, repeat: int) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutRepeatSet(self._device._hdwf, channel_index, repeat)
+            result = self._functions.FDwfAnalogOutRepeatSet(self._hdwf, channel_index, repeat)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def repeatGet(self, channel_index: int) -> int:
             c_repeat = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutRepeatGet(self._device._hdwf, channel_index, c_repeat)
+            result = self._functions.FDwfAnalogOutRepeatGet(self._hdwf, channel_index, c_repeat)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             repeat = c_repeat.value
@@ -2194,29 +4544,30 @@ class DigilentWaveformsDevice:
 
         def repeatStatus(self, channel_index: int) -> int:
             c_repeat_status = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutRepeatStatus(self._device._hdwf, channel_index, c_repeat_status)
+            result = self._functions.FDwfAnalogOutRepeatStatus(self._hdwf, channel_index, c_repeat_status)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             repeat_status = c_repeat_status.value
             return repeat_status
 
         def repeatTriggerSet(self, channel_index: int, repeatTrigger: bool) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutRepeatTriggerSet(self._device._hdwf, channel_index, repeatTrigger)
+            result = self._functions.FDwfAnalogOutRepeatTriggerSet(self._hdwf, channel_index, repeatTrigger)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def repeatTriggerGet(self, channel_index: int) -> bool:
             c_repeatTrigger = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutRepeatTriggerGet(self._device._hdwf, channel_index, c_repeatTrigger)
+            result = self._functions.FDwfAnalogOutRepeatTriggerGet(self._hdwf, channel_index, c_repeatTrigger)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             repeatTrigger = bool(c_repeatTrigger.value)
             return repeatTrigger
 
+        @_capability
         def limitationInfo(self, channel_index: int) -> Tuple[float, float]:
             c_min = _typespec_ctypes.c_double()
             c_max = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutLimitationInfo(self._device._hdwf, channel_index, c_min, c_max)
+            result = self._functions.FDwfAnalogOutLimitationInfo(self._hdwf, channel_index, c_min, c_max)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             min_ = c_min.value
@@ -2224,34 +4575,35 @@ class DigilentWaveformsDevice:
             return (min_, max_)
 
         def limitationSet(self, channel_index: int, limit: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutLimitationSet(self._device._hdwf, channel_index, limit)
+            result = self._functions.FDwfAnalogOutLimitationSet(self._hdwf, channel_index, limit)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def limitationGet(self, channel_index: int) -> float:
             c_limit = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutLimitationGet(self._device._hdwf, channel_index, c_limit)
+            result = self._functions.FDwfAnalogOutLimitationGet(self._hdwf, channel_index, c_limit)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             limit = c_limit.value
             return limit
 
         def modeSet(self, channel_index: int, mode: DwfAnalogOutMode) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutModeSet(self._device._hdwf, channel_index, mode.value)
+            result = self._functions.FDwfAnalogOutModeSet(self._hdwf, channel_index, mode.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def modeGet(self, channel_index: int) -> DwfAnalogOutMode:
             c_mode = _typespec_ctypes.DwfAnalogOutMode()
-            result = self._device._dwf._lib.FDwfAnalogOutModeGet(self._device._hdwf, channel_index, c_mode)
+            result = self._functions.FDwfAnalogOutModeGet(self._hdwf, channel_index, c_mode)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             mode = DwfAnalogOutMode(c_mode.value)
             return mode
 
+        @_capability
         def idleInfo(self, channel_index: int) -> List[DwfAnalogOutIdle]:
             c_idle_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutIdleInfo(self._device._hdwf, channel_index, c_idle_bitset)
+            result = self._functions.FDwfAnalogOutIdleInfo(self._hdwf, channel_index, c_idle_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             idle_bitset = c_idle_bitset.value
@@ -2259,21 +4611,22 @@ class DigilentWaveformsDevice:
             return idle_list
 
         def idleSet(self, channel_index: int, idle: DwfAnalogOutIdle) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutIdleSet(self._device._hdwf, channel_index, idle.value)
+            result = self._functions.FDwfAnalogOutIdleSet(self._hdwf, channel_index, idle.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def idleGet(self, channel_index: int) -> DwfAnalogOutIdle:
             c_idle = _typespec_ctypes.DwfAnalogOutIdle()
-            result = self._device._dwf._lib.FDwfAnalogOutIdleGet(self._device._hdwf, channel_index, c_idle)
+            result = self._functions.FDwfAnalogOutIdleGet(self._hdwf, channel_index, c_idle)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             idle = DwfAnalogOutIdle(c_idle.value)
             return idle
 
+        @_capability
         def nodeInfo(self, channel_index: int) -> List[AnalogOutNode]:
             c_node_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeInfo(self._device._hdwf, channel_index, c_node_bitset)
+            result = self._functions.FDwfAnalogOutNodeInfo(self._hdwf, channel_index, c_node_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             node_bitset = c_node_bitset.value
@@ -2281,21 +4634,22 @@ class DigilentWaveformsDevice:
             return node_list
 
         def nodeEnableSet(self, channel_index: int, node: AnalogOutNode, enable: bool) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutNodeEnableSet(self._device._hdwf, channel_index, node.value, enable)
+            result = self._functions.FDwfAnalogOutNodeEnableSet(self._hdwf, channel_index, node.value, enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def nodeEnableGet(self, channel_index: int, node: AnalogOutNode) -> bool:
             c_enable = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeEnableGet(self._device._hdwf, channel_index, node.value, c_enable)
+            result = self._functions.FDwfAnalogOutNodeEnableGet(self._hdwf, channel_index, node.value, c_enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             enable = bool(c_enable.value)
             return enable
 
+        @_capability
         def nodeFunctionInfo(self, channel_index: int, node: AnalogOutNode) -> List[FUNC]:
             c_func_bitset = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeFunctionInfo(self._device._hdwf, channel_index, node.value, c_func_bitset)
+            result = self._functions.FDwfAnalogOutNodeFunctionInfo(self._hdwf, channel_index, node.value, c_func_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             func_bitset = c_func_bitset.value
@@ -2303,22 +4657,23 @@ class DigilentWaveformsDevice:
             return func_list
 
         def nodeFunctionSet(self, channel_index: int, node: AnalogOutNode, func: FUNC) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutNodeFunctionSet(self._device._hdwf, channel_index, node.value, func.value)
+            result = self._functions.FDwfAnalogOutNodeFunctionSet(self._hdwf, channel_index, node.value, func.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def nodeFunctionGet(self, channel_index: int, node: AnalogOutNode) -> FUNC:
             c_func = _typespec_ctypes.FUNC()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeFunctionGet(self._device._hdwf, channel_index, node.value, c_func)
+            result = self._functions.FDwfAnalogOutNodeFunctionGet(self._hdwf, channel_index, node.value, c_func)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             func = FUNC(c_func.value)
             return func
 
+        @_capability
         def nodeFrequencyInfo(self, channel_index: int, node: AnalogOutNode) -> Tuple[float, float]:
             c_hzMin = _typespec_ctypes.c_double()
             c_hzMax = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeFrequencyInfo(self._device._hdwf, channel_index, node.value, c_hzMin, c_hzMax)
+            result = self._functions.FDwfAnalogOutNodeFrequencyInfo(self._hdwf, channel_index, node.value, c_hzMin, c_hzMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             hzMin = c_hzMin.value
@@ -2326,22 +4681,23 @@ class DigilentWaveformsDevice:
             return (hzMin, hzMax)
 
         def nodeFrequencySet(self, channel_index: int, node: AnalogOutNode, hzFrequency: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutNodeFrequencySet(self._device._hdwf, channel_index, node.value, hzFrequency)
+            result = self._functions.FDwfAnalogOutNodeFrequencySet(self._hdwf, channel_index, node.value, hzFrequency)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def nodeFrequencyGet(self, channel_index: int, node: AnalogOutNode) -> float:
             c_hzFrequency = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeFrequencyGet(self._device._hdwf, channel_index, node.value, c_hzFrequency)
+            result = self._functions.FDwfAnalogOutNodeFrequencyGet(self._hdwf, channel_index, node.value, c_hzFrequency)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             hzFrequency = c_hzFrequency.value
             return hzFrequency
 
+        @_capability
         def nodeAmplitudeInfo(self, channel_index: int, node: AnalogOutNode) -> Tuple[float, float]:
             c_min = _typespec_ctypes.c_double()
             c_max = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeAmplitudeInfo(self._device._hdwf, channel_index, node.value, c_min, c_max)
+            result = self._functions.FDwfAnalogOutNodeAmplitudeInfo(self._hdwf, channel_index, node.value, c_min, c_max)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             min_ = c_min.value
@@ -2349,22 +4705,23 @@ class DigilentWaveformsDevice:
             return (min_, max_)
 
         def nodeAmplitudeSet(self, channel_index: int, node: AnalogOutNode, vAmplitude: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutNodeAmplitudeSet(self._device._hdwf, channel_index, node.value, vAmplitude)
+            result = self._functions.FDwfAnalogOutNodeAmplitudeSet(self._hdwf, channel_index, node.value, vAmplitude)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def nodeAmplitudeGet(self, channel_index: int, node: AnalogOutNode) -> float:
             c_vAmplitude = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeAmplitudeGet(self._device._hdwf, channel_index, node.value, c_vAmplitude)
+            result = self._functions.FDwfAnalogOutNodeAmplitudeGet(self._hdwf, channel_index, node.value, c_vAmplitude)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             vAmplitude = c_vAmplitude.value
             return vAmplitude
 
+        @_capability
         def nodeOffsetInfo(self, channel_index: int, node: AnalogOutNode) -> Tuple[float, float]:
             c_min = _typespec_ctypes.c_double()
             c_max = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeOffsetInfo(self._device._hdwf, channel_index, node.value, c_min, c_max)
+            result = self._functions.FDwfAnalogOutNodeOffsetInfo(self._hdwf, channel_index, node.value, c_min, c_max)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             min_ = c_min.value
@@ -2372,22 +4729,23 @@ class DigilentWaveformsDevice:
             return (min_, max_)
 
         def nodeOffsetSet(self, channel_index: int, node: AnalogOutNode, vOffset: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutNodeOffsetSet(self._device._hdwf, channel_index, node.value, vOffset)
+            result = self._functions.FDwfAnalogOutNodeOffsetSet(self._hdwf, channel_index, node.value, vOffset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def nodeOffsetGet(self, channel_index: int, node: AnalogOutNode) -> float:
             c_vOffset = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeOffsetGet(self._device._hdwf, channel_index, node.value, c_vOffset)
+            result = self._functions.FDwfAnalogOutNodeOffsetGet(self._hdwf, channel_index, node.value, c_vOffset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             vOffset = c_vOffset.value
             return vOffset
 
+        @_capability
         def nodeSymmetryInfo(self, channel_index: int, node: AnalogOutNode) -> Tuple[float, float]:
             c_percentageMin = _typespec_ctypes.c_double()
             c_percentageMax = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeSymmetryInfo(self._device._hdwf, channel_index, node.value, c_percentageMin, c_percentageMax)
+            result = self._functions.FDwfAnalogOutNodeSymmetryInfo(self._hdwf, channel_index, node.value, c_percentageMin, c_percentageMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             percentageMin = c_percentageMin.value
@@ -2395,22 +4753,23 @@ class DigilentWaveformsDevice:
             return (percentageMin, percentageMax)
 
         def nodeSymmetrySet(self, channel_index: int, node: AnalogOutNode, percentageSymmetry: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutNodeSymmetrySet(self._device._hdwf, channel_index, node.value, percentageSymmetry)
+            result = self._functions.FDwfAnalogOutNodeSymmetrySet(self._hdwf, channel_index, node.value, percentageSymmetry)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def nodeSymmetryGet(self, channel_index: int, node: AnalogOutNode) -> float:
             c_percentageSymmetry = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeSymmetryGet(self._device._hdwf, channel_index, node.value, c_percentageSymmetry)
+            result = self._functions.FDwfAnalogOutNodeSymmetryGet(self._hdwf, channel_index, node.value, c_percentageSymmetry)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             percentageSymmetry = c_percentageSymmetry.value
             return percentageSymmetry
 
+        @_capability
         def nodePhaseInfo(self, channel_index: int, node: AnalogOutNode) -> Tuple[float, float]:
             c_degreeMin = _typespec_ctypes.c_double()
             c_degreeMax = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutNodePhaseInfo(self._device._hdwf, channel_index, node.value, c_degreeMin, c_degreeMax)
+            result = self._functions.FDwfAnalogOutNodePhaseInfo(self._hdwf, channel_index, node.value, c_degreeMin, c_degreeMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             degreeMin = c_degreeMin.value
@@ -2418,22 +4777,23 @@ class DigilentWaveformsDevice:
             return (degreeMin, degreeMax)
 
         def nodePhaseSet(self, channel_index: int, node: AnalogOutNode, degreePhase: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutNodePhaseSet(self._device._hdwf, channel_index, node.value, degreePhase)
+            result = self._functions.FDwfAnalogOutNodePhaseSet(self._hdwf, channel_index, node.value, degreePhase)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def nodePhaseGet(self, channel_index: int, node: AnalogOutNode) -> float:
             c_degreePhase = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutNodePhaseGet(self._device._hdwf, channel_index, node.value, c_degreePhase)
+            result = self._functions.FDwfAnalogOutNodePhaseGet(self._hdwf, channel_index, node.value, c_degreePhase)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             degreePhase = c_degreePhase.value
             return degreePhase
 
+        @_capability
         def nodeDataInfo(self, channel_index: int, node: AnalogOutNode) -> Tuple[float, float]:
             c_samplesMin = _typespec_ctypes.c_int()
             c_samplesMax = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutNodeDataInfo(self._device._hdwf, channel_index, node.value, c_samplesMin, c_samplesMax)
+            result = self._functions.FDwfAnalogOutNodeDataInfo(self._hdwf, channel_index, node.value, c_samplesMin, c_samplesMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             samplesMin = c_samplesMin.value
@@ -2444,36 +4804,42 @@ class DigilentWaveformsDevice:
 
             double_data = data.astype(np.float64)
 
-            result = self._device._dwf._lib.FDwfAnalogOutNodeDataSet(self._device._hdwf, channel_index, node.value, double_data.ctypes.data_as(_typespec_ctypes.c_double_ptr), len(double_data))
+            result = self._functions.FDwfAnalogOutNodeDataSet(self._hdwf, channel_index, node.value, double_data.ctypes.data_as(_typespec_ctypes.c_double_ptr), len(double_data))
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def customAMFMEnableSet(self, channel_index: int, enable: bool) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutCustomAMFMEnableSet(self._device._hdwf, channel_index, enable)
+            result = self._functions.FDwfAnalogOutCustomAMFMEnableSet(self._hdwf, channel_index, enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def customAMFMEnableGet(self, channel_index: int) -> bool:
             c_enable = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutCustomAMFMEnableGet(self._device._hdwf, channel_index, c_enable)
+            result = self._functions.FDwfAnalogOutCustomAMFMEnableGet(self._hdwf, channel_index, c_enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             enable = bool(c_enable.value)
             return enable
 
         def reset(self, channel_index: int) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutReset(self._device._hdwf, channel_index)
+            result = self._functions.FDwfAnalogOutReset(self._hdwf, channel_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
-        def configure(self, channel_index: int, start: bool) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutConfigure(self._device._hdwf, channel_index, start)
+        def configure(self, channel_index: int, start: int) -> None:
+            """Configure the instrument channel, and start or stop it.
+
+            Args:
+                channel_index: The channel to configure.
+                start: 0 to stop the channel, 1 to start it, or 3 to apply the settings without starting or stopping it.
+            """
+            result = self._functions.FDwfAnalogOutConfigure(self._hdwf, channel_index, start)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def status(self, channel_index: int) -> DwfState:
             c_status = _typespec_ctypes.DwfState()
-            result = self._device._dwf._lib.FDwfAnalogOutStatus(self._device._hdwf, channel_index, c_status)
+            result = self._functions.FDwfAnalogOutStatus(self._hdwf, channel_index, c_status)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             status = DwfState(c_status.value)
@@ -2483,7 +4849,7 @@ class DigilentWaveformsDevice:
             c_data_free = _typespec_ctypes.c_int()
             c_data_lost = _typespec_ctypes.c_int()
             c_data_corrupted = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutNodePlayStatus(self._device._hdwf, channel_index, node.value, c_data_free, c_data_lost, c_data_corrupted)
+            result = self._functions.FDwfAnalogOutNodePlayStatus(self._hdwf, channel_index, node.value, c_data_free, c_data_lost, c_data_corrupted)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             data_free = c_data_free.value
@@ -2492,7 +4858,7 @@ class DigilentWaveformsDevice:
             return (data_free, data_lost, data_corrupted)
 
         def nodePlayData(self, channel_index:int, node: AnalogOutNode, data: np.ndarray) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutNodePlayData(self._device._hdwf, channel_index, node.value, data.ctypes.data_as(_typespec_ctypes.c_double_ptr), len(data))
+            result = self._functions.FDwfAnalogOutNodePlayData(self._hdwf, channel_index, node.value, data.ctypes.data_as(_typespec_ctypes.c_double_ptr), len(data))
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -2504,7 +4870,7 @@ class DigilentWaveformsDevice:
             This function is OBSOLETE.
             """
             c_trigger_source_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutTriggerSourceInfo(self._device._hdwf, c_trigger_source_bitset)
+            result = self._functions.FDwfAnalogOutTriggerSourceInfo(self._hdwf, c_trigger_source_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_source_bitset = c_trigger_source_bitset.value
@@ -2516,7 +4882,7 @@ class DigilentWaveformsDevice:
 
             This function is OBSOLETE. Use `nodeEnableSet` instead.
             """
-            result = self._device._dwf._lib.FDwfAnalogOutEnableSet(self._device._hdwf, channel_index, enable)
+            result = self._functions.FDwfAnalogOutEnableSet(self._hdwf, channel_index, enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -2526,7 +4892,7 @@ class DigilentWaveformsDevice:
             This function is OBSOLETE. Use `nodeEnableGet` instead.
             """
             c_enable = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutEnableGet(self._device._hdwf, channel_index, c_enable)
+            result = self._functions.FDwfAnalogOutEnableGet(self._hdwf, channel_index, c_enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             enable = bool(c_enable.value)
@@ -2538,7 +4904,7 @@ class DigilentWaveformsDevice:
             This function is OBSOLETE. Use `nodeFunctionInfo` instead.
             """
             c_function_bitset = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfAnalogOutFunctionInfo(self._device._hdwf, channel_index, c_function_bitset)
+            result = self._functions.FDwfAnalogOutFunctionInfo(self._hdwf, channel_index, c_function_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             function_bitset = c_function_bitset.value
@@ -2550,7 +4916,7 @@ class DigilentWaveformsDevice:
 
             This function is OBSOLETE. Use `nodeFunctionSet` instead.
             """
-            result = self._device._dwf._lib.FDwfAnalogOutFunctionSet(self._device._hdwf, channel_index, func.value)
+            result = self._functions.FDwfAnalogOutFunctionSet(self._hdwf, channel_index, func.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -2560,7 +4926,7 @@ class DigilentWaveformsDevice:
             This function is OBSOLETE. Use `nodeFunctionGet` instead.
             """
             c_func = _typespec_ctypes.FUNC()
-            result = self._device._dwf._lib.FDwfAnalogOutFunctionGet(self._device._hdwf, channel_index, c_func)
+            result = self._functions.FDwfAnalogOutFunctionGet(self._hdwf, channel_index, c_func)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             func = FUNC(c_func.value)
@@ -2573,7 +4939,7 @@ class DigilentWaveformsDevice:
             """
             c_hzMin = _typespec_ctypes.c_double()
             c_hzMax = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutFrequencyInfo(self._device._hdwf, channel_index, c_hzMin, c_hzMax)
+            result = self._functions.FDwfAnalogOutFrequencyInfo(self._hdwf, channel_index, c_hzMin, c_hzMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             hzMin = c_hzMin.value
@@ -2585,7 +4951,7 @@ class DigilentWaveformsDevice:
 
             This function is OBSOLETE. Use `nodeFrequencySet` instead.
             """
-            result = self._device._dwf._lib.FDwfAnalogOutFrequencySet(self._device._hdwf, channel_index, hzFrequency)
+            result = self._functions.FDwfAnalogOutFrequencySet(self._hdwf, channel_index, hzFrequency)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -2595,7 +4961,7 @@ class DigilentWaveformsDevice:
             This function is OBSOLETE. Use `nodeFrequencyGet` instead.
             """
             c_hzFrequency = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutFrequencyGet(self._device._hdwf, channel_index, c_hzFrequency)
+            result = self._functions.FDwfAnalogOutFrequencyGet(self._hdwf, channel_index, c_hzFrequency)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             hzFrequency = c_hzFrequency.value
@@ -2608,7 +4974,7 @@ class DigilentWaveformsDevice:
             """
             c_min = _typespec_ctypes.c_double()
             c_max = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutAmplitudeInfo(self._device._hdwf, channel_index, c_min, c_max)
+            result = self._functions.FDwfAnalogOutAmplitudeInfo(self._hdwf, channel_index, c_min, c_max)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             min_ = c_min.value
@@ -2620,7 +4986,7 @@ class DigilentWaveformsDevice:
 
             This function is OBSOLETE. Use `nodeAmplitudeSet` instead.
             """
-            result = self._device._dwf._lib.FDwfAnalogOutAmplitudeSet(self._device._hdwf, channel_index, vAmplitude)
+            result = self._functions.FDwfAnalogOutAmplitudeSet(self._hdwf, channel_index, vAmplitude)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -2630,7 +4996,7 @@ class DigilentWaveformsDevice:
             This function is OBSOLETE. Use `nodeAmplitudeGet` instead.
             """
             c_vAmplitude = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutAmplitudeGet(self._device._hdwf, channel_index, c_vAmplitude)
+            result = self._functions.FDwfAnalogOutAmplitudeGet(self._hdwf, channel_index, c_vAmplitude)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             vAmplitude = c_vAmplitude.value
@@ -2643,7 +5009,7 @@ class DigilentWaveformsDevice:
             """
             c_min = _typespec_ctypes.c_double()
             c_max = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutOffsetInfo(self._device._hdwf, channel_index,c_min, c_max)
+            result = self._functions.FDwfAnalogOutOffsetInfo(self._hdwf, channel_index,c_min, c_max)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             min_ = c_min.value
@@ -2655,7 +5021,7 @@ class DigilentWaveformsDevice:
 
             This function is OBSOLETE. Use `nodeOffsetSet` instead.
             """
-            result = self._device._dwf._lib.FDwfAnalogOutOffsetSet(self._device._hdwf, channel_index, vOffset)
+            result = self._functions.FDwfAnalogOutOffsetSet(self._hdwf, channel_index, vOffset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -2665,7 +5031,7 @@ class DigilentWaveformsDevice:
             This function is OBSOLETE. Use `nodeOffsetGet` instead.
             """
             c_vOffset = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutOffsetGet(self._device._hdwf, channel_index, c_vOffset)
+            result = self._functions.FDwfAnalogOutOffsetGet(self._hdwf, channel_index, c_vOffset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             vOffset = c_vOffset.value
@@ -2678,7 +5044,7 @@ class DigilentWaveformsDevice:
             """
             c_percentageMin = _typespec_ctypes.c_double()
             c_percentageMax = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutSymmetryInfo(self._device._hdwf, channel_index, c_percentageMin, c_percentageMax)
+            result = self._functions.FDwfAnalogOutSymmetryInfo(self._hdwf, channel_index, c_percentageMin, c_percentageMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             percentageMin = c_percentageMin.value
@@ -2690,7 +5056,7 @@ class DigilentWaveformsDevice:
 
             This function is OBSOLETE. Use `nodeSymmetrySet` instead.
             """
-            result = self._device._dwf._lib.FDwfAnalogOutSymmetrySet(self._device._hdwf, channel_index, percentageSymmetry)
+            result = self._functions.FDwfAnalogOutSymmetrySet(self._hdwf, channel_index, percentageSymmetry)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -2700,7 +5066,7 @@ class DigilentWaveformsDevice:
             This function is OBSOLETE. Use `nodeSymmetryGet` instead.
             """
             c_percentageSymmetry = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutSymmetryGet(self._device._hdwf, channel_index, c_percentageSymmetry)
+            result = self._functions.FDwfAnalogOutSymmetryGet(self._hdwf, channel_index, c_percentageSymmetry)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             percentageSymmetry = c_percentageSymmetry.value
@@ -2713,7 +5079,7 @@ class DigilentWaveformsDevice:
             """
             c_degreeMin = _typespec_ctypes.c_double()
             c_degreeMax = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutPhaseInfo(self._device._hdwf, channel_index, c_degreeMin, c_degreeMax)
+            result = self._functions.FDwfAnalogOutPhaseInfo(self._hdwf, channel_index, c_degreeMin, c_degreeMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             degreeMin = c_degreeMin.value
@@ -2725,7 +5091,7 @@ class DigilentWaveformsDevice:
 
             This function is OBSOLETE. Use `nodePhaseSet` instead.
             """
-            result = self._device._dwf._lib.FDwfAnalogOutPhaseSet(self._device._hdwf, channel_index, degreePhase)
+            result = self._functions.FDwfAnalogOutPhaseSet(self._hdwf, channel_index, degreePhase)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -2735,7 +5101,7 @@ class DigilentWaveformsDevice:
             This function is OBSOLETE. Use `nodePhaseGet` instead.
             """
             c_degreePhase = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogOutPhaseGet(self._device._hdwf, channel_index, c_degreePhase)
+            result = self._functions.FDwfAnalogOutPhaseGet(self._hdwf, channel_index, c_degreePhase)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             degreePhase = c_degreePhase.value
@@ -2748,7 +5114,7 @@ class DigilentWaveformsDevice:
             """
             c_samplesMin = _typespec_ctypes.c_int()
             c_samplesMax = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutDataInfo(self._device._hdwf, channel_index, c_samplesMin, c_samplesMax)
+            result = self._functions.FDwfAnalogOutDataInfo(self._hdwf, channel_index, c_samplesMin, c_samplesMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             samplesMin = c_samplesMin.value
@@ -2762,7 +5128,7 @@ class DigilentWaveformsDevice:
             """
             double_data = data.astype(np.float64)
 
-            result = self._device._dwf._lib.FDwfAnalogOutDataSet(self._device._hdwf, channel_index, double_data.ctypes.data_as(_typespec_ctypes.c_double_ptr), len(double_data))
+            result = self._functions.FDwfAnalogOutDataSet(self._hdwf, channel_index, double_data.ctypes.data_as(_typespec_ctypes.c_double_ptr), len(double_data))
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -2775,7 +5141,7 @@ class DigilentWaveformsDevice:
             c_dataFree = _typespec_ctypes.c_int()
             c_dataLost = _typespec_ctypes.c_int()
             c_dataCorrupted = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogOutPlayStatus(self._device._hdwf, channel_index, c_dataFree, c_dataLost, c_dataCorrupted)
+            result = self._functions.FDwfAnalogOutPlayStatus(self._hdwf, channel_index, c_dataFree, c_dataLost, c_dataCorrupted)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             dataFree = c_dataFree.value
@@ -2784,7 +5150,7 @@ class DigilentWaveformsDevice:
             return (dataFree, dataLost, dataCorrupted)
 
         def playData(self, channel_index: int, data: np.ndarray) -> None:
-            result = self._device._dwf._lib.FDwfAnalogOutPlayData(self._device._hdwf, channel_index, data.ctypes.data_as(_typespec_ctypes.c_double_ptr), len(data))
+            result = self._functions.FDwfAnalogOutPlayData(self._hdwf, channel_index, data.ctypes.data_as(_typespec_ctypes.c_double_ptr), len(data))
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -2803,16 +5169,19 @@ class DigilentWaveformsDevice:
 
         def __init__(self, device: 'DigilentWaveformsDevice') -> None:
             self._device = device
+            self._hdwf = device._hdwf
+            self._functions = device._dwf._function_table("FDwfAnalogIO")
+            self.settings_cache = SettingsCache(self)
 
         def reset(self) -> None:
             """Reset and configure (by default, having auto configure enabled) all AnalogIO instrument parameters to default values."""
-            result = self._device._dwf._lib.FDwfAnalogIOReset(self._device._hdwf)
+            result = self._functions.FDwfAnalogIOReset(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def configure(self) -> None:
             """Configure the AnalogIO instrument."""
-            result = self._device._dwf._lib.FDwfAnalogIOConfigure(self._device._hdwf)
+            result = self._functions.FDwfAnalogIOConfigure(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -2820,10 +5189,11 @@ class DigilentWaveformsDevice:
             """Read the status of the device and stores it internally.
 
             The following status functions will return the information that was read from the device when this function was called."""
-            result = self._device._dwf._lib.FDwfAnalogIOStatus(self._device._hdwf)
+            result = self._functions.FDwfAnalogIOStatus(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
+        @_capability
         def enableInfo(self) -> Tuple[bool, bool]:
             """Verify if Master Enable Setting and/or Master Enable Status are supported for the AnalogIO instrument.
 
@@ -2832,7 +5202,7 @@ class DigilentWaveformsDevice:
             """
             c_set_supported = _typespec_ctypes.c_int()
             c_status_supported = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogIOEnableInfo(self._device._hdwf, c_set_supported, c_set_supported)
+            result = self._functions.FDwfAnalogIOEnableInfo(self._hdwf, c_set_supported, c_set_supported)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             set_supported = bool(c_set_supported.value)
@@ -2841,14 +5211,14 @@ class DigilentWaveformsDevice:
 
         def enableSet(self, master_enable: bool) -> None:
             """Set the master enable switch."""
-            result = self._device._dwf._lib.FDwfAnalogIOEnableSet(self._device._hdwf, master_enable)
+            result = self._functions.FDwfAnalogIOEnableSet(self._hdwf, master_enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def enableGet(self) -> bool:
             """Return the current state of the master enable switch. This is not obtained from the device."""
             c_master_enable = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogIOEnableGet(self._device._hdwf, c_master_enable)
+            result = self._functions.FDwfAnalogIOEnableGet(self._hdwf, c_master_enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             master_enable = bool(c_master_enable.value)
@@ -2859,16 +5229,17 @@ class DigilentWaveformsDevice:
 
             This can be a switch on the board or an overcurrent protection circuit state."""
             c_master_enable_status = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogIOEnableStatus(self._device._hdwf, c_master_enable_status)
+            result = self._functions.FDwfAnalogIOEnableStatus(self._hdwf, c_master_enable_status)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             master_enable_status = bool(c_master_enable_status.value)
             return master_enable_status
 
+        @_capability
         def channelCount(self) -> int:
             """Return the number of AnalogIO channels available on the device."""
             c_channel_count = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogIOChannelCount(self._device._hdwf, c_channel_count)
+            result = self._functions.FDwfAnalogIOChannelCount(self._hdwf, c_channel_count)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             channel_count = c_channel_count.value
@@ -2878,17 +5249,18 @@ class DigilentWaveformsDevice:
             """Return the name (long text) and label (short text, printed on the device) for a channel."""
             c_channel_name = ctypes.create_string_buffer(32)
             c_channel_label = ctypes.create_string_buffer(16)
-            result = self._device._dwf._lib.FDwfAnalogIOChannelName(self._device._hdwf, channel_index, c_channel_name, c_channel_label)
+            result = self._functions.FDwfAnalogIOChannelName(self._hdwf, channel_index, c_channel_name, c_channel_label)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             channel_name = c_channel_name.value.decode()
             channel_label = c_channel_label.value.decode()
             return (channel_name, channel_label)
 
+        @_capability
         def channelInfo(self, channel_index: int) -> int:
             """Return the number of nodes associated with the specified channel."""
             c_node_count = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogIOChannelInfo(self._device._hdwf, channel_index, c_node_count)
+            result = self._functions.FDwfAnalogIOChannelInfo(self._hdwf, channel_index, c_node_count)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             return c_node_count.value
@@ -2897,22 +5269,24 @@ class DigilentWaveformsDevice:
             """Return the node name ("Voltage", "Current", ...) and units ("V", "A") for an Analog I/O node."""
             c_node_name = ctypes.create_string_buffer(32)
             c_node_units = ctypes.create_string_buffer(16)
-            result = self._device._dwf._lib.FDwfAnalogIOChannelNodeName(self._device._hdwf, channel_index, node_index, c_node_name, c_node_units)
+            result = self._functions.FDwfAnalogIOChannelNodeName(self._hdwf, channel_index, node_index, c_node_name, c_node_units)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             node_name = c_node_name.value.decode()
             node_units = c_node_units.value.decode()
             return (node_name, node_units)
 
+        @_capability
         def channelNodeInfo(self, channel_index: int, node_index: int) -> ANALOGIO:
             """Return the supported channel node modes."""
             c_analog_io = _typespec_ctypes.ANALOGIO()
-            result = self._device._dwf._lib.FDwfAnalogIOChannelNodeInfo(self._device._hdwf, channel_index, node_index, c_analog_io)
+            result = self._functions.FDwfAnalogIOChannelNodeInfo(self._hdwf, channel_index, node_index, c_analog_io)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             analog_io = ANALOGIO(c_analog_io.value)
             return analog_io
 
+        @_capability
         def channelNodeSetInfo(self, channel_index: int, node_index: int) -> Tuple[float, float, int]:
             """Return node value limits.
 
@@ -2925,7 +5299,7 @@ class DigilentWaveformsDevice:
             c_min_value = _typespec_ctypes.c_double()
             c_max_value = _typespec_ctypes.c_double()
             c_num_steps = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogIOChannelNodeSetInfo(self._device._hdwf, channel_index, node_index, c_min_value, c_max_value, c_num_steps)
+            result = self._functions.FDwfAnalogIOChannelNodeSetInfo(self._hdwf, channel_index, node_index, c_min_value, c_max_value, c_num_steps)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             min_value = c_min_value.value
@@ -2935,25 +5309,26 @@ class DigilentWaveformsDevice:
 
         def channelNodeSet(self, channel_index: int, node_index: int, node_value: float) -> None:
             """Set the node value for the specified node on the specified channel."""
-            result = self._device._dwf._lib.FDwfAnalogIOChannelNodeSet(self._device._hdwf, channel_index, node_index, node_value)
+            result = self._functions.FDwfAnalogIOChannelNodeSet(self._hdwf, channel_index, node_index, node_value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def channelNodeGet(self, channel_index: int, node_index: int) -> float:
             """Return the currently set value of the node on the specified channel."""
             c_node_value = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogIOChannelNodeGet(self._device._hdwf, channel_index, node_index, c_node_value)
+            result = self._functions.FDwfAnalogIOChannelNodeGet(self._hdwf, channel_index, node_index, c_node_value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             node_value = c_node_value.value
             return node_value
 
+        @_capability
         def channelNodeStatusInfo(self, channel_index: int, node_index: int) -> Tuple[float, float, int]:
             """Return the range of reading values available for the specified node on the specified channel."""
             c_min_value = _typespec_ctypes.c_double()
             c_max_value = _typespec_ctypes.c_double()
             c_num_steps = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogIOChannelNodeStatusInfo(self._device._hdwf, channel_index, node_index, c_min_value, c_max_value, c_num_steps)
+            result = self._functions.FDwfAnalogIOChannelNodeStatusInfo(self._hdwf, channel_index, node_index, c_min_value, c_max_value, c_num_steps)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             min_value = c_min_value.value
@@ -2964,7 +5339,7 @@ class DigilentWaveformsDevice:
         def channelNodeStatus(self, channel_index: int, node_index: int) -> float:
             """Return the value reading of the node."""
             c_node_status = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogIOChannelNodeStatus(self._device._hdwf, channel_index, node_index, c_node_status)
+            result = self._functions.FDwfAnalogIOChannelNodeStatus(self._hdwf, channel_index, node_index, c_node_status)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             node_status = c_node_status.value
@@ -2980,19 +5355,22 @@ class DigilentWaveformsDevice:
 
         def __init__(self, device: 'DigilentWaveformsDevice') -> None:
             self._device = device
+            self._hdwf = device._hdwf
+            self._functions = device._dwf._function_table("FDwfDigitalIO")
+            self.settings_cache = SettingsCache(self)
 
         def reset(self) -> None:
             """Reset and configure (by default, having auto configure enabled) all DigitalIO instrument parameters to default values.
 
             It sets the output enables to zero (tri-state), output value to zero, and configures the DigitalIO instrument.
             """
-            result = self._device._dwf._lib.FDwfDigitalIOReset(self._device._hdwf)
+            result = self._functions.FDwfDigitalIOReset(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def configure(self) -> None:
             """Configure the DigitalIO instrument. This doesn’t have to be used if AutoConfiguration is enabled."""
-            result = self._device._dwf._lib.FDwfDigitalIOConfigure(self._device._hdwf)
+            result = self._functions.FDwfDigitalIOConfigure(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -3001,17 +5379,18 @@ class DigilentWaveformsDevice:
 
             The status and values are accessed from the FDwfDigitalIOInputStatus function.
             """
-            result = self._device._dwf._lib.FDwfDigitalIOStatus(self._device._hdwf)
+            result = self._functions.FDwfDigitalIOStatus(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
+        @_capability
         def outputEnableInfo(self) -> int:
             """Return the output enable mask (bit set) that can be used on this device.
 
             These are the pins that can be used as outputs on the device.
             """
             c_output_enable_mask = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalIOOutputEnableInfo(self._device._hdwf, c_output_enable_mask)
+            result = self._functions.FDwfDigitalIOOutputEnableInfo(self._hdwf, c_output_enable_mask)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             output_enable_mask = c_output_enable_mask.value
@@ -3022,23 +5401,24 @@ class DigilentWaveformsDevice:
 
             This is done by setting bits in the fsOutEnable bit field (1 for enabled, 0 for disabled).
             """
-            result = self._device._dwf._lib.FDwfDigitalIOOutputEnableSet(self._device._hdwf, output_enable)
+            result = self._functions.FDwfDigitalIOOutputEnableSet(self._hdwf, output_enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def outputEnableGet(self) -> int:
             """Return a bit field that specifies which output pins have been enabled."""
             c_output_enable = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalIOOutputEnableGet(self._device._hdwf, c_output_enable)
+            result = self._functions.FDwfDigitalIOOutputEnableGet(self._hdwf, c_output_enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             output_enable = c_output_enable.value
             return output_enable
 
+        @_capability
         def outputInfo(self) -> int:
             """Return the settable output value mask (bit set) that can be used on this device."""
             c_output_mask = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalIOOutputInfo(self._device._hdwf, c_output_mask)
+            result = self._functions.FDwfDigitalIOOutputInfo(self._hdwf, c_output_mask)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             output_mask = c_output_mask.value
@@ -3046,23 +5426,24 @@ class DigilentWaveformsDevice:
 
         def outputSet(self, output: int) -> None:
             """Set the output logic value on all output pins."""
-            result = self._device._dwf._lib.FDwfDigitalIOOutputSet(self._device._hdwf, output)
+            result = self._functions.FDwfDigitalIOOutputSet(self._hdwf, output)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def outputGet(self) -> int:
             """Return the currently set output values across all output pins."""
             c_output = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalIOOutputGet(self._device._hdwf, c_output)
+            result = self._functions.FDwfDigitalIOOutputGet(self._hdwf, c_output)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             output = c_output.value
             return output
 
+        @_capability
         def inputInfo(self) -> int:
             """Return the readable input value mask (bit set) that can be used on the device."""
             c_input_mask = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalIOInputInfo(self._device._hdwf, c_input_mask)
+            result = self._functions.FDwfDigitalIOInputInfo(self._hdwf, c_input_mask)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             input_mask = c_input_mask.value
@@ -3074,19 +5455,20 @@ class DigilentWaveformsDevice:
             Before calling this method, call the `status` method to read the Digital I/O states from the device.
             """
             c_input = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalIOInputStatus(self._device._hdwf, c_input)
+            result = self._functions.FDwfDigitalIOInputStatus(self._hdwf, c_input)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             input_ = c_input.value
             return input_
 
+        @_capability
         def outputEnableInfo64(self) -> int:
             """Return the output enable mask (bit set) that can be used on this device.
 
             These are the pins that can be used as outputs on the device.
             """
             c_output_enable_mask = _typespec_ctypes.c_unsigned_long_long()
-            result = self._device._dwf._lib.FDwfDigitalIOOutputEnableInfo64(self._device._hdwf, c_output_enable_mask)
+            result = self._functions.FDwfDigitalIOOutputEnableInfo64(self._hdwf, c_output_enable_mask)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             output_enable_mask = c_output_enable_mask.value
@@ -3097,23 +5479,24 @@ class DigilentWaveformsDevice:
 
             This is done by setting bits in the fsOutEnable bit field (1 for enabled, 0 for disabled).
             """
-            result = self._device._dwf._lib.FDwfDigitalIOOutputEnableSet64(self._device._hdwf, output_enable)
+            result = self._functions.FDwfDigitalIOOutputEnableSet64(self._hdwf, output_enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def outputEnableGet64(self) -> int:
             """Return a bit field that specifies which output pins have been enabled."""
             c_output_enable = _typespec_ctypes.c_unsigned_long_long()
-            result = self._device._dwf._lib.FDwfDigitalIOOutputEnableGet64(self._device._hdwf, c_output_enable)
+            result = self._functions.FDwfDigitalIOOutputEnableGet64(self._hdwf, c_output_enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             output_enable = c_output_enable.value
             return output_enable
 
+        @_capability
         def outputInfo64(self) -> int:
             """Return the settable output value mask (bit set) that can be used on this device."""
             c_output_mask = _typespec_ctypes.c_unsigned_long_long()
-            result = self._device._dwf._lib.FDwfDigitalIOOutputInfo64(self._device._hdwf, c_output_mask)
+            result = self._functions.FDwfDigitalIOOutputInfo64(self._hdwf, c_output_mask)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             output_mask = c_output_mask.value
@@ -3121,23 +5504,24 @@ class DigilentWaveformsDevice:
 
         def outputSet64(self, output: int) -> None:
             """Set the output logic value on all output pins."""
-            result = self._device._dwf._lib.FDwfDigitalIOOutputSet64(self._device._hdwf, output)
+            result = self._functions.FDwfDigitalIOOutputSet64(self._hdwf, output)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def outputGet64(self) -> int:
             """Return the currently set output values across all output pins."""
             c_output = _typespec_ctypes.c_unsigned_long_long()
-            result = self._device._dwf._lib.FDwfDigitalIOOutputGet64(self._device._hdwf, c_output)
+            result = self._functions.FDwfDigitalIOOutputGet64(self._hdwf, c_output)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             output = c_output.value
             return output
 
+        @_capability
         def inputInfo64(self) -> int:
             """Return the readable input value mask (bit set) that can be used on the device."""
             c_input_mask = _typespec_ctypes.c_unsigned_long_long()
-            result = self._device._dwf._lib.FDwfDigitalIOInputInfo64(self._device._hdwf, c_input_mask)
+            result = self._functions.FDwfDigitalIOInputInfo64(self._hdwf, c_input_mask)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             input_mask = c_input_mask.value
@@ -3149,7 +5533,7 @@ class DigilentWaveformsDevice:
             Before calling this method, call the `status` method to read the Digital I/O states from the device.
             """
             c_input = _typespec_ctypes.c_unsigned_long_long()
-            result = self._device._dwf._lib.FDwfDigitalIOInputStatus64(self._device._hdwf, c_input)
+            result = self._functions.FDwfDigitalIOInputStatus64(self._hdwf, c_input)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             input_ = c_input.value
@@ -3162,21 +5546,25 @@ class DigilentWaveformsDevice:
         """
         def __init__(self, device: 'DigilentWaveformsDevice') -> None:
             self._device = device
+            self._hdwf = device._hdwf
+            self._functions = device._dwf._function_table("FDwfDigitalIn")
+            self.settings_cache = SettingsCache(self)
+            self.statistics = AcquisitionStatistics()
 
         def reset(self) -> None:
             """Resets and configures (by default, having auto configure enabled) all DigitalIn instrument parameters to default values."""
-            result = self._device._dwf._lib.FDwfDigitalInReset(self._device._hdwf)
+            result = self._functions.FDwfDigitalInReset(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def configure(self, reconfigure: bool, start: bool) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInConfigure(self._device._hdwf, reconfigure, start)
+            result = self._functions.FDwfDigitalInConfigure(self._hdwf, reconfigure, start)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def status(self, readData: bool) -> DwfState:
             c_sts = _typespec_ctypes.DwfState()
-            result = self._device._dwf._lib.FDwfDigitalInStatus(self._device._hdwf, readData, c_sts)
+            result = self._functions.FDwfDigitalInStatus(self._hdwf, readData, c_sts)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             sts = DwfState(c_sts.value)
@@ -3185,7 +5573,7 @@ class DigilentWaveformsDevice:
         def statusSamplesLeft(self) -> int:
             """Retrieve the number of samples left in the acquisition."""
             c_samplesLeft = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInStatusSamplesLeft(self._device._hdwf, c_samplesLeft)
+            result = self._functions.FDwfDigitalInStatusSamplesLeft(self._hdwf, c_samplesLeft)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             samplesLeft = c_samplesLeft.value
@@ -3194,7 +5582,7 @@ class DigilentWaveformsDevice:
         def statusSamplesValid(self) -> int:
             """Retrieve the number of valid/acquired data samples."""
             c_samplesValid = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInStatusSamplesValid(self._device._hdwf, c_samplesValid)
+            result = self._functions.FDwfDigitalInStatusSamplesValid(self._hdwf, c_samplesValid)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             samplesValid = c_samplesValid.value
@@ -3206,7 +5594,7 @@ class DigilentWaveformsDevice:
             This is needed in ScanScreen acquisition mode to display the scan bar.
             """
             c_idxWrite = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInStatusIndexWrite(self._device._hdwf, c_idxWrite)
+            result = self._functions.FDwfDigitalInStatusIndexWrite(self._hdwf, c_idxWrite)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             idxWrite = c_idxWrite.value
@@ -3215,35 +5603,46 @@ class DigilentWaveformsDevice:
         def statusAutoTriggered(self) -> bool:
             """Verify if the acquisition is auto triggered."""
             c_auto = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInStatusAutoTriggered(self._device._hdwf, c_auto)
+            result = self._functions.FDwfDigitalInStatusAutoTriggered(self._hdwf, c_auto)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             auto = bool(c_auto.value)
             return auto
 
-        def statusData(self, count_bytes: int) -> np.ndarray:
+        def statusData(self, count_bytes: int, out: Optional[np.ndarray]=None) -> np.ndarray:
             """Retrieve the acquired data samples from the DigitalIn instrument.
             It copies the data samples to the provided buffer.
+
+            If 'out' is given, the samples are written into it and it is returned; no new array is allocated.
+            It must be a contiguous, writeable 1D array of an unsigned integer dtype that is exactly 'count_bytes' bytes in size.
             """
-            samples = np.empty(count_bytes, dtype='B')
-            result = self._device._dwf._lib.FDwfDigitalInStatusData(self._device._hdwf, samples.ctypes.data_as(_typespec_ctypes.c_unsigned_char_ptr), count_bytes)
+            samples = _prepare_output_bytes(out, count_bytes)
+            result = self._functions.FDwfDigitalInStatusData(self._hdwf, samples.ctypes.data_as(_typespec_ctypes.c_unsigned_char_ptr), count_bytes)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             return samples
 
-        def statusData2(self, first_sample: int, count_bytes: int) -> np.ndarray:
+        def statusData2(self, first_sample: int, count_bytes: int, out: Optional[np.ndarray]=None) -> np.ndarray:
             """Retrieve the acquired data samples from the DigitalIn instrument.
+
+            If 'out' is given, the samples are written into it and it is returned; no new array is allocated.
+            It must be a contiguous, writeable 1D array of an unsigned integer dtype that is exactly 'count_bytes' bytes in size.
             """
 
-            samples = np.empty(count_bytes, dtype='B')
-            result = self._device._dwf._lib.FDwfDigitalInStatusData2(self._device._hdwf, samples.ctypes.data_as(_typespec_ctypes.c_unsigned_char_ptr), first_sample, count_bytes)
+            samples = _prepare_output_bytes(out, count_bytes)
+            result = self._functions.FDwfDigitalInStatusData2(self._hdwf, samples.ctypes.data_as(_typespec_ctypes.c_unsigned_char_ptr), first_sample, count_bytes)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             return samples
 
-        def statusNoise2(self, first_sample: int, count_bytes: int) -> np.ndarray:
-            noise = np.empty(count_bytes, dtype='B')
-            result = self._device._dwf._lib.FDwfDigitalInStatusNoise2(self._device._hdwf, noise.ctypes.data_as(_typespec_ctypes.c_unsigned_char_ptr), first_sample, count_bytes)
+        def statusNoise2(self, first_sample: int, count_bytes: int, out: Optional[np.ndarray]=None) -> np.ndarray:
+            """Retrieve the noise data from the DigitalIn instrument.
+
+            If 'out' is given, the noise data is written into it and it is returned; no new array is allocated.
+            It must be a contiguous, writeable 1D array of an unsigned integer dtype that is exactly 'count_bytes' bytes in size.
+            """
+            noise = _prepare_output_bytes(out, count_bytes)
+            result = self._functions.FDwfDigitalInStatusNoise2(self._hdwf, noise.ctypes.data_as(_typespec_ctypes.c_unsigned_char_ptr), first_sample, count_bytes)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             return noise
@@ -3253,7 +5652,7 @@ class DigilentWaveformsDevice:
             c_data_available = _typespec_ctypes.c_int()
             c_data_lost = _typespec_ctypes.c_int()
             c_data_corrupt = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInStatusRecord(self._device._hdwf, c_data_available, c_data_lost, c_data_corrupt)
+            result = self._functions.FDwfDigitalInStatusRecord(self._hdwf, c_data_available, c_data_lost, c_data_corrupt)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             data_free = c_data_available.value
@@ -3261,12 +5660,117 @@ class DigilentWaveformsDevice:
             data_corrupt = c_data_corrupt.value
             return (data_free, data_lost, data_corrupt)
 
+        def _record_polls(self, poll_interval: float=0.0, scheduler: Optional[PollScheduler]=None, should_stop: Optional[Callable[[], bool]]=None) -> Iterator[Tuple[int, int, int, bool]]:
+            """Poll a running record acquisition until it is done.
+
+            For each poll, the instrument status is fetched (including its sample data) and an
+            (available, lost, corrupt, done) tuple is yielded. The caller should read the available samples before
+            resuming the generator. If a 'scheduler' is given, it determines when to poll; otherwise, if 'poll_interval'
+            is nonzero, the generator sleeps that many seconds between polls.
+
+            If a 'should_stop' function is given, it is called before each poll; if it returns True, the acquisition
+            is stopped and the generator returns, even if the instrument is still waiting for its trigger.
+            """
+            functions = self._functions
+            hdwf = self._hdwf
+            c_status = _typespec_ctypes.DwfState()
+            c_available = _typespec_ctypes.c_int()
+            c_lost = _typespec_ctypes.c_int()
+            c_corrupt = _typespec_ctypes.c_int()
+            done_value = DwfState.Done.value
+
+            statistics = self.statistics if self.statistics.enabled else None
+
+            while True:
+                if scheduler is not None:
+                    scheduler.wait()
+                if should_stop is not None and should_stop():
+                    self.configure(False, False)
+                    return
+                if statistics is not None:
+                    t0 = time.perf_counter()
+                if functions.FDwfDigitalInStatus(hdwf, True, c_status) != _RESULT_SUCCESS:
+                    raise self._device._dwf._exception()
+                if statistics is not None:
+                    t1 = time.perf_counter()
+                if functions.FDwfDigitalInStatusRecord(hdwf, c_available, c_lost, c_corrupt) != _RESULT_SUCCESS:
+                    raise self._device._dwf._exception()
+                if statistics is not None:
+                    statistics.recordPoll(t1 - t0, c_available.value, c_lost.value, c_corrupt.value)
+                if scheduler is not None:
+                    scheduler.update(c_lost.value, c_corrupt.value)
+                done = (c_status.value == done_value)
+                yield (c_available.value, c_lost.value, c_corrupt.value, done)
+                if done:
+                    return
+                if scheduler is None and poll_interval > 0.0:
+                    time.sleep(poll_interval)
+
+        def recordStream(self, chunk_hint: Optional[int]=None, start: bool=True, poll_interval: float=0.0, allocate: Optional[Callable[[int], np.ndarray]]=None, scheduler: Optional[PollScheduler]=None, should_stop: Optional[Callable[[], bool]]=None) -> Iterator[RecordChunk]:
+            """Perform a record-mode acquisition, yielding the acquired samples as a stream of chunks.
+
+            Note:
+                This is a convenience method that doesn't directly encapsulate a single function call of the library.
+
+            This is the DigitalIn counterpart of AnalogInAPI.recordStream(). The instrument should be configured for
+            record mode before the stream is started.
+
+            Each chunk holds the samples as a 1D array of np.uint8, np.uint16, or np.uint32 values, according to the
+            configured sample format (see sampleFormatSet()). Samples that were reported lost are represented by zeroes.
+
+            If an 'allocate' function is given, it is called with a sample count to provide the destination array for the next chunk.
+
+            Args:
+                chunk_hint: The number of samples per chunk, or None to yield the samples as they become available.
+                start: If True, start the acquisition by calling configure(False, True) before polling.
+                poll_interval: Time to sleep between polls, in seconds. If zero, the instrument is polled continuously.
+                allocate: Optional function that provides the sample array for each chunk.
+                scheduler: Optional PollScheduler that determines when to poll; it takes precedence over 'poll_interval'.
+                should_stop: Optional function that is called before each poll; if it returns True, the acquisition is stopped
+                             and the stream ends after the samples acquired so far.
+
+            Returns:
+                An iterator that yields RecordChunk tuples.
+
+            Raises:
+                DigilentWaveformsLibraryError: the acquisition failed.
+                PyDwfError: the chunk size or sample format is not supported.
+            """
+            if chunk_hint is not None and chunk_hint <= 0:
+                raise PyDwfError("Bad chunk size: {!r}.".format(chunk_hint))
+
+            sample_format = self.sampleFormatGet()
+            dtype = {8: np.uint8, 16: np.uint16, 32: np.uint32}.get(sample_format)
+            if dtype is None:
+                raise PyDwfError("Unsupported DigitalIn sample format: {} bits.".format(sample_format))
+            itemsize = np.dtype(dtype).itemsize
+            status_data2 = self.statusData2
+
+            if allocate is None:
+                def allocate(count: int) -> np.ndarray:
+                    return np.empty(count, dtype=dtype)
+
+            statistics = self.statistics if self.statistics.enabled else None
+
+            def read(offset: int, count: int, out: np.ndarray) -> None:
+                if statistics is None:
+                    status_data2(offset, count * itemsize, out)
+                else:
+                    t0 = time.perf_counter()
+                    status_data2(offset, count * itemsize, out)
+                    statistics.recordRead(time.perf_counter() - t0)
+
+            if start:
+                self.configure(False, True)
+
+            return _record_chunks(self._record_polls(poll_interval, scheduler, should_stop), allocate, read, 0, chunk_hint)
+
         def statusTime(self) -> Tuple[int, int, int]:
             """Retrieve timestamp of status."""
             c_sec_utc = _typespec_ctypes.c_unsigned_int()
             c_tick = _typespec_ctypes.c_unsigned_int()
             c_ticks_per_second = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalInStatusTime(self._device._hdwf, c_sec_utc, c_tick, c_ticks_per_second)
+            result = self._functions.FDwfDigitalInStatusTime(self._hdwf, c_sec_utc, c_tick, c_ticks_per_second)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             sec_utc = c_sec_utc.value
@@ -3274,18 +5778,20 @@ class DigilentWaveformsDevice:
             ticks_per_second = c_ticks_per_second.value
             return (sec_utc, tick, ticks_per_second)
 
+        @_capability
         def internalClockInfo(self) -> float:
             c_hzFreq = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfDigitalInInternalClockInfo(self._device._hdwf, c_hzFreq)
+            result = self._functions.FDwfDigitalInInternalClockInfo(self._hdwf, c_hzFreq)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             hzFreq = c_hzFreq.value
             return hzFreq
 
+        @_capability
         def clockSourceInfo(self) -> List[DwfDigitalInClockSource]:
             """Get digital-in clock source info."""
             c_clock_source_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInClockSourceInfo(self._device._hdwf, c_clock_source_bitset)
+            result = self._functions.FDwfDigitalInClockSourceInfo(self._hdwf, c_clock_source_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             clock_source_bitset = c_clock_source_bitset.value
@@ -3293,55 +5799,57 @@ class DigilentWaveformsDevice:
             return clock_source_list
 
         def clockSourceSet(self, clock_source: DwfDigitalInClockSource) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInClockSourceSet(self._device._hdwf, clock_source.value)
+            result = self._functions.FDwfDigitalInClockSourceSet(self._hdwf, clock_source.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def clockSourceGet(self) -> DwfDigitalInClockSource:
             c_clock_source = _typespec_ctypes.DwfDigitalInClockSource()
-            result = self._device._dwf._lib.FDwfDigitalInClockSourceGet(self._device._hdwf, c_clock_source)
+            result = self._functions.FDwfDigitalInClockSourceGet(self._hdwf, c_clock_source)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             clock_source = DwfDigitalInClockSource(c_clock_source.value)
             return clock_source
 
+        @_capability
         def dividerInfo(self) -> int:
             c_divMax = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalInDividerInfo(self._device._hdwf, c_divMax)
+            result = self._functions.FDwfDigitalInDividerInfo(self._hdwf, c_divMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             divMax = c_divMax.value
             return divMax
 
         def dividerSet(self, div: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInDividerSet(self._device._hdwf, div)
+            result = self._functions.FDwfDigitalInDividerSet(self._hdwf, div)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def dividerGet(self) -> int:
             c_div = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalInDividerGet(self._device._hdwf, c_div)
+            result = self._functions.FDwfDigitalInDividerGet(self._hdwf, c_div)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             div = c_div.value
             return div
 
+        @_capability
         def bitsInfo(self) -> int:
             c_nBits = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInBitsInfo(self._device._hdwf, c_nBits)
+            result = self._functions.FDwfDigitalInBitsInfo(self._hdwf, c_nBits)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             nBits = c_nBits.value
             return nBits
 
         def sampleFormatSet(self, nBits: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInSampleFormatSet(self._device._hdwf, nBits)
+            result = self._functions.FDwfDigitalInSampleFormatSet(self._hdwf, nBits)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def sampleFormatGet(self) -> int:
             c_nBits = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInSampleFormatGet(self._device._hdwf, c_nBits)
+            result = self._functions.FDwfDigitalInSampleFormatGet(self._hdwf, c_nBits)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             nBits = c_nBits.value
@@ -3354,35 +5862,37 @@ class DigilentWaveformsDevice:
             If dioFirst is False, DIN 0..23 are placed at the beginning followed by DIO 24..31.
             Valid only for Digital Discovery device.
             """
-            result = self._device._dwf._lib.FDwfDigitalInInputOrderSet(self._device._hdwf, dioFirst)
+            result = self._functions.FDwfDigitalInInputOrderSet(self._hdwf, dioFirst)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
+        @_capability
         def bufferSizeInfo(self) -> int:
             c_nSizeMax = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInBufferSizeInfo(self._device._hdwf, c_nSizeMax)
+            result = self._functions.FDwfDigitalInBufferSizeInfo(self._hdwf, c_nSizeMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             nSizeMax = c_nSizeMax.value
             return nSizeMax
 
         def bufferSizeSet(self, nSize: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInBufferSizeSet(self._device._hdwf, nSize)
+            result = self._functions.FDwfDigitalInBufferSizeSet(self._hdwf, nSize)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def bufferSizeGet(self) -> int:
             c_nSize = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInBufferSizeGet(self._device._hdwf, c_nSize)
+            result = self._functions.FDwfDigitalInBufferSizeGet(self._hdwf, c_nSize)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             nSize = c_nSize.value
             return nSize
 
+        @_capability
         def sampleModeInfo(self) -> List[DwfDigitalInSampleMode]:
             """Get digital-in sample mode info."""
             c_sample_mode_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInSampleModeInfo(self._device._hdwf, c_sample_mode_bitset)
+            result = self._functions.FDwfDigitalInSampleModeInfo(self._hdwf, c_sample_mode_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             sample_mode_bitset = c_sample_mode_bitset.value
@@ -3390,35 +5900,36 @@ class DigilentWaveformsDevice:
             return sample_mode_list
 
         def sampleModeSet(self, sample_mode: DwfDigitalInSampleMode) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInSampleModeSet(self._device._hdwf, sample_mode.value)
+            result = self._functions.FDwfDigitalInSampleModeSet(self._hdwf, sample_mode.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def sampleModeGet(self) -> DwfDigitalInSampleMode:
             c_sample_mode = _typespec_ctypes.DwfDigitalInSampleMode()
-            result = self._device._dwf._lib.FDwfDigitalInSampleModeGet(self._device._hdwf, c_sample_mode)
+            result = self._functions.FDwfDigitalInSampleModeGet(self._hdwf, c_sample_mode)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             sample_mode = DwfDigitalInSampleMode(c_sample_mode.value)
             return sample_mode
 
         def sampleSensibleSet(self, compression_bits: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInSampleSensibleSet(self._device._hdwf, compression_bits)
+            result = self._functions.FDwfDigitalInSampleSensibleSet(self._hdwf, compression_bits)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def sampleSensibleGet(self) -> int:
             c_compression_bits = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalInSampleSensibleGet(self._device._hdwf, c_compression_bits)
+            result = self._functions.FDwfDigitalInSampleSensibleGet(self._hdwf, c_compression_bits)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             compression_bits = c_compression_bits.value
             return compression_bits
 
+        @_capability
         def acquisitionModeInfo(self) -> List[ACQMODE]:
             """Get digital-in acquisition mode info."""
             c_acquisition_mode_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInAcquisitionModeInfo(self._device._hdwf, c_acquisition_mode_bitset)
+            result = self._functions.FDwfDigitalInAcquisitionModeInfo(self._hdwf, c_acquisition_mode_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             acquisiton_mode_bitset = c_acquisition_mode_bitset.value
@@ -3426,13 +5937,13 @@ class DigilentWaveformsDevice:
             return acquisition_mode_list
 
         def acquisitionModeSet(self, acquisition_mode: ACQMODE) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInAcquisitionModeSet(self._device._hdwf, acquisition_mode.value)
+            result = self._functions.FDwfDigitalInAcquisitionModeSet(self._hdwf, acquisition_mode.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def acquisitionModeGet(self) -> ACQMODE:
             c_acquisition_mode = _typespec_ctypes.ACQMODE()
-            result = self._device._dwf._lib.FDwfDigitalInAcquisitionModeGet(self._device._hdwf, c_acquisition_mode)
+            result = self._functions.FDwfDigitalInAcquisitionModeGet(self._hdwf, c_acquisition_mode)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             acquisition_mode = ACQMODE(c_acquisition_mode.value)
@@ -3441,26 +5952,26 @@ class DigilentWaveformsDevice:
         # Trigger functions:
 
         def triggerSourceSet(self, trigger_source: TRIGSRC) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInTriggerSourceSet(self._device._hdwf, trigger_source.value)
+            result = self._functions.FDwfDigitalInTriggerSourceSet(self._hdwf, trigger_source.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerSourceGet(self) -> TRIGSRC:
             c_trigger_source = _typespec_ctypes.TRIGSRC()
-            result = self._device._dwf._lib.FDwfDigitalInTriggerSourceGet(self._device._hdwf, c_trigger_source)
+            result = self._functions.FDwfDigitalInTriggerSourceGet(self._hdwf, c_trigger_source)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_source = TRIGSRC(c_trigger_source.value)
             return trigger_source
 
         def triggerSlopeSet(self, trigger_slope: DwfTriggerSlope) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInTriggerSlopeSet(self._device._hdwf, trigger_slope.value)
+            result = self._functions.FDwfDigitalInTriggerSlopeSet(self._hdwf, trigger_slope.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerSlopeGet(self) -> DwfTriggerSlope:
             c_trigger_slope = _typespec_ctypes.DwfTriggerSlope()
-            result = self._device._dwf._lib.FDwfDigitalInTriggerSlopeGet(self._device._hdwf, c_trigger_slope)
+            result = self._functions.FDwfDigitalInTriggerSlopeGet(self._hdwf, c_trigger_slope)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_slope = DwfTriggerSlope(c_trigger_slope.value)
@@ -3468,43 +5979,44 @@ class DigilentWaveformsDevice:
 
         def triggerPositionInfo(self) -> int:
             c_max_samples_after_trigger = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalInTriggerPositionInfo(self._device._hdwf, c_max_samples_after_trigger)
+            result = self._functions.FDwfDigitalInTriggerPositionInfo(self._hdwf, c_max_samples_after_trigger)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             max_samples_after_trigger = c_max_samples_after_trigger.value
             return max_samples_after_trigger
 
         def triggerPositionSet(self, samples_after_trigger: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInTriggerPositionSet(self._device._hdwf, samples_after_trigger)
+            result = self._functions.FDwfDigitalInTriggerPositionSet(self._hdwf, samples_after_trigger)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerPositionGet(self) -> int:
             c_samples_after_trigger = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalInTriggerPositionGet(self._device._hdwf, c_samples_after_trigger)
+            result = self._functions.FDwfDigitalInTriggerPositionGet(self._hdwf, c_samples_after_trigger)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             samples_after_trigger = c_samples_after_trigger.value
             return samples_after_trigger
 
         def triggerPrefillSet(self, samples_before_trigger: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInTriggerPrefillSet(self._device._hdwf, samples_before_trigger)
+            result = self._functions.FDwfDigitalInTriggerPrefillSet(self._hdwf, samples_before_trigger)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerPrefillGet(self) -> int:
             c_samples_before_trigger = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalInTriggerPrefillGet(self._device._hdwf, c_samples_before_trigger)
+            result = self._functions.FDwfDigitalInTriggerPrefillGet(self._hdwf, c_samples_before_trigger)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             samples_before_trigger = c_samples_before_trigger.value
             return samples_before_trigger
 
+        @_capability
         def triggerAutoTimeoutInfo(self) -> Tuple[float, float, float]:
             c_secMin = _typespec_ctypes.c_double()
             c_secMax = _typespec_ctypes.c_double()
             c_nSteps = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfDigitalInTriggerAutoTimeoutInfo(self._device._hdwf, c_secMin, c_secMax, c_nSteps)
+            result = self._functions.FDwfDigitalInTriggerAutoTimeoutInfo(self._hdwf, c_secMin, c_secMax, c_nSteps)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secMin = c_secMin.value
@@ -3513,24 +6025,25 @@ class DigilentWaveformsDevice:
             return (secMin, secMax, nSteps)
 
         def triggerAutoTimeoutSet(self, secTimout: float) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInTriggerAutoTimeoutSet(self._device._hdwf, secTimout)
+            result = self._functions.FDwfDigitalInTriggerAutoTimeoutSet(self._hdwf, secTimout)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerAutoTimeoutGet(self) -> float:
             c_secTimeout = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfDigitalInTriggerAutoTimeoutGet(self._device._hdwf, c_secTimeout)
+            result = self._functions.FDwfDigitalInTriggerAutoTimeoutGet(self._hdwf, c_secTimeout)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secTimeout = c_secTimeout.value
             return secTimeout
 
+        @_capability
         def triggerInfo(self) -> Tuple[int, int, int, int]:
             c_fsLevelLow  = _typespec_ctypes.c_unsigned_int()
             c_fsLevelHigh = _typespec_ctypes.c_unsigned_int()
             c_fsEdgeRise  = _typespec_ctypes.c_unsigned_int()
             c_fsEdgeFall  = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalInTriggerInfo(self._device._hdwf, c_fsLevelLow, c_fsLevelHigh, c_fsEdgeRise, c_fsEdgeFall)
+            result = self._functions.FDwfDigitalInTriggerInfo(self._hdwf, c_fsLevelLow, c_fsLevelHigh, c_fsEdgeRise, c_fsEdgeFall)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             fsLevelLow  = c_fsLevelLow.value
@@ -3540,7 +6053,7 @@ class DigilentWaveformsDevice:
             return (fsLevelLow, fsLevelHigh, fsEdgeRise, fsEdgeFall)
 
         def triggerSet(self, fsLevelLow: int, fsLevelHigh: int, fsEdgeRise: int, fsEdgeFall: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInTriggerSet(self._device._hdwf, fsLevelLow, fsLevelHigh, fsEdgeRise, fsEdgeFall)
+            result = self._functions.FDwfDigitalInTriggerSet(self._hdwf, fsLevelLow, fsLevelHigh, fsEdgeRise, fsEdgeFall)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -3549,7 +6062,7 @@ class DigilentWaveformsDevice:
             c_fsLevelHigh = _typespec_ctypes.c_unsigned_int()
             c_fsEdgeRise  = _typespec_ctypes.c_unsigned_int()
             c_fsEdgeFall  = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalInTriggerGet(self._device._hdwf, c_fsLevelLow, c_fsLevelHigh, c_fsEdgeRise, c_fsEdgeFall)
+            result = self._functions.FDwfDigitalInTriggerGet(self._hdwf, c_fsLevelLow, c_fsLevelHigh, c_fsEdgeRise, c_fsEdgeFall)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             fsLevelLow  = c_fsLevelLow.value
@@ -3559,29 +6072,29 @@ class DigilentWaveformsDevice:
             return (fsLevelLow, fsLevelHigh, fsEdgeRise, fsEdgeFall)
 
         def triggerResetSet(self, fsLevelLow: int, fsLevelHigh: int, fsEdgeRise: int, fsEdgeFall: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInTriggerResetSet(self._device._hdwf, fsLevelLow, fsLevelHigh, fsEdgeRise, fsEdgeFall)
+            result = self._functions.FDwfDigitalInTriggerResetSet(self._hdwf, fsLevelLow, fsLevelHigh, fsEdgeRise, fsEdgeFall)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerCountSet(self, count: int, restart: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInTriggerCountSet(self._device._hdwf, count, restart)
+            result = self._functions.FDwfDigitalInTriggerCountSet(self._hdwf, count, restart)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerLengthSet(self, secMin: float, secMax: float, idxSync: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInTriggerLengthSet(self._device._hdwf, secMin, secMax, idxSync)
+            result = self._functions.FDwfDigitalInTriggerLengthSet(self._hdwf, secMin, secMax, idxSync)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerMatchSet(self, pin: int, mask: int, value: int, bitstuffing: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInTriggerMatchSet(self._device._hdwf, pin, mask, value, bitstuffing)
+            result = self._functions.FDwfDigitalInTriggerMatchSet(self._hdwf, pin, mask, value, bitstuffing)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         # Obsolete functions:
 
         def mixedSet(self, enable: bool) -> None:
-            result = self._device._dwf._lib.FDwfDigitalInMixedSet(self._device._hdwf, enable)
+            result = self._functions.FDwfDigitalInMixedSet(self._hdwf, enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -3591,7 +6104,7 @@ class DigilentWaveformsDevice:
             Note: This function is OBSOLETE. Use the generic `DeviceAPI.triggerInfo()` method instead.
             """
             c_trigger_source_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalInTriggerSourceInfo(self._device._hdwf, c_trigger_source_bitset)
+            result = self._functions.FDwfDigitalInTriggerSourceInfo(self._hdwf, c_trigger_source_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_source_bitset = c_trigger_source_bitset.value
@@ -3606,35 +6119,39 @@ class DigilentWaveformsDevice:
         """
         def __init__(self, device: 'DigilentWaveformsDevice') -> None:
             self._device = device
+            self._hdwf = device._hdwf
+            self._functions = device._dwf._function_table("FDwfDigitalOut")
+            self.settings_cache = SettingsCache(self)
 
         def reset(self) -> None:
             """Resets the digital-out instrument."""
-            result = self._device._dwf._lib.FDwfDigitalOutReset(self._device._hdwf)
+            result = self._functions.FDwfDigitalOutReset(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def configure(self, start: bool) -> None:
             """Starts or stops the digital-out instrument."""
-            result = self._device._dwf._lib.FDwfDigitalOutConfigure(self._device._hdwf, start)
+            result = self._functions.FDwfDigitalOutConfigure(self._hdwf, start)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def status(self) -> DwfState:
             """Returns the status of the digital-out instrument."""
             c_status = _typespec_ctypes.DwfState()
-            result = self._device._dwf._lib.FDwfDigitalOutStatus(self._device._hdwf, c_status)
+            result = self._functions.FDwfDigitalOutStatus(self._hdwf, c_status)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             status_ = DwfState(c_status.value)
             return status_
 
+        @_capability
         def internalClockInfo(self) -> float:
             """Gets digital-out clock frequency.
 
             :returns: The digital-out clock frequency, in Hz.
             """
             c_frequency_hz = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfDigitalOutInternalClockInfo(self._device._hdwf, c_frequency_hz)
+            result = self._functions.FDwfDigitalOutInternalClockInfo(self._hdwf, c_frequency_hz)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             frequency_hz = c_frequency_hz.value
@@ -3642,19 +6159,20 @@ class DigilentWaveformsDevice:
 
         def triggerSourceSet(self, trigger_source: TRIGSRC) -> None:
             """Sets the trigger source."""
-            result = self._device._dwf._lib.FDwfDigitalOutTriggerSourceSet(self._device._hdwf, trigger_source.value)
+            result = self._functions.FDwfDigitalOutTriggerSourceSet(self._hdwf, trigger_source.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerSourceGet(self) -> TRIGSRC:
             """Gets the currently active trigger source."""
             c_trigger_source = _typespec_ctypes.TRIGSRC()
-            result = self._device._dwf._lib.FDwfDigitalOutTriggerSourceGet(self._device._hdwf, c_trigger_source)
+            result = self._functions.FDwfDigitalOutTriggerSourceGet(self._hdwf, c_trigger_source)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_source = TRIGSRC(c_trigger_source.value)
             return trigger_source
 
+        @_capability
         def runInfo(self) -> Tuple[float, float]:
             """Gets minimal and maximal duration for a single digital-out pulse sequence run.
 
@@ -3662,7 +6180,7 @@ class DigilentWaveformsDevice:
             """
             c_secMin = _typespec_ctypes.c_double()
             c_secMax = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfDigitalOutRunInfo(self._device._hdwf, c_secMin, c_secMax)
+            result = self._functions.FDwfDigitalOutRunInfo(self._hdwf, c_secMin, c_secMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secMin = c_secMin.value
@@ -3674,7 +6192,7 @@ class DigilentWaveformsDevice:
 
             :param secRun: Digital-out runtime, in seconds. The value 0 means: run forever.
             """
-            result = self._device._dwf._lib.FDwfDigitalOutRunSet(self._device._hdwf, secRun)
+            result = self._functions.FDwfDigitalOutRunSet(self._hdwf, secRun)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -3684,7 +6202,7 @@ class DigilentWaveformsDevice:
             :returns: digital out run-time, in seconds.
             """
             c_secRun = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfDigitalOutRunGet(self._device._hdwf, c_secRun)
+            result = self._functions.FDwfDigitalOutRunGet(self._hdwf, c_secRun)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secRun = c_secRun.value
@@ -3693,12 +6211,13 @@ class DigilentWaveformsDevice:
         def runStatus(self) -> float:
             """Gets run-time for the currently active digital-out pulse-sequence run."""
             c_secRun = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfDigitalOutRunStatus(self._device._hdwf, c_secRun)
+            result = self._functions.FDwfDigitalOutRunStatus(self._hdwf, c_secRun)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secRun = c_secRun.value
             return secRun
 
+        @_capability
         def waitInfo(self) -> Tuple[float, float]:
             """Gets minimal and maximal wait-time between consecutive digital-out pulse-sequence runs.
 
@@ -3706,7 +6225,7 @@ class DigilentWaveformsDevice:
             """
             c_secMin = _typespec_ctypes.c_double()
             c_secMax = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfDigitalOutWaitInfo(self._device._hdwf, c_secMin, c_secMax)
+            result = self._functions.FDwfDigitalOutWaitInfo(self._hdwf, c_secMin, c_secMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secMin = c_secMin.value
@@ -3718,7 +6237,7 @@ class DigilentWaveformsDevice:
 
             :param secRun: Digital-out wait-time, in seconds.
             """
-            result = self._device._dwf._lib.FDwfDigitalOutWaitSet(self._device._hdwf, secWait)
+            result = self._functions.FDwfDigitalOutWaitSet(self._hdwf, secWait)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -3728,12 +6247,13 @@ class DigilentWaveformsDevice:
             :returns: digital out wait-time, in seconds.
             """
             c_secWait = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfDigitalOutWaitGet(self._device._hdwf, c_secWait)
+            result = self._functions.FDwfDigitalOutWaitGet(self._hdwf, c_secWait)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             secWait = c_secWait.value
             return secWait
 
+        @_capability
         def repeatInfo(self) -> Tuple[int, int]:
             """Gets minimal and maximal repeat count for digital-out pulse-sequence runs.
 
@@ -3741,7 +6261,7 @@ class DigilentWaveformsDevice:
             """
             c_nMin = _typespec_ctypes.c_unsigned_int()
             c_nMax = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalOutRepeatInfo(self._device._hdwf, c_nMin, c_nMax)
+            result = self._functions.FDwfDigitalOutRepeatInfo(self._hdwf, c_nMin, c_nMax)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             nMin = c_nMin.value
@@ -3753,7 +6273,7 @@ class DigilentWaveformsDevice:
 
             :param repeat: Repeat count. Specify 0 to repeat forever.
             """
-            result = self._device._dwf._lib.FDwfDigitalOutRepeatSet(self._device._hdwf, repeat)
+            result = self._functions.FDwfDigitalOutRepeatSet(self._hdwf, repeat)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -3763,7 +6283,7 @@ class DigilentWaveformsDevice:
             :returns: Repeat count. 0 means: run forever.
             """
             c_repeat = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalOutRepeatGet(self._device._hdwf, c_repeat)
+            result = self._functions.FDwfDigitalOutRepeatGet(self._hdwf, c_repeat)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             repeat = c_repeat.value
@@ -3772,7 +6292,7 @@ class DigilentWaveformsDevice:
         def repeatStatus(self) -> int:
             """Gets repeat status for the currently active digital-out train of pulse-sequence runs."""
             c_repeat_status = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalOutRepeatStatus(self._device._hdwf, c_repeat_status)
+            result = self._functions.FDwfDigitalOutRepeatStatus(self._hdwf, c_repeat_status)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             repeat_status = c_repeat_status.value
@@ -3780,14 +6300,14 @@ class DigilentWaveformsDevice:
 
         def triggerSlopeSet(self, trigger_slope: DwfTriggerSlope) -> None:
             """Sets the slope for the digital-out trigger."""
-            result = self._device._dwf._lib.FDwfDigitalOutTriggerSlopeSet(self._device._hdwf, trigger_slope.value)
+            result = self._functions.FDwfDigitalOutTriggerSlopeSet(self._hdwf, trigger_slope.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def triggerSlopeGet(self) -> DwfTriggerSlope:
             """Gets the slope for the digital-out trigger."""
             c_trigger_slope = _typespec_ctypes.DwfTriggerSlope()
-            result = self._device._dwf._lib.FDwfDigitalOutTriggerSlopeGet(self._device._hdwf, c_trigger_slope)
+            result = self._functions.FDwfDigitalOutTriggerSlopeGet(self._hdwf, c_trigger_slope)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_slope = DwfTriggerSlope(c_trigger_slope.value)
@@ -3795,23 +6315,24 @@ class DigilentWaveformsDevice:
 
         def repeatTriggerSet(self, repeatTrigger: bool) -> None:
             """Specify if each pulse sequence run should wait for its own trigger."""
-            result = self._device._dwf._lib.FDwfDigitalOutRepeatTriggerSet(self._device._hdwf, repeatTrigger)
+            result = self._functions.FDwfDigitalOutRepeatTriggerSet(self._hdwf, repeatTrigger)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def repeatTriggerGet(self) -> bool:
             """Get if each pulse sequence run should wait for its own trigger."""
             c_repeatTrigger = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalOutRepeatTriggerGet(self._device._hdwf, c_repeatTrigger)
+            result = self._functions.FDwfDigitalOutRepeatTriggerGet(self._hdwf, c_repeatTrigger)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             repeatTrigger = bool(c_repeatTrigger.value)
             return repeatTrigger
 
+        @_capability
         def count(self) -> int:
             """Get digital-out channel count."""
             c_channel_count = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalOutCount(self._device._hdwf, c_channel_count)
+            result = self._functions.FDwfDigitalOutCount(self._hdwf, c_channel_count)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             channel_count = c_channel_count.value
@@ -3819,22 +6340,23 @@ class DigilentWaveformsDevice:
 
         def enableSet(self, channel_index: int, enable: bool) -> None:
             """Enables or disables a digital-out channel."""
-            result = self._device._dwf._lib.FDwfDigitalOutEnableSet(self._device._hdwf, channel_index, enable)
+            result = self._functions.FDwfDigitalOutEnableSet(self._hdwf, channel_index, enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def enableGet(self, channel_index: int) -> bool:
             """Checks if a specific digital-out channel is enabled."""
             c_enable = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalOutEnableGet(self._device._hdwf, channel_index, c_enable)
+            result = self._functions.FDwfDigitalOutEnableGet(self._hdwf, channel_index, c_enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             enable = bool(c_enable.value)
             return enable
 
+        @_capability
         def outputInfo(self, channel_index: int) -> List[DwfDigitalOutOutput]:
             c_output_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalOutOutputInfo(self._device._hdwf, channel_index, c_output_bitset)
+            result = self._functions.FDwfDigitalOutOutputInfo(self._hdwf, channel_index, c_output_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             output_bitset = c_output_bitset.value
@@ -3842,21 +6364,22 @@ class DigilentWaveformsDevice:
             return output_list
 
         def outputSet(self, channel_index: int, output_value: DwfDigitalOutOutput) -> None:
-            result = self._device._dwf._lib.FDwfDigitalOutOutputSet(self._device._hdwf, channel_index, output_value.value)
+            result = self._functions.FDwfDigitalOutOutputSet(self._hdwf, channel_index, output_value.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def outputGet(self, channel_index: int) -> DwfDigitalOutOutput:
             c_output_value = _typespec_ctypes.DwfDigitalOutOutput()
-            result = self._device._dwf._lib.FDwfDigitalOutOutputGet(self._device._hdwf, channel_index, c_output_value)
+            result = self._functions.FDwfDigitalOutOutputGet(self._hdwf, channel_index, c_output_value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             output_value = DwfDigitalOutOutput(c_output_value.value)
             return output_value
 
+        @_capability
         def typeInfo(self, channel_index: int) -> List[DwfDigitalOutType]:
             c_type_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalOutTypeInfo(self._device._hdwf, channel_index, c_type_bitset)
+            result = self._functions.FDwfDigitalOutTypeInfo(self._hdwf, channel_index, c_type_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             type_bitset = c_type_bitset.value
@@ -3864,21 +6387,22 @@ class DigilentWaveformsDevice:
             return type_list
 
         def typeSet(self, channel_index: int, output_type: DwfDigitalOutType) -> None:
-            result = self._device._dwf._lib.FDwfDigitalOutTypeSet(self._device._hdwf, channel_index, output_type.value)
+            result = self._functions.FDwfDigitalOutTypeSet(self._hdwf, channel_index, output_type.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def typeGet(self, channel_index: int) -> DwfDigitalOutType:
             c_output_type = _typespec_ctypes.DwfDigitalOutType()
-            result = self._device._dwf._lib.FDwfDigitalOutTypeGet(self._device._hdwf, channel_index, c_output_type)
+            result = self._functions.FDwfDigitalOutTypeGet(self._hdwf, channel_index, c_output_type)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             output_type = DwfDigitalOutType(c_output_type.value)
             return output_type
 
+        @_capability
         def idleInfo(self, channel_index: int) -> List[DwfDigitalOutIdle]:
             c_idle_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalOutIdleInfo(self._device._hdwf, channel_index, c_idle_bitset)
+            result = self._functions.FDwfDigitalOutIdleInfo(self._hdwf, channel_index, c_idle_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             idle_bitset = c_idle_bitset.value
@@ -3886,22 +6410,23 @@ class DigilentWaveformsDevice:
             return idle_list
 
         def idleSet(self, channel_index: int, idle_mode: DwfDigitalOutIdle) -> None:
-            result = self._device._dwf._lib.FDwfDigitalOutIdleSet(self._device._hdwf, channel_index, idle_mode.value)
+            result = self._functions.FDwfDigitalOutIdleSet(self._hdwf, channel_index, idle_mode.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def idleGet(self, channel_index: int) -> DwfDigitalOutIdle:
             c_idle_mode = _typespec_ctypes.DwfDigitalOutIdle()
-            result = self._device._dwf._lib.FDwfDigitalOutIdleGet(self._device._hdwf, channel_index, c_idle_mode)
+            result = self._functions.FDwfDigitalOutIdleGet(self._hdwf, channel_index, c_idle_mode)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             idle_mode = DwfDigitalOutIdle(c_idle_mode.value)
             return idle_mode
 
+        @_capability
         def dividerInfo(self, channel_index: int) -> Tuple[int, int]:
             c_divider_init_min = _typespec_ctypes.c_unsigned_int()
             c_divider_init_max = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalOutDividerInfo(self._device._hdwf, channel_index, c_divider_init_min, c_divider_init_max)
+            result = self._functions.FDwfDigitalOutDividerInfo(self._hdwf, channel_index, c_divider_init_min, c_divider_init_max)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             divider_init_min = c_divider_init_min.value
@@ -3909,35 +6434,36 @@ class DigilentWaveformsDevice:
             return (divider_init_min, divider_init_max)
 
         def dividerInitSet(self, channel_index: int, divider_init: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalOutDividerInitSet(self._device._hdwf, channel_index, divider_init)
+            result = self._functions.FDwfDigitalOutDividerInitSet(self._hdwf, channel_index, divider_init)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def dividerInitGet(self, channel_index: int) -> int:
             c_divider_init = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalOutDividerInitGet(self._device._hdwf, channel_index, c_divider_init)
+            result = self._functions.FDwfDigitalOutDividerInitGet(self._hdwf, channel_index, c_divider_init)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             divider_init = c_divider_init.value
             return divider_init
 
         def dividerSet(self, channel_index: int, divider: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalOutDividerSet(self._device._hdwf, channel_index, divider)
+            result = self._functions.FDwfDigitalOutDividerSet(self._hdwf, channel_index, divider)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def dividerGet(self, channel_index: int) -> int:
             c_divider = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalOutDividerGet(self._device._hdwf, channel_index, c_divider)
+            result = self._functions.FDwfDigitalOutDividerGet(self._hdwf, channel_index, c_divider)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             divider = c_divider.value
             return divider
 
+        @_capability
         def counterInfo(self, channel_index: int) -> Tuple[int, int]:
             c_counter_min = _typespec_ctypes.c_unsigned_int()
             c_counter_max = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalOutCounterInfo(self._device._hdwf, channel_index, c_counter_min, c_counter_max)
+            result = self._functions.FDwfDigitalOutCounterInfo(self._hdwf, channel_index, c_counter_min, c_counter_max)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             counter_min = c_counter_min.value
@@ -3945,14 +6471,14 @@ class DigilentWaveformsDevice:
             return (counter_min, counter_max)
 
         def counterInitSet(self, channel_index: int, high: bool, counter_init: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalOutCounterInitSet(self._device._hdwf, channel_index, high, counter_init)
+            result = self._functions.FDwfDigitalOutCounterInitSet(self._hdwf, channel_index, high, counter_init)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def counterInitGet(self, channel_index: int) -> Tuple[int, int]:
             c_high = _typespec_ctypes.c_int()
             c_counter_init = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalOutCounterInitGet(self._device._hdwf, channel_index, c_high, c_counter_init)
+            result = self._functions.FDwfDigitalOutCounterInitGet(self._hdwf, channel_index, c_high, c_counter_init)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             high = c_high.value
@@ -3960,24 +6486,25 @@ class DigilentWaveformsDevice:
             return (high, counter_init)
 
         def counterSet(self, channel_index: int, low_count: int, high_count: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalOutCounterSet(self._device._hdwf, channel_index, low_count, high_count)
+            result = self._functions.FDwfDigitalOutCounterSet(self._hdwf, channel_index, low_count, high_count)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def counterGet(self, channel_index: int) -> Tuple[int, int]:
             c_low_count = _typespec_ctypes.c_unsigned_int()
             c_high_count = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalOutCounterGet(self._device._hdwf, channel_index, c_low_count, c_high_count)
+            result = self._functions.FDwfDigitalOutCounterGet(self._hdwf, channel_index, c_low_count, c_high_count)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             low_count = c_low_count.value
             high_count = c_high_count.value
             return (low_count, high_count)
 
+        @_capability
         def dataInfo(self, channel_index: int) -> int:
             """Return the maximum buffer size, the number of custom data bits."""
             c_max_databits = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalOutDataInfo(self._device._hdwf, channel_index, c_max_databits)
+            result = self._functions.FDwfDigitalOutDataInfo(self._hdwf, channel_index, c_max_databits)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             max_databits = c_max_databits.value
@@ -4000,17 +6527,17 @@ class DigilentWaveformsDevice:
 
             octets_as_bytes = bytes(octets)
 
-            result = self._device._dwf._lib.FDwfDigitalOutDataSet(self._device._hdwf, channel_index, octets_as_bytes, countOfBits)
+            result = self._functions.FDwfDigitalOutDataSet(self._hdwf, channel_index, octets_as_bytes, countOfBits)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def playDataSet(self, rg_bits: int, bits_per_sample: int, count_of_samples: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalOutPlayDataSet(self._device._hdwf, rg_bits, bits_per_sample, count_of_samples)
+            result = self._functions.FDwfDigitalOutPlayDataSet(self._hdwf, rg_bits, bits_per_sample, count_of_samples)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def playRateSet(self, rate_hz: float) -> None:
-            result = self._device._dwf._lib.FDwfDigitalOutPlayRateSet(self._device._hdwf, rate_hz)
+            result = self._functions.FDwfDigitalOutPlayRateSet(self._hdwf, rate_hz)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4020,7 +6547,7 @@ class DigilentWaveformsDevice:
             Note: This function is OBSOLETE. Use the generic DeviceAPI.triggerInfo() method instead.
             """
             c_trigger_source_bitset = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalOutTriggerSourceInfo(self._device._hdwf, c_trigger_source_bitset)
+            result = self._functions.FDwfDigitalOutTriggerSourceInfo(self._hdwf, c_trigger_source_bitset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             trigger_source_bitset = c_trigger_source_bitset.value
@@ -4034,46 +6561,48 @@ class DigilentWaveformsDevice:
         """
         def __init__(self, device: 'DigilentWaveformsDevice') -> None:
             self._device = device
+            self._hdwf = device._hdwf
+            self._functions = device._dwf._function_table("FDwfDigitalUart")
 
         def reset(self) -> None:
             """Resets the digital-UART protocol instrument."""
-            result = self._device._dwf._lib.FDwfDigitalUartReset(self._device._hdwf)
+            result = self._functions.FDwfDigitalUartReset(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def rateSet(self, hz: float) -> None:
-            result = self._device._dwf._lib.FDwfDigitalUartRateSet(self._device._hdwf, hz)
+            result = self._functions.FDwfDigitalUartRateSet(self._hdwf, hz)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def bitsSet(self, bits: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalUartBitsSet(self._device._hdwf, bits)
+            result = self._functions.FDwfDigitalUartBitsSet(self._hdwf, bits)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def paritySet(self, parity: int) -> None:
             # :param parity: 0 none, 1 odd, 2 even
-            result = self._device._dwf._lib.FDwfDigitalUartParitySet(self._device._hdwf, parity)
+            result = self._functions.FDwfDigitalUartParitySet(self._hdwf, parity)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def stopSet(self, stopbits: float) -> None:
-            result = self._device._dwf._lib.FDwfDigitalUartStopSet(self._device._hdwf, stopbits)
+            result = self._functions.FDwfDigitalUartStopSet(self._hdwf, stopbits)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def txSet(self, channel_index: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalUartTxSet(self._device._hdwf, channel_index)
+            result = self._functions.FDwfDigitalUartTxSet(self._hdwf, channel_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def rxSet(self, channel_index: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalUartRxSet(self._device._hdwf, channel_index)
+            result = self._functions.FDwfDigitalUartRxSet(self._hdwf, channel_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def tx(self, tx_data: bytes) -> None:
-            result = self._device._dwf._lib.FDwfDigitalUartTx(self._device._hdwf, tx_data, len(tx_data))
+            result = self._functions.FDwfDigitalUartTx(self._hdwf, tx_data, len(tx_data))
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4082,7 +6611,7 @@ class DigilentWaveformsDevice:
             c_rx_count = _typespec_ctypes.c_int()
             c_parity_error = _typespec_ctypes.c_int()
             c_rx_buffer = ctypes.create_string_buffer(rx_max)
-            result = self._device._dwf._lib.FDwfDigitalUartRx(self._device._hdwf, c_rx_buffer, rx_max, c_rx_count, c_parity_error)
+            result = self._functions.FDwfDigitalUartRx(self._hdwf, c_rx_buffer, rx_max, c_rx_count, c_parity_error)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             rx_count = c_rx_count.value
@@ -4097,20 +6626,22 @@ class DigilentWaveformsDevice:
         """
         def __init__(self, device: 'DigilentWaveformsDevice') -> None:
             self._device = device
+            self._hdwf = device._hdwf
+            self._functions = device._dwf._function_table("FDwfDigitalSpi")
 
         def reset(self) -> None:
             """Resets the digital-SPI protocol instrument."""
-            result = self._device._dwf._lib.FDwfDigitalSpiReset(self._device._hdwf)
+            result = self._functions.FDwfDigitalSpiReset(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def frequencySet(self, frequency: float) -> None:
-            result = self._device._dwf._lib.FDwfDigitalSpiFrequencySet(self._device._hdwf, frequency)
+            result = self._functions.FDwfDigitalSpiFrequencySet(self._hdwf, frequency)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def clockSet(self, channel_index: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalSpiClockSet(self._device._hdwf, channel_index)
+            result = self._functions.FDwfDigitalSpiClockSet(self._hdwf, channel_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4123,7 +6654,7 @@ class DigilentWaveformsDevice:
                 2 = DQ2
                 3 = DQ3
             """
-            result = self._device._dwf._lib.FDwfDigitalSpiDataSet(self._device._hdwf, data_select, channel_index)
+            result = self._functions.FDwfDigitalSpiDataSet(self._hdwf, data_select, channel_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4137,7 +6668,7 @@ class DigilentWaveformsDevice:
                 3 = DQ3
             """
 
-            result = self._device._dwf._lib.FDwfDigitalSpiIdleSet(self._device._hdwf, data_select, idle_mode.value)
+            result = self._functions.FDwfDigitalSpiIdleSet(self._hdwf, data_select, idle_mode.value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4149,19 +6680,19 @@ class DigilentWaveformsDevice:
                 2 = { CPOL = 1, CPHA = 0 }
                 3 = { CPOL = 1, CPHA = 1 }
             """
-            result = self._device._dwf._lib.FDwfDigitalSpiModeSet(self._device._hdwf, spi_mode)
+            result = self._functions.FDwfDigitalSpiModeSet(self._hdwf, spi_mode)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def orderSet(self, bit_order: int) -> None:
             # bit order: 1 MSB first, 0 LSB first
-            result = self._device._dwf._lib.FDwfDigitalSpiOrderSet(self._device._hdwf, bit_order)
+            result = self._functions.FDwfDigitalSpiOrderSet(self._hdwf, bit_order)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def select(self, channel_index: int, level: int) -> None:
             # 0 low, 1 high, -1 Z (high impedance)
-            result = self._device._dwf._lib.FDwfDigitalSpiSelect(self._device._hdwf, channel_index, level)
+            result = self._functions.FDwfDigitalSpiSelect(self._hdwf, channel_index, level)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4178,7 +6709,7 @@ class DigilentWaveformsDevice:
             tx_buffer = buffer_type(*tx_list)
             rx_buffer = buffer_type()
 
-            result = self._device._dwf._lib.FDwfDigitalSpiWriteRead(self._device._hdwf, transfer_type, bits_per_word, tx_buffer, number_of_words, rx_buffer, number_of_words)
+            result = self._functions.FDwfDigitalSpiWriteRead(self._hdwf, transfer_type, bits_per_word, tx_buffer, number_of_words, rx_buffer, number_of_words)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4199,7 +6730,7 @@ class DigilentWaveformsDevice:
             tx_buffer = buffer_type(*tx_list)
             rx_buffer = buffer_type()
 
-            result = self._device._dwf._lib.FDwfDigitalSpiWriteRead16(self._device._hdwf, transfer_type, bits_per_word, tx_buffer, number_of_words, rx_buffer, number_of_words)
+            result = self._functions.FDwfDigitalSpiWriteRead16(self._hdwf, transfer_type, bits_per_word, tx_buffer, number_of_words, rx_buffer, number_of_words)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4220,7 +6751,7 @@ class DigilentWaveformsDevice:
             tx_buffer = buffer_type(*tx_list)
             rx_buffer = buffer_type()
 
-            result = self._device._dwf._lib.FDwfDigitalSpiWriteRead32(self._device._hdwf, transfer_type, bits_per_word, tx_buffer, number_of_words, rx_buffer, number_of_words)
+            result = self._functions.FDwfDigitalSpiWriteRead32(self._hdwf, transfer_type, bits_per_word, tx_buffer, number_of_words, rx_buffer, number_of_words)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4235,7 +6766,7 @@ class DigilentWaveformsDevice:
 
             rx_buffer = buffer_type()
 
-            result = self._device._dwf._lib.FDwfDigitalSpiRead(self._device._hdwf, transfer_type, bits_per_word, rx_buffer, number_of_words)
+            result = self._functions.FDwfDigitalSpiRead(self._hdwf, transfer_type, bits_per_word, rx_buffer, number_of_words)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4246,7 +6777,7 @@ class DigilentWaveformsDevice:
         def readOne(self, dq: int, bits_per_word: int) -> int:
             # cDQ 0 SISO, 1 MOSI/MISO, 2 dual, 4 quad, // 1-32 bits / word
             c_rx = _typespec_ctypes.c_unsigned_int()
-            result = self._device._dwf._lib.FDwfDigitalSpiReadOne(self._device._hdwf, dq, bits_per_word, c_rx)
+            result = self._functions.FDwfDigitalSpiReadOne(self._hdwf, dq, bits_per_word, c_rx)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             rx = c_rx.value
@@ -4259,7 +6790,7 @@ class DigilentWaveformsDevice:
 
             rx_buffer = buffer_type()
 
-            result = self._device._dwf._lib.FDwfDigitalSpiRead16(self._device._hdwf, transfer_type, bits_per_word, rx_buffer, number_of_words)
+            result = self._functions.FDwfDigitalSpiRead16(self._hdwf, transfer_type, bits_per_word, rx_buffer, number_of_words)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4274,7 +6805,7 @@ class DigilentWaveformsDevice:
 
             rx_buffer = buffer_type()
 
-            result = self._device._dwf._lib.FDwfDigitalSpiRead32(self._device._hdwf, transfer_type, bits_per_word, rx_buffer, number_of_words)
+            result = self._functions.FDwfDigitalSpiRead32(self._hdwf, transfer_type, bits_per_word, rx_buffer, number_of_words)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4294,7 +6825,7 @@ class DigilentWaveformsDevice:
 
             tx_buffer = buffer_type(*tx_list)
 
-            result = self._device._dwf._lib.FDwfDigitalSpiWrite(self._device._hdwf, transfer_type, bits_per_word, tx_buffer, number_of_words)
+            result = self._functions.FDwfDigitalSpiWrite(self._hdwf, transfer_type, bits_per_word, tx_buffer, number_of_words)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4302,7 +6833,7 @@ class DigilentWaveformsDevice:
             """Write up to 8 bits per SPI word."""
             # transfer_type 0 SISO, 1 MOSI/MISO, 2 dual, 4 quad, // 1-32 bits / word
 
-            result = self._device._dwf._lib.FDwfDigitalSpiWriteOne(self._device._hdwf, transfer_type, bits_per_word, tx)
+            result = self._functions.FDwfDigitalSpiWriteOne(self._hdwf, transfer_type, bits_per_word, tx)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4318,7 +6849,7 @@ class DigilentWaveformsDevice:
 
             tx_buffer = buffer_type(*tx_list)
 
-            result = self._device._dwf._lib.FDwfDigitalSpiWrite16(self._device._hdwf, transfer_type, bits_per_word, tx_buffer, number_of_words)
+            result = self._functions.FDwfDigitalSpiWrite16(self._hdwf, transfer_type, bits_per_word, tx_buffer, number_of_words)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4334,7 +6865,7 @@ class DigilentWaveformsDevice:
 
             tx_buffer = buffer_type(*tx_list)
 
-            result = self._device._dwf._lib.FDwfDigitalSpiWrite32(self._device._hdwf, transfer_type, bits_per_word, tx_buffer, number_of_words)
+            result = self._functions.FDwfDigitalSpiWrite32(self._hdwf, transfer_type, bits_per_word, tx_buffer, number_of_words)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4345,43 +6876,45 @@ class DigilentWaveformsDevice:
         """
         def __init__(self, device: 'DigilentWaveformsDevice') -> None:
             self._device = device
+            self._hdwf = device._hdwf
+            self._functions = device._dwf._function_table("FDwfDigitalI2c")
 
         def reset(self) -> None:
             """Resets the digital-I2C protocol instrument."""
-            result = self._device._dwf._lib.FDwfDigitalI2cReset(self._device._hdwf)
+            result = self._functions.FDwfDigitalI2cReset(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def clear(self) -> int:
             c_bus_free = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfDigitalI2cClear(self._device._hdwf, c_bus_free)
+            result = self._functions.FDwfDigitalI2cClear(self._hdwf, c_bus_free)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             bus_free = c_bus_free.value
             return bus_free
 
         def stretchSet(self, stretch_enable: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalI2cStretchSet(self._device._hdwf, stretch_enable)
+            result = self._functions.FDwfDigitalI2cStretchSet(self._hdwf, stretch_enable)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def rateSet(self, rate: float) -> None:
-            result = self._device._dwf._lib.FDwfDigitalI2cRateSet(self._device._hdwf, rate)
+            result = self._functions.FDwfDigitalI2cRateSet(self._hdwf, rate)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def readNakSet(self, nak_last_read_byte: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalI2cReadNakSet(self._device._hdwf, nak_last_read_byte)
+            result = self._functions.FDwfDigitalI2cReadNakSet(self._hdwf, nak_last_read_byte)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def sclSet(self, channel_index: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalI2cSclSet(self._device._hdwf, channel_index)
+            result = self._functions.FDwfDigitalI2cSclSet(self._hdwf, channel_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def sdaSet(self, channel_index: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalI2cSdaSet(self._device._hdwf, channel_index)
+            result = self._functions.FDwfDigitalI2cSdaSet(self._hdwf, channel_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4399,7 +6932,7 @@ class DigilentWaveformsDevice:
             tx_buffer = tx_buffer_type(*tx_list)
             rx_buffer = rx_buffer_type()
 
-            result = self._device._dwf._lib.FDwfDigitalI2cWriteRead(self._device._hdwf, address, tx_buffer, number_of_tx_bytes, rx_buffer, number_of_rx_bytes, c_nak)
+            result = self._functions.FDwfDigitalI2cWriteRead(self._hdwf, address, tx_buffer, number_of_tx_bytes, rx_buffer, number_of_rx_bytes, c_nak)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4417,7 +6950,7 @@ class DigilentWaveformsDevice:
 
             rx_buffer = buffer_type()
 
-            result = self._device._dwf._lib.FDwfDigitalI2cRead(self._device._hdwf, address, rx_buffer, number_of_words, c_nak)
+            result = self._functions.FDwfDigitalI2cRead(self._hdwf, address, rx_buffer, number_of_words, c_nak)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4439,7 +6972,7 @@ class DigilentWaveformsDevice:
 
             tx_buffer = buffer_type(*tx_list)
 
-            result = self._device._dwf._lib.FDwfDigitalI2cWrite(self._device._hdwf, address, tx_buffer, number_of_words, c_nak)
+            result = self._functions.FDwfDigitalI2cWrite(self._hdwf, address, tx_buffer, number_of_words, c_nak)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4451,7 +6984,7 @@ class DigilentWaveformsDevice:
 
             c_nak = _typespec_ctypes.c_int()
 
-            result = self._device._dwf._lib.FDwfDigitalI2cWriteOne(self._device._hdwf, address, tx, c_nak)
+            result = self._functions.FDwfDigitalI2cWriteOne(self._hdwf, address, tx, c_nak)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4467,30 +7000,32 @@ class DigilentWaveformsDevice:
         """
         def __init__(self, device: 'DigilentWaveformsDevice') -> None:
             self._device = device
+            self._hdwf = device._hdwf
+            self._functions = device._dwf._function_table("FDwfDigitalCan")
 
         def reset(self) -> None:
             """Resets the digital-CAN protocol instrument."""
-            result = self._device._dwf._lib.FDwfDigitalCanReset(self._device._hdwf)
+            result = self._functions.FDwfDigitalCanReset(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def rateSet(self, rate_hz: float) -> None:
-            result = self._device._dwf._lib.FDwfDigitalCanRateSet(self._device._hdwf, rate_hz)
+            result = self._functions.FDwfDigitalCanRateSet(self._hdwf, rate_hz)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def polaritySet(self, high: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalCanPolaritySet(self._device._hdwf, high)
+            result = self._functions.FDwfDigitalCanPolaritySet(self._hdwf, high)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def txSet(self, channel_index: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalCanTxSet(self._device._hdwf, channel_index)
+            result = self._functions.FDwfDigitalCanTxSet(self._hdwf, channel_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def rxSet(self, channel_index: int) -> None:
-            result = self._device._dwf._lib.FDwfDigitalCanRxSet(self._device._hdwf, channel_index)
+            result = self._functions.FDwfDigitalCanRxSet(self._hdwf, channel_index)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4500,7 +7035,7 @@ class DigilentWaveformsDevice:
 
             # The cast below of data (of type 'bytes') to a ctype unsigned char pointer is flagged as suspect by MyPI, but it works.
             # Some googling didn't show any alternatives, so for now we leave this as-is.
-            result = self._device._dwf._lib.FDwfDigitalCanTx(self._device._hdwf, vID, extended, remote, len(data), ctypes.cast(data, _typespec_ctypes.c_unsigned_char_ptr))
+            result = self._functions.FDwfDigitalCanTx(self._hdwf, vID, extended, remote, len(data), ctypes.cast(data, _typespec_ctypes.c_unsigned_char_ptr))
 
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
@@ -4516,7 +7051,7 @@ class DigilentWaveformsDevice:
             c_data     = ctypes.create_string_buffer(size)
             c_status   = _typespec_ctypes.c_int()
 
-            result = self._device._dwf._lib.FDwfDigitalCanRx(self._device._hdwf, c_vID, c_extended, c_remote, c_dlc, ctypes.cast(c_data, _typespec_ctypes.c_unsigned_char_ptr), size, c_status)
+            result = self._functions.FDwfDigitalCanRx(self._hdwf, c_vID, c_extended, c_remote, c_dlc, ctypes.cast(c_data, _typespec_ctypes.c_unsigned_char_ptr), size, c_status)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4536,88 +7071,91 @@ class DigilentWaveformsDevice:
         """
         def __init__(self, device: 'DigilentWaveformsDevice') -> None:
             self._device = device
+            self._hdwf = device._hdwf
+            self._functions = device._dwf._function_table("FDwfAnalogImpedance")
+            self.settings_cache = SettingsCache(self)
 
         def reset(self) -> None:
             """Resets the Analog Impedance measurement instrument."""
-            result = self._device._dwf._lib.FDwfAnalogImpedanceReset(self._device._hdwf)
+            result = self._functions.FDwfAnalogImpedanceReset(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def modeSet(self, mode: int) -> None:
             """0 W1-C1-DUT-C2-R-GND, 1 W1-C1-R-C2-DUT-GND, 8 Impedance Analyzer for AD"""
-            result = self._device._dwf._lib.FDwfAnalogImpedanceModeSet(self._device._hdwf, mode)
+            result = self._functions.FDwfAnalogImpedanceModeSet(self._hdwf, mode)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def modeGet(self) -> int:
             c_mode = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogImpedanceModeGet(self._device._hdwf, c_mode)
+            result = self._functions.FDwfAnalogImpedanceModeGet(self._hdwf, c_mode)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             mode = c_mode.value
             return mode
 
         def referenceSet(self, ohms: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogImpedanceReferenceSet(self._device._hdwf, ohms)
+            result = self._functions.FDwfAnalogImpedanceReferenceSet(self._hdwf, ohms)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def referenceGet(self) -> float:
             c_ohms = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogImpedanceReferenceGet(self._device._hdwf, c_ohms)
+            result = self._functions.FDwfAnalogImpedanceReferenceGet(self._hdwf, c_ohms)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             ohms = c_ohms.value
             return ohms
 
         def frequencySet(self, hz: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogImpedanceFrequencySet(self._device._hdwf, hz)
+            result = self._functions.FDwfAnalogImpedanceFrequencySet(self._hdwf, hz)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def frequencyGet(self) -> float:
             c_frequency = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogImpedanceFrequencyGet(self._device._hdwf, c_frequency)
+            result = self._functions.FDwfAnalogImpedanceFrequencyGet(self._hdwf, c_frequency)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             frequency = c_frequency.value
             return frequency
 
         def amplitudeSet(self, volts: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogImpedanceAmplitudeSet(self._device._hdwf, volts)
+            result = self._functions.FDwfAnalogImpedanceAmplitudeSet(self._hdwf, volts)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def amplitudeGet(self) -> float:
             c_amplitude = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogImpedanceAmplitudeGet(self._device._hdwf, c_amplitude)
+            result = self._functions.FDwfAnalogImpedanceAmplitudeGet(self._hdwf, c_amplitude)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             amplitude = c_amplitude.value
             return amplitude
 
         def offsetSet(self, volts: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogImpedanceOffsetSet(self._device._hdwf, volts)
+            result = self._functions.FDwfAnalogImpedanceOffsetSet(self._hdwf, volts)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def offsetGet(self) -> float:
             c_offset = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogImpedanceOffsetGet(self._device._hdwf, c_offset)
+            result = self._functions.FDwfAnalogImpedanceOffsetGet(self._hdwf, c_offset)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             offset = c_offset.value
             return offset
 
         def probeSet(self, ohmRes: float, faradCap: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogImpedanceProbeSet(self._device._hdwf, ohmRes, faradCap)
+            result = self._functions.FDwfAnalogImpedanceProbeSet(self._hdwf, ohmRes, faradCap)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def probeGet(self) -> Tuple[float, float]:
             c_ohmRes = _typespec_ctypes.c_double()
             c_faradCap = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogImpedanceProbeGet(self._device._hdwf, c_ohmRes, c_faradCap)
+            result = self._functions.FDwfAnalogImpedanceProbeGet(self._hdwf, c_ohmRes, c_faradCap)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             ohmRes = c_ohmRes.value
@@ -4625,13 +7163,13 @@ class DigilentWaveformsDevice:
             return (ohmRes, faradCap)
 
         def periodSet(self, period: int) -> None:
-            result = self._device._dwf._lib.FDwfAnalogImpedancePeriodSet(self._device._hdwf, period)
+            result = self._functions.FDwfAnalogImpedancePeriodSet(self._hdwf, period)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def periodGet(self) -> int:
             c_period = _typespec_ctypes.c_int()
-            result = self._device._dwf._lib.FDwfAnalogImpedancePeriodGet(self._device._hdwf, c_period)
+            result = self._functions.FDwfAnalogImpedancePeriodGet(self._hdwf, c_period)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             period = c_period.value
@@ -4639,12 +7177,12 @@ class DigilentWaveformsDevice:
 
         def compReset(self) -> None:
             """Resets the Analog Impedance instrument."""
-            result = self._device._dwf._lib.FDwfAnalogImpedanceCompReset(self._device._hdwf)
+            result = self._functions.FDwfAnalogImpedanceCompReset(self._hdwf)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def compSet(self, ohmOpenResistance: float, ohmOpenReactance: float, ohmShortResistance: float, ohmShortReactance: float) -> None:
-            result = self._device._dwf._lib.FDwfAnalogImpedanceCompSet(self._device._hdwf, ohmOpenResistance, ohmOpenReactance, ohmShortResistance, ohmShortReactance)
+            result = self._functions.FDwfAnalogImpedanceCompSet(self._hdwf, ohmOpenResistance, ohmOpenReactance, ohmShortResistance, ohmShortReactance)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
@@ -4653,7 +7191,7 @@ class DigilentWaveformsDevice:
             c_ohmOpenReactance = _typespec_ctypes.c_double()
             c_ohmShortResistance = _typespec_ctypes.c_double()
             c_ohmShortReactance = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogImpedanceCompGet(self._device._hdwf, c_ohmOpenResistance, c_ohmOpenReactance, c_ohmShortResistance, c_ohmShortReactance)
+            result = self._functions.FDwfAnalogImpedanceCompGet(self._hdwf, c_ohmOpenResistance, c_ohmOpenReactance, c_ohmShortResistance, c_ohmShortReactance)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             ohmOpenResistance = c_ohmOpenResistance.value
@@ -4663,14 +7201,14 @@ class DigilentWaveformsDevice:
             return (ohmOpenResistance, ohmOpenReactance, ohmShortResistance, ohmShortReactance)
 
         def configure(self, start: int) -> None:
-            result = self._device._dwf._lib.FDwfAnalogImpedanceConfigure(self._device._hdwf, start)
+            result = self._functions.FDwfAnalogImpedanceConfigure(self._hdwf, start)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
 
         def status(self) -> DwfState:
             """Returns the status of the AnalogImpedance pseudo-instrument."""
             c_status = _typespec_ctypes.DwfState()
-            result = self._device._dwf._lib.FDwfAnalogImpedanceStatus(self._device._hdwf, c_status)
+            result = self._functions.FDwfAnalogImpedanceStatus(self._hdwf, c_status)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             status_ = DwfState(c_status.value)
@@ -4679,7 +7217,7 @@ class DigilentWaveformsDevice:
         def statusInput(self, channel_index: int) -> Tuple[float, float]:
             c_gain = _typespec_ctypes.c_double()
             c_radian = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogImpedanceStatusInput(self._device._hdwf, channel_index, c_gain, c_radian)
+            result = self._functions.FDwfAnalogImpedanceStatusInput(self._hdwf, channel_index, c_gain, c_radian)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             gain = c_gain.value
@@ -4688,7 +7226,7 @@ class DigilentWaveformsDevice:
 
         def statusMeasure(self, measure: DwfAnalogImpedance) -> float:
             c_value = _typespec_ctypes.c_double()
-            result = self._device._dwf._lib.FDwfAnalogImpedanceStatusInput(self._device._hdwf, measure.value, c_value)
+            result = self._functions.FDwfAnalogImpedanceStatusInput(self._hdwf, measure.value, c_value)
             if result != _RESULT_SUCCESS:
                 raise self._device._dwf._exception()
             value = c_value.value
@@ -10,35 +10,45 @@ import base64
 import argparse
 import importlib
 from collections import Counter
+from typing import Optional
 
 import pydwf
 from pydwf import DigilentWaveformsLibrary, DwfEnumConfigInfo
 from pydwf.dwf_function_signatures import dwf_function_signatures, dwf_version
 
-def show_version():
+def show_version(library_path: Optional[str]):
     """Show DWF library version number."""
 
-    dwf = DigilentWaveformsLibrary()
+    dwf = DigilentWaveformsLibrary.shared(library_path)
     print("pydwf version ............ : {}".format(pydwf.__version__))
     print("DWF library version ...... : {}".format(dwf.getVersion()))
 
-def list_devices(use_obsolete_api: bool, list_configurations: bool):
+def list_devices(library_path: Optional[str], use_obsolete_api: bool, list_configurations: bool):
     """List devices supported by the DWF library."""
 
-    dwf = DigilentWaveformsLibrary()
+    dwf = DigilentWaveformsLibrary.shared(library_path)
 
-    num_devices = dwf.enum.count()
+    # The configurations take ten library calls each; only gather them if they are printed.
+    snapshot = dwf.enum.snapshot(details=list_configurations)
+
+    num_devices = len(snapshot.devices)
 
     if num_devices == 0:
         print("No Digilent Waveforms devices found.")
 
-    for device_index in range(num_devices):
+    for record in snapshot.devices:
+
+        device_index = record.device_index
 
-        devtype = dwf.enum.deviceType(device_index)
-        is_open = dwf.enum.deviceIsOpened(device_index)
-        username = dwf.enum.userName(device_index)
-        devicename = dwf.enum.deviceName(device_index)
-        serial = dwf.enum.serialNumber(device_index)
+        if not snapshot.details:
+            (device_type, device_version) = dwf.enum.deviceType(device_index)
+            record = record._replace(
+                device_type    = device_type,
+                device_version = device_version,
+                is_opened      = dwf.enum.deviceIsOpened(device_index),
+                user_name      = dwf.enum.userName(device_index),
+                device_name    = dwf.enum.deviceName(device_index)
+            )
 
         if num_devices == 1:
             header = "Device information for device #{} ({} device found)".format(device_index, num_devices)
@@ -48,12 +58,12 @@ def list_devices(use_obsolete_api: bool, list_configurations: bool):
         print(header)
         print("=" * len(header))
         print()
-        print("  device .......... : {}".format(devtype[0]))
-        print("  version ......... : {}".format(devtype[1]))
-        print("  open ............ : {}".format(is_open))
-        print("  username ........ : {!r}".format(username))
-        print("  devicename ...... : {!r}".format(devicename))
-        print("  serial .......... : {!r}".format(serial))
+        print("  device .......... : {}".format(record.device_type))
+        print("  version ......... : {}".format(record.device_version))
+        print("  open ............ : {}".format(record.is_opened))
+        print("  username ........ : {!r}".format(record.user_name))
+        print("  devicename ...... : {!r}".format(record.device_name))
+        print("  serial .......... : {!r}".format(record.serial_number))
         print()
 
         if use_obsolete_api:
@@ -74,21 +84,27 @@ def list_devices(use_obsolete_api: bool, list_configurations: bool):
 
         if list_configurations:
 
-            configuration_data = {}
-
-            num_config = dwf.enum.configCount(device_index)
-
-            for configuration_index in range(num_config):
-                for configuration_parameter in DwfEnumConfigInfo:
-                    configuration_parameter_value = dwf.enum.configInfo(configuration_index, configuration_parameter)
-                    configuration_data[(configuration_index, configuration_parameter)] = configuration_parameter_value
+            num_config = len(record.configurations)
 
             print("  Configuration:          {}".format("  ".join("{:8d}".format(configuration_index) for configuration_index in range(num_config))))
             print("  ----------------------  {}".format("  ".join("--------" for configuration_index in range(num_config))))
             for configuration_parameter in DwfEnumConfigInfo:
-                print("  {:22}  {}".format(configuration_parameter.name, "  ".join("{:8d}".format(configuration_data[(configuration_index, configuration_parameter)]) for configuration_index in range(num_config))))
+                print("  {:22}  {}".format(configuration_parameter.name, "  ".join("{:8d}".format(getattr(configuration, configuration_parameter.name)) for configuration in record.configurations)))
             print()
 
+def run_broker(library_path: Optional[str], address: Optional[str], authkey: Optional[str]):
+    """Run a device broker until interrupted."""
+
+    # Imported here, since the other commands don't need it.
+    from pydwf.device_broker import DeviceBroker
+
+    broker = DeviceBroker(address, authkey=None if authkey is None else authkey.encode(), dwf=DigilentWaveformsLibrary.shared(library_path))
+    print("Device broker listening on {!r}.".format(broker.address))
+    try:
+        broker.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
 def extract_zip_to_directory(target):
     """Extract a directory with auxiliary package data."""
     if os.path.exists(target):
@@ -113,6 +129,8 @@ def main():
         prog = "python -m pydwf",
         description="Utilities for the pydwf package.",
     )
+    parser.add_argument('--library-path', default=None,
+                        help="filename of the DWF shared library (default: $PYDWF_LIBRARY_PATH, or the platform's default location)", dest='library_path')
     subparsers = parser.add_subparsers()
 
     # If no command is given, execute the toplevel parser's "print_help" method.
@@ -122,7 +140,7 @@ def main():
     subparser_version = subparsers.add_parser("version",
         description="Show version of the DWF library.",
         help="show version of the DWF library")
-    subparser_version.set_defaults(execute=lambda args: show_version())
+    subparser_version.set_defaults(execute=lambda args: show_version(args.library_path))
 
     # Declare the sub-parser for the "list" command.
     subparser_list = subparsers.add_parser("list", aliases=["ls"],
@@ -132,7 +150,17 @@ def main():
                         help="for each device, print analog-in parameters obtained using obsolete FDwfEnumAnalogIn* API calls", dest='use_obsolete_api')
     subparser_list.add_argument('-c', '--list-configurations', action='store_true',
                         help="for each device, printing its configurations", dest='list_configurations')
-    subparser_list.set_defaults(execute=lambda args: list_devices(args.use_obsolete_api, args.list_configurations))
+    subparser_list.set_defaults(execute=lambda args: list_devices(args.library_path, args.use_obsolete_api, args.list_configurations))
+
+    # Declare the sub-parser for the "broker" command.
+    subparser_broker = subparsers.add_parser("broker",
+        description="Run a device broker that keeps devices open, and leases them to client processes.",
+        help="run a device broker")
+    subparser_broker.add_argument('--address', default=None,
+                        help="address to listen on (default: a Unix socket in a directory private to the user)", dest='address')
+    subparser_broker.add_argument('--authkey', default=None,
+                        help="key that clients must use to connect (default: $PYDWF_BROKER_AUTHKEY, or a generated key stored in a file private to the user)", dest='authkey')
+    subparser_broker.set_defaults(execute=lambda args: run_broker(args.library_path, args.address, args.authkey))
 
     # Declare the sub-parser for the "extract-examples" command.
     subparser_extract_examples = subparsers.add_parser("extract-examples",
@@ -0,0 +1,187 @@
+"""Background acquisition for the AnalogIn and DigitalIn instruments.
+
+The AcquisitionWorker class runs a record-mode acquisition in a dedicated thread. The thread owns the polling of
+the device, and pushes the acquired chunks into a bounded queue, from which the application consumes them at its
+own pace. This decouples the acquisition from (possibly slow) processing of the data.
+
+The DWF library functions release the GIL while they execute, so the acquisition thread keeps polling the device
+while the consuming thread is busy with numpy processing.
+"""
+
+import time
+import queue
+import threading
+from typing import Optional, NamedTuple
+
+from . import PyDwfError, RecordChunk
+
+
+class AcquisitionWorkerStatistics(NamedTuple):
+    """A snapshot of the statistics of an AcquisitionWorker."""
+    queue_depth: int        # Number of chunks currently waiting in the queue.
+    max_queue_depth: int    # Largest number of chunks that have been waiting in the queue.
+    chunks_produced: int    # Number of chunks produced by the acquisition.
+    chunks_consumed: int    # Number of chunks delivered to the consumer.
+    chunks_dropped: int     # Number of chunks dropped because the queue was full.
+    samples_dropped: int    # Number of samples in the dropped chunks.
+    latency_last: float     # Time between the poll that completed a chunk and its delivery to the consumer, for the last chunk, in seconds.
+    latency_mean: float     # Mean poll-to-consume latency, in seconds.
+    latency_max: float      # Maximum poll-to-consume latency, in seconds.
+
+
+class AcquisitionWorker:
+    """Run a record-mode acquisition of an AnalogIn or DigitalIn instrument in a background thread.
+
+    The worker calls the instrument's recordStream() method from its own thread, and puts each chunk in a bounded queue.
+    If the consumer falls behind and the queue is full, new chunks are dropped rather than stalling the
+    acquisition, since stalling would make the device lose samples. Dropped chunks are counted; the running
+    sample 'index' of the chunks that are delivered shows where the gaps are.
+
+    Typical use:
+
+        with AcquisitionWorker(device.analogIn, channels=[0, 1], chunk_hint=65536) as worker:
+            for chunk in worker:
+                process(chunk)
+
+    While the worker runs, the instrument should not be used from other threads.
+    """
+
+    def __init__(self, instrument, max_queue_size: int=64, **stream_args) -> None:
+        """Initialize an AcquisitionWorker.
+
+        Args:
+            instrument: The instrument to acquire from, i.e., a device's analogIn or digitalIn sub-API.
+                        It should be configured for record mode.
+            max_queue_size: The maximum number of chunks that can wait in the queue.
+            stream_args: Arguments passed on to the instrument's recordStream() method
+                         (e.g., 'channels' and 'chunk_hint'), except 'should_stop', which is used by the worker.
+        """
+        if max_queue_size <= 0:
+            raise PyDwfError("Bad queue size: {!r}.".format(max_queue_size))
+
+        self._instrument = instrument
+        self._stream_args = stream_args
+        self._queue = queue.Queue(max_queue_size)
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._error = None
+        self._finished = False
+
+        self._max_queue_depth = 0
+        self._chunks_produced = 0
+        self._chunks_consumed = 0
+        self._chunks_dropped = 0
+        self._samples_dropped = 0
+        self._latency_last = 0.0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *dummy):
+        self.stop()
+
+    def __iter__(self):
+        while True:
+            chunk = self.get()
+            if chunk is None:
+                return
+            yield chunk
+
+    def start(self) -> None:
+        """Start the acquisition thread."""
+        if self._thread is not None:
+            raise PyDwfError("AcquisitionWorker was already started.")
+        self._thread = threading.Thread(target=self._run, name="pydwf-acquisition", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float]=None) -> None:
+        """Stop the acquisition, and wait for the acquisition thread to finish.
+
+        If the acquisition is still running, the instrument is stopped by calling its configure(False, False) method.
+        The stop request is checked before each poll of the instrument, so this also works while the instrument is
+        waiting for its trigger, or otherwise doesn't produce samples.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def get(self, timeout: Optional[float]=None) -> Optional[RecordChunk]:
+        """Return the next chunk of the acquisition, waiting for it if necessary.
+
+        Returns:
+            The next chunk, or None if the acquisition has finished and all chunks have been consumed.
+
+        Raises:
+            queue.Empty: no chunk became available within the timeout.
+            DigilentWaveformsLibraryError, PyDwfError: the acquisition failed. The error is raised after all chunks
+                acquired before the failure have been consumed.
+        """
+        if self._finished:
+            return None
+        item = self._queue.get(timeout=timeout)
+        if item is None:
+            self._finished = True
+            if self._error is not None:
+                raise self._error
+            return None
+        (chunk, timestamp) = item
+        latency = time.perf_counter() - timestamp
+        self._chunks_consumed += 1
+        self._latency_last = latency
+        self._latency_total += latency
+        if latency > self._latency_max:
+            self._latency_max = latency
+        return chunk
+
+    def statistics(self) -> AcquisitionWorkerStatistics:
+        """Return a snapshot of the worker's queue and latency statistics."""
+        return AcquisitionWorkerStatistics(
+            self._queue.qsize(),
+            self._max_queue_depth,
+            self._chunks_produced,
+            self._chunks_consumed,
+            self._chunks_dropped,
+            self._samples_dropped,
+            self._latency_last,
+            self._latency_total / self._chunks_consumed if self._chunks_consumed != 0 else 0.0,
+            self._latency_max
+        )
+
+    def _run(self) -> None:
+        """The body of the acquisition thread."""
+        stream = None
+        try:
+            stream = self._instrument.recordStream(should_stop=self._stop_event.is_set, **self._stream_args)
+            for chunk in stream:
+                timestamp = time.perf_counter()
+                self._chunks_produced += 1
+                try:
+                    self._queue.put_nowait((chunk, timestamp))
+                except queue.Full:
+                    self._chunks_dropped += 1
+                    self._samples_dropped += len(chunk.samples)
+                else:
+                    depth = self._queue.qsize()
+                    if depth > self._max_queue_depth:
+                        self._max_queue_depth = depth
+                if self._stop_event.is_set():
+                    # Stop the instrument; the remainder of the acquisition is not needed.
+                    self._instrument.configure(False, False)
+                    break
+        except Exception as exception:
+            self._error = exception
+        finally:
+            if stream is not None:
+                stream.close()
+            # Signal the end of the acquisition. This must not be dropped, so wait for room in the queue,
+            # unless the consumer has indicated it is no longer interested.
+            while True:
+                try:
+                    self._queue.put(None, timeout=0.1)
+                    break
+                except queue.Full:
+                    if self._stop_event.is_set():
+                        break
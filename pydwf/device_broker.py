@@ -0,0 +1,557 @@
+"""A device broker, that keeps devices open and leases them to short-lived client processes.
+
+Opening and closing a device takes seconds, which dominates the run time of short measurement scripts. The
+DeviceBroker runs in a long-lived process, and keeps the devices it has opened open. A client leases a device by
+serial number, and gets a DeviceProxy with the same sub-APIs (analogIn, analogOut, ...) and methods as a
+DigilentWaveformsDevice:
+
+    # In the broker process (or run 'python -m pydwf broker'):
+    DeviceBroker().serve_forever()
+
+    # In a client process:
+    with lease("210321ABCDEF") as device:
+        device.analogIn.frequencySet(1e6)
+        samples = device.analogIn.recordCapture([0, 1])
+
+A device is leased to one client at a time. When the lease ends (by the client, or because the client's connection
+is lost), the broker resets the device using DigilentWaveformsDevice.reset().
+
+The broker listens on a Unix socket (a named pipe on Windows), using multiprocessing.connection. By default, the socket
+is created in a directory that is private to the user (see default_broker_directory()). Clients must authenticate with
+a secret key, which is taken from the PYDWF_BROKER_AUTHKEY environment variable if it is set, or else from a key file
+in the same directory, that the broker generates when it first runs. Method calls and their arguments and results are pickled, except for numpy arrays: these are passed through shared memory, and only their
+location, shape, and dtype are pickled. Arrays returned by the broker are copied out of shared memory by the client.
+
+Methods that return iterators or awaitables (such as recordStream()), or that take callables (such as the 'allocate'
+argument of recordStream()), cannot be called through the broker. Attributes of the device and its sub-APIs (such as
+'settings_cache' and 'statistics') are not accessible either. The device is owned by the broker: its close() method
+cannot be called by a client, and neither can configTransaction(). A client ends its lease with DeviceProxy.release().
+
+The broker and its clients require Python 3.8 or later, for multiprocessing.shared_memory.
+"""
+
+import os
+import sys
+import stat
+import getpass
+import inspect
+import secrets
+import tempfile
+import threading
+import collections.abc
+import multiprocessing.connection
+from multiprocessing import shared_memory
+from typing import Optional, NamedTuple
+
+import numpy as np
+
+from . import DigilentWaveformsLibrary, PyDwfError, AnalogInRawSamples
+
+# The sub-APIs of a DigilentWaveformsDevice that can be used through a DeviceProxy.
+_DEVICE_APIS = ("analogIn", "analogOut", "analogIO", "digitalIO", "digitalIn", "digitalOut",
+                "digitalUart", "digitalSpi", "digitalI2c", "digitalCan", "analogImpedance")
+
+# The methods of a DigilentWaveformsDevice that cannot be called through a DeviceProxy. The broker owns the device,
+# and a transaction context manager cannot be entered remotely.
+_BROKER_OWNED_METHODS = ("close", "configTransaction")
+
+_MIN_SEGMENT_SIZE = 1 << 20  # The minimum size of a shared memory segment, in bytes.
+
+
+_AUTHKEY_ENVIRONMENT_VARIABLE = "PYDWF_BROKER_AUTHKEY"
+
+_AUTHKEY_SIZE = 32  # The size of a generated key, in bytes.
+
+
+def _check_private(path: str) -> None:
+    """Verify that a file or directory is owned by the current user, and not accessible to other users."""
+    if sys.platform == "win32":
+        return
+    st = os.lstat(path)
+    if stat.S_ISLNK(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PyDwfError("{!r} must be owned by the current user, and not be accessible to other users.".format(path))
+
+
+def default_broker_directory() -> str:
+    """Return the directory that holds the broker's socket and key file, creating it if necessary.
+
+    The directory is private to the user: '$XDG_RUNTIME_DIR/pydwf' if XDG_RUNTIME_DIR is set, or else a 'pydwf-<uid>'
+    directory in the temporary directory, with mode 0700. On Windows, it is the 'pydwf' directory in the user's local
+    application data directory.
+
+    Raises:
+        PyDwfError: the directory exists, but is not private to the user (e.g., because another user created it).
+    """
+    if sys.platform == "win32":
+        directory = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.expanduser(os.path.join("~", "AppData", "Local")), "pydwf")
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    runtime_directory = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_directory:
+        directory = os.path.join(runtime_directory, "pydwf")
+    else:
+        directory = os.path.join(tempfile.gettempdir(), "pydwf-{}".format(os.getuid()))
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    _check_private(directory)
+    return directory
+
+
+def default_broker_address() -> str:
+    """Return the default address of the broker: a Unix socket in the default_broker_directory(), or a named pipe on Windows."""
+    if sys.platform == "win32":
+        return r"\\.\pipe\pydwf-broker-{}".format(getpass.getuser())
+    return os.path.join(default_broker_directory(), "broker.sock")
+
+
+def default_broker_authkey(create: bool=False) -> bytes:
+    """Return the key that authenticates the clients of a broker and the broker itself.
+
+    The key is taken from the PYDWF_BROKER_AUTHKEY environment variable, if it is set. Otherwise, it is read from the
+    file 'broker.key' in the default_broker_directory(), which is readable by the user only.
+
+    Args:
+        create: If True, and the key file doesn't exist, create it with a new random key.
+
+    Raises:
+        PyDwfError: no key is available, or the key file is accessible to other users.
+    """
+    authkey = os.environ.get(_AUTHKEY_ENVIRONMENT_VARIABLE)
+    if authkey:
+        return authkey.encode()
+
+    filename = os.path.join(default_broker_directory(), "broker.key")
+    if create:
+        try:
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, "wb") as fo:
+                fo.write(secrets.token_bytes(_AUTHKEY_SIZE))
+
+    try:
+        _check_private(filename)
+        with open(filename, "rb") as fi:
+            authkey = fi.read()
+    except FileNotFoundError:
+        raise PyDwfError("No broker key: set the {} environment variable, or start the broker first.".format(_AUTHKEY_ENVIRONMENT_VARIABLE)) from None
+    if not authkey:
+        raise PyDwfError("The broker key file {!r} is empty.".format(filename))
+    return authkey
+
+
+def _check_authkey(authkey) -> bytes:
+    """Verify a broker key. An empty key would make multiprocessing.connection skip the authentication."""
+    if not isinstance(authkey, bytes) or not authkey:
+        raise PyDwfError("The broker key must be a non-empty bytes object.")
+    return authkey
+
+
+class _SharedArrayRef(NamedTuple):
+    """The location of a numpy array in a shared memory segment."""
+    segment: str
+    offset: int
+    shape: tuple
+    dtype: str
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to a shared memory segment that is owned by the other side of the connection."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13, attaching registers the segment with the resource tracker, which would unlink it at exit.
+        segment = shared_memory.SharedMemory(name=name)
+        if sys.platform != "win32":
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(segment._name, "shared_memory")  # pylint: disable=protected-access
+        return segment
+
+
+class _SharedArrayWriter:
+    """Put numpy arrays in shared memory segments owned by this side of the connection.
+
+    The arrays of a message are stored one after the other in a segment, starting at the beginning of the segment for
+    each message. If a segment is too small, a larger one is created; the old one is removed at the next message.
+    """
+
+    def __init__(self) -> None:
+        self._segment = None
+        self._offset = 0
+        self._retired = []
+
+    def begin(self) -> None:
+        """Start a new message, overwriting the arrays of the previous message."""
+        for segment in self._retired:
+            segment.close()
+            segment.unlink()
+        self._retired = []
+        self._offset = 0
+
+    def put(self, array: np.ndarray) -> _SharedArrayRef:
+        """Copy an array into shared memory, and return its location."""
+        array = np.ascontiguousarray(array)
+        offset = (self._offset + 63) // 64 * 64
+        if self._segment is None or offset + array.nbytes > self._segment.size:
+            if self._segment is not None:
+                self._retired.append(self._segment)
+            self._segment = shared_memory.SharedMemory(create=True, size=max(_MIN_SEGMENT_SIZE, 2 * array.nbytes))
+            offset = 0
+        np.ndarray(array.shape, array.dtype, buffer=self._segment.buf, offset=offset)[...] = array
+        self._offset = offset + array.nbytes
+        return _SharedArrayRef(self._segment.name, offset, array.shape, array.dtype.str)
+
+    def close(self) -> None:
+        """Remove all segments."""
+        self.begin()
+        if self._segment is not None:
+            self._segment.close()
+            self._segment.unlink()
+            self._segment = None
+
+
+class _SharedArrayReader:
+    """Read numpy arrays from the shared memory segments owned by the other side of the connection."""
+
+    def __init__(self) -> None:
+        self._segments = {}
+
+    def get(self, ref: _SharedArrayRef) -> np.ndarray:
+        """Return a copy of the array at the given location."""
+        segment = self._segments.get(ref.segment)
+        if segment is None:
+            # The other side has removed the segments that it no longer uses.
+            self.close()
+            segment = self._segments[ref.segment] = _attach_shared_memory(ref.segment)
+        return np.ndarray(ref.shape, np.dtype(ref.dtype), buffer=segment.buf, offset=ref.offset).copy()
+
+    def close(self) -> None:
+        """Detach from all segments."""
+        for segment in self._segments.values():
+            segment.close()
+        self._segments = {}
+
+
+def _encode(value, writer: _SharedArrayWriter):
+    """Replace the numpy arrays in a value (which may be a tuple, list, or dict) by their location in shared memory."""
+    if isinstance(value, np.ndarray):
+        return writer.put(value)
+    if isinstance(value, AnalogInRawSamples):
+        return AnalogInRawSamples(writer.put(value.raw), writer.put(value.scale), writer.put(value.offset))
+    if isinstance(value, tuple) and not isinstance(value, _SharedArrayRef):
+        encoded = [_encode(element, writer) for element in value]
+        return type(value)(*encoded) if hasattr(value, "_fields") else tuple(encoded)
+    if isinstance(value, list):
+        return [_encode(element, writer) for element in value]
+    if isinstance(value, dict):
+        return {key: _encode(element, writer) for (key, element) in value.items()}
+    return value
+
+
+def _decode(value, reader: _SharedArrayReader):
+    """Replace the shared memory locations in a value by copies of the arrays stored there."""
+    if isinstance(value, _SharedArrayRef):
+        return reader.get(value)
+    if isinstance(value, AnalogInRawSamples):
+        return AnalogInRawSamples(reader.get(value.raw), reader.get(value.scale), reader.get(value.offset))
+    if isinstance(value, tuple):
+        decoded = [_decode(element, reader) for element in value]
+        return type(value)(*decoded) if hasattr(value, "_fields") else tuple(decoded)
+    if isinstance(value, list):
+        return [_decode(element, reader) for element in value]
+    if isinstance(value, dict):
+        return {key: _decode(element, reader) for (key, element) in value.items()}
+    return value
+
+
+class DeviceBroker:
+    """Keep devices open, and lease them to clients that connect through a Unix socket (or a named pipe on Windows).
+
+    Devices are opened when they are first leased, and stay open until the broker is closed. The 'leases' attribute
+    counts the leases granted, and the 'opens' attribute counts the devices opened.
+    """
+
+    def __init__(self, address: Optional[str]=None, authkey: Optional[bytes]=None, dwf: Optional[DigilentWaveformsLibrary]=None) -> None:
+        """Create a broker.
+
+        Args:
+            address: The address to listen on. If not specified, the default_broker_address() is used.
+            authkey: The key that clients must use to connect. If not specified, the default_broker_authkey() is used,
+                     which creates the key file if necessary.
+            dwf: The DigilentWaveformsLibrary used to open devices. If not specified, the shared instance is used.
+
+        Raises:
+            PyDwfError: the key is empty, or the broker directory or key file is accessible to other users.
+        """
+        self.address = default_broker_address() if address is None else address
+        self._authkey = _check_authkey(default_broker_authkey(create=True) if authkey is None else authkey)
+        self._dwf = DigilentWaveformsLibrary.shared() if dwf is None else dwf
+        self._listener = None
+        self._devices = {}  # Maps serial numbers to (device, config_index) tuples.
+        self._leased = set()
+        self._condition = threading.Condition()
+        # Serializes the opening and closing of devices, and changes to '_devices'. Opening a device by serial number
+        # enumerates the devices and then opens one by its index, so no other enumeration may happen in between.
+        self._open_lock = threading.Lock()
+        self.leases = 0
+        self.opens = 0
+
+    def serve_forever(self) -> None:
+        """Accept client connections, serving each connection in its own thread, until the broker is closed."""
+        if self.address.startswith("/") and os.path.exists(self.address) and stat.S_ISSOCK(os.lstat(self.address).st_mode):
+            # Remove the socket file left behind by a previous broker.
+            os.unlink(self.address)
+        self._listener = multiprocessing.connection.Listener(self.address, authkey=self._authkey)
+        try:
+            while True:
+                try:
+                    connection = self._listener.accept()
+                except (OSError, multiprocessing.AuthenticationError):
+                    if self._listener is None:
+                        break  # The broker was closed.
+                    continue
+                threading.Thread(target=self._serve_connection, args=(connection, ), daemon=True).start()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop accepting connections, and close all devices."""
+        listener = self._listener
+        self._listener = None
+        if listener is not None:
+            listener.close()
+        with self._open_lock:
+            for (device, config_index) in self._devices.values():
+                device.close()
+            self._devices = {}
+
+    def _acquire(self, serial_number: str, config_index: Optional[int], timeout: Optional[float]):
+        """Lease a device, waiting until it is no longer leased by another client, and open it if needed."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: serial_number not in self._leased, timeout):
+                raise PyDwfError("Device {!r} is leased by another client.".format(serial_number))
+            self._leased.add(serial_number)
+
+        try:
+            with self._open_lock:
+                (device, open_config_index) = self._devices.get(serial_number, (None, None))
+                if device is not None and config_index is not None and config_index != open_config_index:
+                    # The device is open in another configuration.
+                    del self._devices[serial_number]
+                    device.close()
+                    device = None
+                if device is None:
+                    device = self._dwf.device.openBySerialNumber(serial_number, config_index)
+                    self._devices[serial_number] = (device, config_index)
+                    self.opens += 1
+        except BaseException:
+            self._release(serial_number, None)
+            raise
+
+        with self._condition:
+            self.leases += 1
+        return device
+
+    def _release(self, serial_number: str, device) -> None:
+        """End a lease, resetting the device. A device that cannot be reset is closed."""
+        if device is not None:
+            try:
+                device.reset()
+            except PyDwfError:
+                with self._open_lock:
+                    self._devices.pop(serial_number, None)
+                    try:
+                        device.close()
+                    except PyDwfError:
+                        pass
+        with self._condition:
+            self._leased.discard(serial_number)
+            self._condition.notify_all()
+
+    def _serve_connection(self, connection) -> None:
+        """Serve a client: a lease request, followed by method calls until the client ends the lease or disconnects."""
+        writer = _SharedArrayWriter()
+        reader = _SharedArrayReader()
+        try:
+            message = connection.recv()
+            try:
+                (serial_number, config_index, timeout) = self._parse_lease_request(message)
+                device = self._acquire(serial_number, config_index, timeout)
+            except Exception as exception:  # pylint: disable=broad-except
+                connection.send(("error", exception))
+                return
+            connection.send(("ok", None))
+
+            try:
+                while True:
+                    try:
+                        request = connection.recv()
+                    except EOFError:
+                        break
+                    if request is None:
+                        connection.send(("ok", None))
+                        break
+                    connection.send(self._call(device, request, writer, reader))
+            finally:
+                self._release(serial_number, device)
+        except (EOFError, OSError):
+            pass
+        except Exception:  # pylint: disable=broad-except
+            # A message that cannot be unpickled ends the connection.
+            pass
+        finally:
+            writer.close()
+            reader.close()
+            connection.close()
+
+    @staticmethod
+    def _parse_lease_request(message) -> tuple:
+        """Verify a lease request, and return its (serial_number, config_index, timeout) arguments."""
+        if not (isinstance(message, tuple) and len(message) == 4 and message[0] == "lease"):
+            raise PyDwfError("Bad broker request: {!r}.".format(message))
+        (request, serial_number, config_index, timeout) = message
+        if not isinstance(serial_number, str):
+            raise PyDwfError("Bad serial number: {!r}.".format(serial_number))
+        if config_index is not None and not isinstance(config_index, int):
+            raise PyDwfError("Bad configuration index: {!r}.".format(config_index))
+        if timeout is not None and not isinstance(timeout, (int, float)):
+            raise PyDwfError("Bad timeout: {!r}.".format(timeout))
+        return (serial_number, config_index, timeout)
+
+    @staticmethod
+    def _call(device, request, writer: _SharedArrayWriter, reader: _SharedArrayReader) -> tuple:
+        """Call a method of a leased device or one of its sub-APIs, and return the reply to be sent to the client."""
+        (api_name, method_name, args, kwargs) = request
+        try:
+            if (api_name is not None and api_name not in _DEVICE_APIS) or method_name.startswith("_") or \
+                    (api_name is None and method_name in _BROKER_OWNED_METHODS):
+                raise PyDwfError("Method {!r} cannot be called through the broker.".format(method_name))
+            api = device if api_name is None else getattr(device, api_name)
+            method = getattr(api, method_name)
+            if not callable(method):
+                raise PyDwfError("Attribute {!r} cannot be accessed through the broker.".format(method_name))
+            result = method(*_decode(args, reader), **_decode(kwargs, reader))
+            if isinstance(result, collections.abc.Iterator) or inspect.isawaitable(result):
+                close = getattr(result, "close", None)
+                if close is not None:
+                    close()
+                raise PyDwfError("Method {!r} cannot be called through the broker, since it returns an iterator or awaitable.".format(method_name))
+            writer.begin()
+            return ("ok", _encode(result, writer))
+        except Exception as exception:  # pylint: disable=broad-except
+            return ("error", exception)
+
+
+class _ApiProxy:
+    """Forward method calls to a DigilentWaveformsDevice, or one of its sub-APIs, in the broker process."""
+
+    def __init__(self, device_proxy: 'DeviceProxy', api_name: Optional[str]) -> None:
+        self._device_proxy = device_proxy
+        self._api_name = api_name
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def remote_method(*args, **kwargs):
+            return self._device_proxy._call(self._api_name, name, args, kwargs)
+
+        remote_method.__name__ = name
+        setattr(self, name, remote_method)
+        return remote_method
+
+
+class DeviceProxy:
+    """A device leased from a DeviceBroker, as returned by lease().
+
+    It has the same sub-APIs and methods as a DigilentWaveformsDevice; calls are forwarded to the broker.
+    Arrays passed as the 'out' argument of a method are filled with the result.
+    The lease ends when release() is called, or when the proxy is used as a context manager, at the end of the block.
+    """
+
+    def __init__(self, connection, serial_number: str) -> None:
+        self._connection = connection
+        self._writer = _SharedArrayWriter()
+        self._reader = _SharedArrayReader()
+        self._device_api = _ApiProxy(self, None)
+        self.serial_number = serial_number
+        for api_name in _DEVICE_APIS:
+            setattr(self, api_name, _ApiProxy(self, api_name))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *dummy):
+        self.release()
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._device_api, name)
+
+    def _call(self, api_name: Optional[str], method_name: str, args: tuple, kwargs: dict):
+        if self._connection is None:
+            raise PyDwfError("The lease of device {!r} has ended.".format(self.serial_number))
+        out = kwargs.pop("out", None)
+        self._writer.begin()
+        self._connection.send((api_name, method_name, _encode(args, self._writer), _encode(kwargs, self._writer)))
+        (status, value) = self._connection.recv()
+        if status != "ok":
+            raise value
+        result = _decode(value, self._reader)
+        if out is not None:
+            np.copyto(out, result)
+            result = out
+        return result
+
+    def release(self) -> None:
+        """End the lease. The broker resets the device."""
+        if self._connection is None:
+            return
+        try:
+            self._connection.send(None)
+            self._connection.recv()
+        except (EOFError, OSError):
+            pass
+        self._connection.close()
+        self._connection = None
+        self._writer.close()
+        self._reader.close()
+
+
+def lease(serial_number: str, config_index: Optional[int]=None, timeout: Optional[float]=None,
+          address: Optional[str]=None, authkey: Optional[bytes]=None) -> DeviceProxy:
+    """Lease a device from a DeviceBroker.
+
+    Args:
+        serial_number: The serial number of the device.
+        config_index: The configuration in which the device should be open. If not specified, the device is used in
+                      the configuration in which it is open, or else its default configuration.
+        timeout: The maximum time to wait while the device is leased by another client, in seconds.
+                 If not specified, wait indefinitely.
+        address: The address of the broker. If not specified, the default_broker_address() is used.
+        authkey: The key that the broker was created with. If not specified, the default_broker_authkey() is used.
+
+    Returns:
+        A DeviceProxy for the leased device.
+
+    Raises:
+        PyDwfError: the device cannot be leased, or no key is available.
+        DigilentWaveformsLibraryError: the broker cannot open the device.
+        multiprocessing.AuthenticationError: the broker uses another key.
+    """
+    authkey = _check_authkey(default_broker_authkey() if authkey is None else authkey)
+    connection = multiprocessing.connection.Client(default_broker_address() if address is None else address, authkey=authkey)
+    try:
+        connection.send(("lease", serial_number, config_index, timeout))
+        (status, value) = connection.recv()
+        if status != "ok":
+            raise value
+    except BaseException:
+        connection.close()
+        raise
+    return DeviceProxy(connection, serial_number)
@@ -0,0 +1,710 @@
+"""A simulated DWF library, for running pydwf programs without hardware or the DWF shared library.
+
+The SimulatedDwfLibrary class implements the functions listed in 'dwf_function_signatures.py' in Python and NumPy.
+It takes the place of the ctypes library object inside a DigilentWaveformsLibrary, and is selected by instantiating
+the DigilentWaveformsLibrary with 'simulated=True' (or by setting the PYDWF_SIMULATED environment variable to '1'):
+
+    dwf = DigilentWaveformsLibrary(simulated=True)
+
+The simulator presents a single Analog Discovery 2. Its behavior is deliberately simple, but it progresses in real
+time, so that acquisition and playback loops can be developed, profiled, and tested end to end:
+
+* AnalogIn produces a deterministic waveform per channel (by default a 1 kHz sine wave with a 90 degree phase shift
+  between successive channels) at the configured sample frequency, quantized to the configured number of bits.
+  Single, ScanShift, ScanScreen, and Record acquisition modes are supported. In record mode, samples that are not
+  fetched before the device buffer fills up are reported as lost by FDwfAnalogInStatusRecord, and the samples of
+  that poll are reported as corrupt, like a real device does when the poller falls behind.
+* DigitalIn produces a counter bit stream (sample i has value i, truncated to the sample format) at the internal
+  clock frequency divided by the configured divider, with the same record-mode behavior as AnalogIn.
+* AnalogOut play-mode buffers drain at the configured carrier frequency; FDwfAnalogOutNodePlayStatus reports the
+  free buffer space, and counts samples as lost when the buffer runs empty.
+
+All other setting functions are handled generically: values passed to a '...Set' function are stored, and returned
+by the corresponding '...Get' function; '...Info' functions return plausible limits. Functions without simulated
+behavior succeed without doing anything.
+"""
+
+import ctypes
+import functools
+import re
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .dwf_function_signatures import dwf_function_signatures, dwf_version
+
+_RESULT_SUCCESS = 1
+
+_STATE_READY = 0
+_STATE_DONE = 2
+_STATE_RUNNING = 3
+
+_ACQMODE_SINGLE = 0
+_ACQMODE_RECORD = 3
+
+_DEVID_DISCOVERY2 = 3
+_DEVICE_REVISION = 2
+_SERIAL_NUMBER = "SN:210321ABCDEF"
+
+# The device configurations, as reported by FDwfEnumConfigInfo. Keys are DwfEnumConfigInfo values:
+# AnalogIn/AnalogOut/AnalogIO/DigitalIn/DigitalOut/DigitalIO channel counts, followed by the
+# AnalogIn/AnalogOut/DigitalIn/DigitalOut buffer sizes.
+_DEVICE_CONFIGURATIONS = [
+    {1: 2, 2: 2, 3: 2, 4: 16, 5: 16, 6: 16, 7:  8192, 8: 4096, 9:  4096, 10: 1024},
+    {1: 2, 2: 2, 3: 2, 4: 16, 5: 16, 6: 16, 7: 16384, 8: 1024, 9:  1024, 10: 1024},
+    {1: 2, 2: 2, 3: 2, 4: 16, 5: 16, 6: 16, 7:  2048, 8:  256, 9: 16384, 10: 1024}
+]
+
+_DIGITAL_CLOCK_FREQUENCY = 100e6
+_ANALOG_IN_BITS = 14
+
+# Values returned by '...Get' functions for settings that were not set, keyed by the function name without its
+# 'FDwf' prefix and 'Get' suffix. Settings not listed here default to zero.
+_DEFAULT_SETTINGS = {
+    "DeviceAutoConfigure"       : (1, ),
+    "AnalogInFrequency"         : (20e6, ),
+    "AnalogInChannelEnable"     : (1, ),
+    "AnalogInChannelRange"      : (5.0, ),
+    "AnalogInChannelAttenuation": (1.0, ),
+    "AnalogInTriggerAutoTimeout": (1.0, ),
+    "AnalogOutNodeFrequency"    : (1000.0, ),
+    "AnalogOutNodeAmplitude"    : (1.0, ),
+    "AnalogOutNodeSymmetry"     : (50.0, ),
+    "AnalogOutFrequency"        : (1000.0, ),
+    "AnalogOutAmplitude"        : (1.0, ),
+    "AnalogOutSymmetry"         : (50.0, ),
+    "DigitalInDivider"          : (1, ),
+    "DigitalInSampleFormat"     : (16, ),
+    "DigitalOutDivider"         : (1, ),
+    "AnalogImpedanceFrequency"  : (1000.0, ),
+    "AnalogImpedanceAmplitude"  : (1.0, ),
+    "AnalogImpedanceReference"  : (1000.0, ),
+}
+
+# Values returned by '...Info' functions, keyed by the function name without its 'FDwf' prefix and 'Info' suffix.
+# Bitset outputs ('pfs...') of functions not listed here report all options as supported; other outputs are zero.
+_INFO_VALUES = {
+    "AnalogInFrequency"         : (1.0, 100e6),
+    "AnalogInBits"              : (_ANALOG_IN_BITS, ),
+    "AnalogInNoiseSize"         : (8192, ),
+    "AnalogInChannelRange"      : (0.5, 50.0, 2.0),
+    "AnalogInChannelOffset"     : (-25.0, 25.0, 1024.0),
+    "AnalogInTriggerPosition"   : (-0.5, 1e3, 65536.0),
+    "AnalogInTriggerAutoTimeout": (0.0, 10.0, 1024.0),
+    "AnalogInTriggerHoldOff"    : (0.0, 10.0, 1024.0),
+    "AnalogInTriggerChannel"    : (0, 1),
+    "AnalogInTriggerLevel"      : (-25.0, 25.0, 1024.0),
+    "AnalogInTriggerHysteresis" : (0.0, 25.0, 1024.0),
+    "AnalogInTriggerLength"     : (0.0, 1.0, 1024.0),
+    "AnalogOutRun"              : (0.0, 1e9),
+    "AnalogOutWait"             : (0.0, 1e9),
+    "AnalogOutRepeat"           : (0, 32768),
+    "AnalogOutNodeFrequency"    : (0.0, 12.5e6),
+    "AnalogOutNodeAmplitude"    : (-5.0, 5.0),
+    "AnalogOutNodeOffset"       : (-5.0, 5.0),
+    "AnalogOutNodeSymmetry"     : (0.0, 100.0),
+    "AnalogOutNodePhase"        : (0.0, 360.0),
+    "AnalogOutFrequency"        : (0.0, 12.5e6),
+    "AnalogOutAmplitude"        : (-5.0, 5.0),
+    "AnalogOutOffset"           : (-5.0, 5.0),
+    "AnalogOutSymmetry"         : (0.0, 100.0),
+    "AnalogOutPhase"            : (0.0, 360.0),
+    "DigitalInInternalClock"    : (_DIGITAL_CLOCK_FREQUENCY, ),
+    "DigitalInDivider"          : (1 << 30, ),
+    "DigitalInBits"             : (16, ),
+    "DigitalInTriggerPosition"  : (1 << 27, ),
+    "DigitalInTriggerAutoTimeout": (0.0, 10.0, 1024.0),
+    "DigitalOutInternalClock"   : (_DIGITAL_CLOCK_FREQUENCY, ),
+    "DigitalOutRun"             : (0.0, 1e9),
+    "DigitalOutWait"            : (0.0, 1e9),
+    "DigitalOutRepeat"          : (0, 32768),
+    "DigitalOutDivider"         : (1, 1 << 30),
+    "DigitalOutCounter"         : (0, 1 << 15),
+}
+
+
+class _typespec_names:
+    """A typespec that represents each ctypes type by its name, used to inspect the function signatures."""
+
+    def __getattr__(self, name):
+        return name
+
+
+@functools.lru_cache(maxsize=None)
+def _function_outputs() -> Dict[str, List[str]]:
+    """Return a dictionary that maps each library function name to the names of its pointer (output) arguments."""
+    return {name: [argname for (argname, argtype) in argtypes if argtype.endswith("_ptr")]
+            for (name, restype, argtypes, obsolete_flag) in dwf_function_signatures(_typespec_names())}
+
+
+def default_analog_in_signal(channel_index: int, t: np.ndarray) -> np.ndarray:
+    """The default simulated AnalogIn signal: a 1 kHz, 1 Volt amplitude sine wave, shifted by 90 degrees per channel."""
+    return np.sin(2.0 * np.pi * 1000.0 * t + 0.5 * np.pi * channel_index)
+
+
+def _is_output(arg) -> bool:
+    """Determine if a library function argument is an output, i.e., a ctypes variable passed by reference."""
+    return isinstance(arg, ctypes._SimpleCData)  # pylint: disable=protected-access
+
+
+def _as_array(pointer, dtype, count: int) -> np.ndarray:
+    """Return a NumPy view of 'count' elements of the given dtype at the memory that a ctypes pointer points to."""
+    address = ctypes.cast(pointer, ctypes.c_void_p).value
+    buffer = (ctypes.c_char * (count * np.dtype(dtype).itemsize)).from_address(address)
+    return np.frombuffer(buffer, dtype=dtype, count=count)
+
+
+class _Acquisition:
+    """The timing of an acquisition that produces samples at a fixed rate into a device buffer of fixed size.
+
+    In record mode, samples are transferred to the host when the instrument status is fetched with its data.
+    Samples that were overwritten in the device buffer before they could be transferred are counted as lost.
+    """
+
+    def __init__(self, clock: Callable[[], float], frequency: float, buffer_size: int, mode: int,
+                 record_samples: int) -> None:
+        self._clock = clock
+        self.frequency = frequency
+        self.buffer_size = buffer_size
+        self.mode = mode
+        self.record_samples = record_samples  # Zero for an unbounded recording.
+        self.start_time = clock()
+        self.transferred = 0     # Record mode: the number of samples transferred or lost.
+        self.data_start = 0      # The sample index of the first sample of the data that was last fetched.
+        self.data_count = 0      # The number of samples that were last fetched.
+        self.record_status = (0, 0, 0)
+
+    def produced(self) -> int:
+        """Return the number of samples produced since the acquisition started."""
+        produced = int((self._clock() - self.start_time) * self.frequency)
+        if self.mode == _ACQMODE_SINGLE:
+            return min(produced, self.buffer_size)
+        if self.mode == _ACQMODE_RECORD and self.record_samples > 0:
+            return min(produced, self.record_samples)
+        return produced
+
+    def done(self) -> bool:
+        """Determine if the acquisition is done."""
+        if self.mode == _ACQMODE_SINGLE:
+            return self.produced() >= self.buffer_size
+        if self.mode == _ACQMODE_RECORD:
+            return self.record_samples > 0 and self.transferred >= self.record_samples
+        return False
+
+    def fetch(self) -> None:
+        """Fetch the status and data of the acquisition, as FDwfAnalogInStatus and FDwfDigitalInStatus do."""
+        produced = self.produced()
+        if self.mode == _ACQMODE_RECORD:
+            pending = produced - self.transferred
+            lost = max(0, pending - self.buffer_size)
+            available = pending - lost
+            corrupt = available if lost > 0 else 0
+            self.data_start = self.transferred + lost
+            self.data_count = available
+            self.transferred = produced
+            self.record_status = (available, lost, corrupt)
+        else:
+            self.data_count = min(produced, self.buffer_size)
+            self.data_start = produced - self.data_count
+
+    def samples_left(self) -> int:
+        """Return the number of samples left to acquire."""
+        if self.mode == _ACQMODE_RECORD:
+            return max(0, self.record_samples - self.transferred) if self.record_samples > 0 else 0
+        return max(0, self.buffer_size - self.produced())
+
+
+class _PlayBuffer:
+    """The device buffer of an AnalogOut channel node in play mode, which drains at the node frequency."""
+
+    def __init__(self, clock: Callable[[], float], frequency: float, capacity: int) -> None:
+        self._clock = clock
+        self.frequency = frequency
+        self.capacity = capacity
+        self.level = 0.0
+        self.last_time = clock()
+        self.lost = 0
+        self.corrupted = 0
+
+    def _drain(self) -> None:
+        now = self._clock()
+        self.level -= (now - self.last_time) * self.frequency
+        self.last_time = now
+        if self.level < 0.0:
+            self.lost += int(-self.level)
+            self.level = 0.0
+
+    def status(self) -> Tuple[int, int, int]:
+        """Return (free, lost, corrupted), and reset the lost and corrupted counts."""
+        self._drain()
+        result = (self.capacity - int(np.ceil(self.level)), self.lost, self.corrupted)
+        self.lost = 0
+        self.corrupted = 0
+        return result
+
+    def play(self, count: int) -> None:
+        """Add 'count' samples to the buffer. Samples that don't fit are counted as corrupted."""
+        self._drain()
+        self.level += count
+        if self.level > self.capacity:
+            self.corrupted += int(self.level - self.capacity)
+            self.level = float(self.capacity)
+
+
+class SimulatedDwfLibrary:
+    """A stand-in for the DWF shared library, that simulates a single Analog Discovery 2 device.
+
+    Library functions are looked up as attributes, as they are on a ctypes library. Their arguments are passed
+    exactly as they would be to the ctypes functions: output arguments are ctypes variables, and array arguments
+    are ctypes pointers.
+    """
+
+    def __init__(self, clock: Optional[Callable[[], float]]=None,
+                 analog_in_signal: Callable[[int, np.ndarray], np.ndarray]=default_analog_in_signal) -> None:
+        """Initialize a simulated library.
+
+        Args:
+            clock: The time source, in seconds; time.perf_counter by default.
+                   Passing a manually advanced clock makes the simulation fully deterministic.
+            analog_in_signal: A function that maps a channel index and an array of times (in seconds since the start
+                              of the acquisition) to the AnalogIn input voltages at those times.
+        """
+        self._clock = time.perf_counter if clock is None else clock
+        self._analog_in_signal = analog_in_signal
+        self._function_outputs = _function_outputs()
+        self._config_index = 0
+        self._is_open = False
+        self._reset_device()
+
+    def _reset_device(self) -> None:
+        self._settings = {}
+        self._reset_time = self._clock()
+        self._analog_in = None
+        self._digital_in = None
+        self._play_buffers = {}
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or name not in self._function_outputs:
+            raise AttributeError("Function {!r} is not part of the DWF library.".format(name))
+        func = getattr(self, "_sim_" + name[4:], None)
+        if func is None:
+            match = re.fullmatch(r"FDwf(\w+?)(Set|Get|Info)(64)?", name)
+            if match is None:
+                func = self._no_operation
+            else:
+                (setting, kind, suffix) = match.groups()
+                setting += suffix or ""
+                if kind == "Set":
+                    get_name = "FDwf{}Get{}".format(match.group(1), suffix or "")
+                    get_outputs = self._function_outputs.get(get_name)
+                    num_values = None if get_outputs is None else len(get_outputs)
+                    func = functools.partial(self._set_setting, setting, num_values)
+                elif kind == "Get":
+                    func = functools.partial(self._get_setting, setting)
+                else:
+                    func = functools.partial(self._get_info, setting, self._function_outputs[name])
+        self.__dict__[name] = func
+        return func
+
+    # Generic handling of functions.
+
+    @staticmethod
+    def _no_operation(*args) -> int:
+        for arg in args:
+            if _is_output(arg):
+                arg.value = 0
+        return _RESULT_SUCCESS
+
+    def _set_setting(self, setting: str, num_values: Optional[int], *args) -> int:
+        if args and setting != "Param":
+            args = args[1:]  # Skip the device handle.
+        if num_values is None:
+            num_values = len(args)
+        split = len(args) - num_values
+        index = args[:split]
+        if index and index[0] == -1:
+            # A channel index of -1 addresses all channels; forget the settings of the individual channels.
+            self._settings = {key: value for (key, value) in self._settings.items()
+                              if not (key[0] == setting and key[2:] == index[1:])}
+        self._settings[(setting, ) + index] = args[split:]
+        return _RESULT_SUCCESS
+
+    def _lookup(self, setting: str, index: tuple) -> tuple:
+        """Return the values of a setting, as stored by the '...Set' function, or its default values."""
+        values = self._settings.get((setting, ) + index)
+        if values is None and index:
+            values = self._settings.get((setting, -1) + index[1:])
+        if values is None:
+            config = _DEVICE_CONFIGURATIONS[self._config_index]
+            if setting == "AnalogInBufferSize":
+                values = (config[7], )
+            elif setting == "DigitalInBufferSize":
+                values = (config[9], )
+            else:
+                values = _DEFAULT_SETTINGS.get(setting, (0, 0, 0, 0))
+        return values
+
+    def _setting(self, setting: str, *index):
+        """Return the first value of a setting."""
+        return self._lookup(setting, index)[0]
+
+    def _get_setting(self, setting: str, *args) -> int:
+        if args and setting != "Param":
+            args = args[1:]  # Skip the device handle.
+        index = tuple(arg for arg in args if not _is_output(arg))
+        outputs = [arg for arg in args if _is_output(arg)]
+        for (output, value) in zip(outputs, self._lookup(setting, index)):
+            output.value = value
+        return _RESULT_SUCCESS
+
+    def _get_info(self, setting: str, output_names: List[str], *args) -> int:
+        config = _DEVICE_CONFIGURATIONS[self._config_index]
+        if setting == "AnalogInBufferSize":
+            values = (16, config[7])
+        elif setting == "DigitalInBufferSize":
+            values = (config[9], )
+        elif setting in ("AnalogOutNodeData", "AnalogOutData"):
+            values = (16, config[8])
+        elif setting == "DigitalOutData":
+            values = (config[10], )
+        else:
+            values = _INFO_VALUES.get(setting)
+        outputs = [arg for arg in args[1:] if _is_output(arg)]
+        for (position, (output_name, output)) in enumerate(zip(output_names, outputs)):
+            if values is not None:
+                output.value = values[position] if position < len(values) else 0
+            else:
+                # Bitsets report all options as supported.
+                output.value = -1 if output_name.startswith("pfs") else 0
+        return _RESULT_SUCCESS
+
+    # Miscellaneous functions.
+
+    def _sim_GetVersion(self, szVersion) -> int:
+        szVersion.value = dwf_version.encode()
+        return _RESULT_SUCCESS
+
+    def _sim_GetLastError(self, pdwferc) -> int:
+        pdwferc.value = 0
+        return _RESULT_SUCCESS
+
+    def _sim_GetLastErrorMsg(self, szError) -> int:
+        szError.value = b""
+        return _RESULT_SUCCESS
+
+    # Device enumeration functions.
+
+    def _sim_Enum(self, enumfilter, pcDevice) -> int:
+        pcDevice.value = 1
+        return _RESULT_SUCCESS
+
+    def _sim_EnumDeviceType(self, idxDevice, pDeviceId, pDeviceRevision) -> int:
+        pDeviceId.value = _DEVID_DISCOVERY2
+        pDeviceRevision.value = _DEVICE_REVISION
+        return _RESULT_SUCCESS
+
+    def _sim_EnumDeviceIsOpened(self, idxDevice, pfIsUsed) -> int:
+        pfIsUsed.value = self._is_open
+        return _RESULT_SUCCESS
+
+    def _sim_EnumUserName(self, idxDevice, szUserName) -> int:
+        szUserName.value = b"Discovery2"
+        return _RESULT_SUCCESS
+
+    def _sim_EnumDeviceName(self, idxDevice, szDeviceName) -> int:
+        szDeviceName.value = b"Analog Discovery 2"
+        return _RESULT_SUCCESS
+
+    def _sim_EnumSN(self, idxDevice, szSN) -> int:
+        szSN.value = _SERIAL_NUMBER.encode()
+        return _RESULT_SUCCESS
+
+    def _sim_EnumConfig(self, idxDevice, pcConfig) -> int:
+        pcConfig.value = len(_DEVICE_CONFIGURATIONS)
+        return _RESULT_SUCCESS
+
+    def _sim_EnumConfigInfo(self, idxConfig, info, pv) -> int:
+        pv.value = _DEVICE_CONFIGURATIONS[idxConfig].get(info, 0)
+        return _RESULT_SUCCESS
+
+    # Device control functions.
+
+    def _sim_DeviceOpen(self, idxDevice, phdwf) -> int:
+        return self._sim_DeviceConfigOpen(idxDevice, 0, phdwf)
+
+    def _sim_DeviceConfigOpen(self, idxDev, idxCfg, phdwf) -> int:
+        self._config_index = idxCfg
+        self._is_open = True
+        self._reset_device()
+        phdwf.value = 1
+        return _RESULT_SUCCESS
+
+    def _sim_DeviceClose(self, hdwf) -> int:
+        self._is_open = False
+        self._reset_device()
+        return _RESULT_SUCCESS
+
+    def _sim_DeviceCloseAll(self) -> int:
+        return self._sim_DeviceClose(1)
+
+    def _sim_DeviceReset(self, hdwf) -> int:
+        self._reset_device()
+        return _RESULT_SUCCESS
+
+    def _reset_instrument(self, prefix: str) -> None:
+        self._settings = {key: value for (key, value) in self._settings.items() if not key[0].startswith(prefix)}
+
+    # AnalogIn functions.
+
+    def _sim_AnalogInReset(self, hdwf) -> int:
+        self._reset_instrument("AnalogIn")
+        self._analog_in = None
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInConfigure(self, hdwf, fReconfigure, fStart) -> int:
+        if not fStart:
+            self._analog_in = None
+        else:
+            frequency = self._setting("AnalogInFrequency")
+            mode = self._setting("AnalogInAcquisitionMode")
+            record_samples = round(self._setting("AnalogInRecordLength") * frequency)
+            buffer_size = int(self._setting("AnalogInBufferSize"))
+            self._analog_in = _Acquisition(self._clock, frequency, buffer_size, mode, record_samples)
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInStatus(self, hdwf, fReadData, psts) -> int:
+        acquisition = self._analog_in
+        if acquisition is None:
+            psts.value = _STATE_READY
+            return _RESULT_SUCCESS
+        if fReadData:
+            acquisition.fetch()
+        psts.value = _STATE_DONE if acquisition.done() else _STATE_RUNNING
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInStatusRecord(self, hdwf, pcdDataAvailable, pcdDataLost, pcdDataCorrupt) -> int:
+        status = (0, 0, 0) if self._analog_in is None else self._analog_in.record_status
+        (pcdDataAvailable.value, pcdDataLost.value, pcdDataCorrupt.value) = status
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInStatusSamplesLeft(self, hdwf, pcSamplesLeft) -> int:
+        pcSamplesLeft.value = 0 if self._analog_in is None else self._analog_in.samples_left()
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInStatusSamplesValid(self, hdwf, pcSamplesValid) -> int:
+        pcSamplesValid.value = 0 if self._analog_in is None else self._analog_in.data_count
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInStatusIndexWrite(self, hdwf, pidxWrite) -> int:
+        acquisition = self._analog_in
+        pidxWrite.value = 0 if acquisition is None else acquisition.produced() % acquisition.buffer_size
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInStatusTime(self, hdwf, psecUtc, ptick, pticksPerSecond) -> int:
+        return self._status_time(psecUtc, ptick, pticksPerSecond)
+
+    def _status_time(self, psecUtc, ptick, pticksPerSecond) -> int:
+        now = time.time()
+        psecUtc.value = int(now)
+        ptick.value = int((now % 1.0) * _DIGITAL_CLOCK_FREQUENCY)
+        pticksPerSecond.value = int(_DIGITAL_CLOCK_FREQUENCY)
+        return _RESULT_SUCCESS
+
+    def _analog_in_raw(self, channel_index: int, first: int, count: int) -> np.ndarray:
+        """Return the raw (16-bit) samples of a channel, for sample indices first to first + count."""
+        frequency = self._analog_in.frequency
+        t = np.arange(first, first + count) / frequency
+        volts = self._analog_in_signal(channel_index, t)
+        volts_range = self._setting("AnalogInChannelRange", channel_index)
+        volts_offset = self._setting("AnalogInChannelOffset", channel_index)
+        raw = np.clip(np.round((volts - volts_offset) / volts_range * 65536.0), -32768, 32767).astype(np.int16)
+        # Only the most significant bits of the ADC are valid.
+        raw &= np.int16(-(1 << (16 - _ANALOG_IN_BITS)))
+        return raw
+
+    def _analog_in_volts(self, channel_index: int, first: int, count: int) -> np.ndarray:
+        raw = self._analog_in_raw(channel_index, first, count)
+        volts_range = self._setting("AnalogInChannelRange", channel_index)
+        volts_offset = self._setting("AnalogInChannelOffset", channel_index)
+        return raw / 65536.0 * volts_range + volts_offset
+
+    def _sim_AnalogInStatusData(self, hdwf, idxChannel, rgdVoltData, cdData) -> int:
+        return self._sim_AnalogInStatusData2(hdwf, idxChannel, rgdVoltData, 0, cdData)
+
+    def _sim_AnalogInStatusData2(self, hdwf, idxChannel, rgdVoltData, idxData, cdData) -> int:
+        if self._analog_in is not None and cdData > 0:
+            first = self._analog_in.data_start + idxData
+            _as_array(rgdVoltData, np.float64, cdData)[:] = self._analog_in_volts(idxChannel, first, cdData)
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInStatusData16(self, hdwf, idxChannel, rgu16Data, idxData, cdData) -> int:
+        if self._analog_in is not None and cdData > 0:
+            first = self._analog_in.data_start + idxData
+            _as_array(rgu16Data, np.int16, cdData)[:] = self._analog_in_raw(idxChannel, first, cdData)
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInStatusNoise2(self, hdwf, idxChannel, rgdMin, rgdMax, idxData, cdData) -> int:
+        if self._analog_in is not None and cdData > 0:
+            first = self._analog_in.data_start + idxData
+            volts = self._analog_in_volts(idxChannel, first, cdData)
+            _as_array(rgdMin, np.float64, cdData)[:] = volts
+            _as_array(rgdMax, np.float64, cdData)[:] = volts
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInStatusNoise(self, hdwf, idxChannel, rgdMin, rgdMax, cdData) -> int:
+        return self._sim_AnalogInStatusNoise2(hdwf, idxChannel, rgdMin, rgdMax, 0, cdData)
+
+    def _sim_AnalogInStatusSample(self, hdwf, idxChannel, pdVoltSample) -> int:
+        acquisition = self._analog_in
+        if acquisition is None:
+            t = np.array([self._clock() - self._reset_time])
+            pdVoltSample.value = float(self._analog_in_signal(idxChannel, t)[0])
+        else:
+            pdVoltSample.value = float(self._analog_in_volts(idxChannel, max(0, acquisition.produced() - 1), 1)[0])
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInChannelCount(self, hdwf, pcChannel) -> int:
+        pcChannel.value = _DEVICE_CONFIGURATIONS[self._config_index][1]
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInChannelRangeSteps(self, hdwf, rgVoltsStep, pnSteps) -> int:
+        steps = (5.0, 50.0)
+        for (index, step) in enumerate(steps):
+            rgVoltsStep[index] = step
+        pnSteps.value = len(steps)
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogInTriggerPositionStatus(self, hdwf, psecPosition) -> int:
+        psecPosition.value = self._setting("AnalogInTriggerPosition")
+        return _RESULT_SUCCESS
+
+    # AnalogOut functions.
+
+    def _sim_AnalogOutCount(self, hdwf, pcChannel) -> int:
+        pcChannel.value = _DEVICE_CONFIGURATIONS[self._config_index][2]
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogOutReset(self, hdwf, idxChannel) -> int:
+        self._reset_instrument("AnalogOut")
+        self._play_buffers = {}
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogOutConfigure(self, hdwf, idxChannel, fStart) -> int:
+        if fStart == 3:
+            # Apply the settings without changing the run state; the simulated play buffers are not affected.
+            return _RESULT_SUCCESS
+        channel_count = _DEVICE_CONFIGURATIONS[self._config_index][2]
+        if idxChannel < 0:
+            channels = range(channel_count)
+        else:
+            # Channels that follow the given channel as their master are started and stopped along with it.
+            channels = [channel_index for channel_index in range(channel_count)
+                        if self._settings.get(("AnalogOutMaster", channel_index), (channel_index, ))[0] == idxChannel]
+        for channel_index in channels:
+            if not fStart:
+                self._play_buffers.pop(channel_index, None)
+                continue
+            # Node 0 is the carrier; play mode is only simulated on the carrier.
+            frequency = self._setting("AnalogOutNodeFrequency", channel_index, 0)
+            capacity = _DEVICE_CONFIGURATIONS[self._config_index][8]
+            self._play_buffers[channel_index] = _PlayBuffer(self._clock, frequency, capacity)
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogOutStatus(self, hdwf, idxChannel, psts) -> int:
+        psts.value = _STATE_RUNNING if idxChannel in self._play_buffers else _STATE_READY
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogOutNodePlayStatus(self, hdwf, idxChannel, node, cdDataFree, cdDataLost, cdDataCorrupted) -> int:
+        play_buffer = self._play_buffers.get(idxChannel)
+        if play_buffer is None:
+            status = (_DEVICE_CONFIGURATIONS[self._config_index][8], 0, 0)
+        else:
+            status = play_buffer.status()
+        (cdDataFree.value, cdDataLost.value, cdDataCorrupted.value) = status
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogOutNodePlayData(self, hdwf, idxChannel, node, rgdData, cdData) -> int:
+        play_buffer = self._play_buffers.get(idxChannel)
+        if play_buffer is not None:
+            play_buffer.play(cdData)
+        return _RESULT_SUCCESS
+
+    def _sim_AnalogOutPlayStatus(self, hdwf, idxChannel, cdDataFree, cdDataLost, cdDataCorrupted) -> int:
+        return self._sim_AnalogOutNodePlayStatus(hdwf, idxChannel, 0, cdDataFree, cdDataLost, cdDataCorrupted)
+
+    def _sim_AnalogOutPlayData(self, hdwf, idxChannel, rgdData, cdData) -> int:
+        return self._sim_AnalogOutNodePlayData(hdwf, idxChannel, 0, rgdData, cdData)
+
+    # AnalogIO functions.
+
+    def _sim_AnalogIOChannelCount(self, hdwf, pnChannel) -> int:
+        pnChannel.value = _DEVICE_CONFIGURATIONS[self._config_index][3]
+        return _RESULT_SUCCESS
+
+    # DigitalIn functions.
+
+    def _sim_DigitalInReset(self, hdwf) -> int:
+        self._reset_instrument("DigitalIn")
+        self._digital_in = None
+        return _RESULT_SUCCESS
+
+    def _sim_DigitalInConfigure(self, hdwf, fReconfigure, fStart) -> int:
+        if not fStart:
+            self._digital_in = None
+        else:
+            frequency = _DIGITAL_CLOCK_FREQUENCY / max(1, self._setting("DigitalInDivider"))
+            mode = self._setting("DigitalInAcquisitionMode")
+            record_samples = self._setting("DigitalInTriggerPosition") if mode == _ACQMODE_RECORD else 0
+            buffer_size = int(self._setting("DigitalInBufferSize"))
+            self._digital_in = _Acquisition(self._clock, frequency, buffer_size, mode, record_samples)
+        return _RESULT_SUCCESS
+
+    def _sim_DigitalInStatus(self, hdwf, fReadData, psts) -> int:
+        acquisition = self._digital_in
+        if acquisition is None:
+            psts.value = _STATE_READY
+            return _RESULT_SUCCESS
+        if fReadData:
+            acquisition.fetch()
+        psts.value = _STATE_DONE if acquisition.done() else _STATE_RUNNING
+        return _RESULT_SUCCESS
+
+    def _sim_DigitalInStatusRecord(self, hdwf, pcdDataAvailable, pcdDataLost, pcdDataCorrupt) -> int:
+        status = (0, 0, 0) if self._digital_in is None else self._digital_in.record_status
+        (pcdDataAvailable.value, pcdDataLost.value, pcdDataCorrupt.value) = status
+        return _RESULT_SUCCESS
+
+    def _sim_DigitalInStatusSamplesLeft(self, hdwf, pcSamplesLeft) -> int:
+        pcSamplesLeft.value = 0 if self._digital_in is None else self._digital_in.samples_left()
+        return _RESULT_SUCCESS
+
+    def _sim_DigitalInStatusSamplesValid(self, hdwf, pcSamplesValid) -> int:
+        pcSamplesValid.value = 0 if self._digital_in is None else self._digital_in.data_count
+        return _RESULT_SUCCESS
+
+    def _sim_DigitalInStatusIndexWrite(self, hdwf, pidxWrite) -> int:
+        acquisition = self._digital_in
+        pidxWrite.value = 0 if acquisition is None else acquisition.produced() % acquisition.buffer_size
+        return _RESULT_SUCCESS
+
+    def _sim_DigitalInStatusTime(self, hdwf, psecUtc, ptick, pticksPerSecond) -> int:
+        return self._status_time(psecUtc, ptick, pticksPerSecond)
+
+    def _sim_DigitalInStatusData2(self, hdwf, rgData, idxSample, countOfDataBytes) -> int:
+        if self._digital_in is not None and countOfDataBytes > 0:
+            dtype = {8: np.uint8, 16: np.uint16, 32: np.uint32}.get(self._setting("DigitalInSampleFormat"), np.uint16)
+            count = countOfDataBytes // np.dtype(dtype).itemsize
+            first = self._digital_in.data_start + idxSample
+            # The counter bit stream wraps around naturally when cast to the sample type.
+            _as_array(rgData, dtype, count)[:] = np.arange(first, first + count, dtype=np.uint64).astype(dtype)
+        return _RESULT_SUCCESS
+
+    def _sim_DigitalInStatusData(self, hdwf, rgData, countOfDataBytes) -> int:
+        return self._sim_DigitalInStatusData2(hdwf, rgData, 0, countOfDataBytes)
+
+    # DigitalOut functions.
+
+    def _sim_DigitalOutCount(self, hdwf, pcChannel) -> int:
+        pcChannel.value = _DEVICE_CONFIGURATIONS[self._config_index][5]
+        return _RESULT_SUCCESS
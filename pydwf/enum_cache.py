@@ -0,0 +1,146 @@
+"""A persistent, on-disk cache of the configurations of enumerated devices.
+
+Enumerating a device's configurations (FDwfEnumConfig and FDwfEnumConfigInfo) for every run of a short-lived program
+is wasteful, since the configurations of a device don't change. The EnumCache class stores them in a JSON file in the
+user's cache directory, keyed by serial number, and is shared by all processes of the user:
+
+    from pydwf.enum_cache import EnumCache
+
+    dwf.enum.cache = EnumCache()
+
+With a cache attached, EnumAPI.snapshot() takes the configurations of known devices from the cache, and
+DeviceAPI.openBySerialNumber() uses the cached device type of the serial number to enumerate only devices of that type.
+
+The device enumeration itself (FDwfEnum) can't be skipped, since devices are opened by their index in the latest
+enumeration; it also serves as the check that a cached device is still present. The cache is discarded when the
+version of the DWF library changes. Entries whose device type doesn't match the enumerated device, and serial numbers
+that are not found among the devices of their cached type, are counted as stale and removed.
+"""
+
+import os
+import sys
+import json
+from typing import Optional, Tuple
+
+from . import DEVID, DEVVER, EnumConfigurationInfo
+
+
+def default_cache_filename() -> str:
+    """Return the default filename of the cache, in the user's cache directory."""
+    if sys.platform == "win32":
+        directory = os.environ.get("LOCALAPPDATA") or os.path.expanduser(os.path.join("~", "AppData", "Local"))
+    elif sys.platform == "darwin":
+        directory = os.path.expanduser(os.path.join("~", "Library", "Caches"))
+    else:
+        directory = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache"))
+    return os.path.join(directory, "pydwf", "enum_cache.json")
+
+
+class EnumCache:
+    """A persistent cache of device configurations, keyed by serial number and device type.
+
+    The cache file is read when the cache is first used, and written (atomically, by replacing it) when entries were
+    added or removed. Failure to write the cache file is ignored, since the cache is only an optimization.
+
+    The 'hits', 'misses' and 'stale' attributes count the lookups that were answered from the cache, that were not,
+    and the entries that were found to be invalid.
+    """
+
+    def __init__(self, filename: Optional[str]=None) -> None:
+        """Create a cache.
+
+        Args:
+            filename: The cache file. If not specified, the default_cache_filename() is used.
+        """
+        self.filename = default_cache_filename() if filename is None else filename
+        self._library_version = None
+        self._entries = None
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def validate(self, library_version: str) -> None:
+        """Load the cache file if it wasn't loaded yet, and discard its entries if they were made by another library version."""
+        if self._entries is None:
+            try:
+                with open(self.filename) as fi:
+                    contents = json.load(fi)
+                self._library_version = contents["library_version"]
+                self._entries = dict(contents["devices"])
+            except (OSError, ValueError, KeyError, TypeError):
+                # A missing or unreadable cache file is treated as an empty cache.
+                self._library_version = library_version
+                self._entries = {}
+
+        if self._library_version != library_version:
+            self.stale += len(self._entries)
+            self._library_version = library_version
+            self._entries = {}
+            self._dirty = True
+
+    def deviceType(self, serial_number: str) -> Optional[DEVID]:
+        """Return the cached device type of a serial number, or None if the serial number is not in the cache."""
+        entry = self._entries.get(serial_number)
+        return None if entry is None else DEVID(entry["device_type"])
+
+    def configurations(self, serial_number: str, device_type: DEVID, device_version: DEVVER) -> Optional[Tuple[EnumConfigurationInfo, ...]]:
+        """Return the cached configurations of a device, or None if they are not in the cache."""
+        entry = self._entries.get(serial_number)
+        if entry is not None and (entry["device_type"], entry["device_version"]) != (device_type.value, device_version.value):
+            self.forget(serial_number)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return tuple(EnumConfigurationInfo(*configuration) for configuration in entry["configurations"])
+
+    def store(self, serial_number: str, device_type: DEVID, device_version: DEVVER, configurations: Tuple[EnumConfigurationInfo, ...]) -> None:
+        """Add the configurations of a device to the cache."""
+        self._entries[serial_number] = {
+            "device_type"    : device_type.value,
+            "device_version" : device_version.value,
+            "configurations" : [list(configuration) for configuration in configurations]
+        }
+        self._dirty = True
+
+    def forget(self, serial_number: str) -> None:
+        """Remove a stale entry from the cache."""
+        if self._entries.pop(serial_number, None) is not None:
+            self.stale += 1
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        if self._entries:
+            self._entries = {}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache file, if entries were added or removed since it was read."""
+        if not self._dirty:
+            return
+        contents = {
+            "library_version": self._library_version,
+            "devices": self._entries
+        }
+        temp_filename = "{}.{}.tmp".format(self.filename, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(self.filename) or ".", exist_ok=True)
+            with open(temp_filename, "w") as fo:
+                json.dump(contents, fo, indent=2)
+            os.replace(temp_filename, self.filename)
+        except OSError:
+            return
+        self._dirty = False
+
+    def summary(self) -> dict:
+        """Return the cache statistics as a dictionary."""
+        return {
+            "filename": self.filename,
+            "entries": 0 if self._entries is None else len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale
+        }
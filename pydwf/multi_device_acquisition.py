@@ -0,0 +1,326 @@
+"""Synchronized single acquisitions on the AnalogIn instruments of several devices.
+
+The MultiDeviceAcquisition class coordinates an acquisition that spans several devices, e.g. the units of a rack:
+it arms the AnalogIn instruments of all devices, fires a shared trigger, waits for all acquisitions to complete,
+and aligns the samples of the devices in time:
+
+    from pydwf.multi_device_acquisition import MultiDeviceAcquisition
+
+    acquisition = MultiDeviceAcquisition(devices, channels=[[0, 1]] * len(devices), external_trigger=TRIGSRC.External1)
+    result = acquisition.acquire()
+
+The shared trigger is either the PC trigger of each device, pulsed on all devices at (nearly) the same time, or the
+PC trigger of the first device, which that device also drives onto a trigger pin that is wired to the same trigger
+pin of the other devices.
+
+All calls to a device are made on the device's executor thread (the one used by the async methods of the AnalogIn
+instrument), so the devices are armed and polled concurrently. The DWF library functions release the GIL while they
+execute, so the time of an acquisition doesn't grow with the number of devices.
+
+After the acquisitions are done, the time of the first sample of each device is derived from its trigger time and the
+trigger position reported by triggerPositionStatus(). With a shared hardware trigger signal, all devices are triggered
+at the same time; with PC triggers, the trigger time of each device is taken from its statusTime(). The samples of all
+devices are then trimmed to the time window that all devices have acquired.
+"""
+
+import time
+import threading
+import concurrent.futures
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import PyDwfError, TRIGSRC, ACQMODE, DwfState, DigilentWaveformsDevice
+
+
+class DeviceAcquisitionStatus(NamedTuple):
+    """The samples and timing of the acquisition of a single device, before alignment."""
+    samples: np.ndarray                     # The (count, channels) samples of the device.
+    sample_frequency: float                 # The sample frequency, in Hz.
+    trigger_position: float                 # The trigger position, in seconds, as reported by triggerPositionStatus().
+    timestamp: Tuple[int, int, int]         # The (sec_utc, tick, ticks_per_second) trigger time, as reported by statusTime().
+
+
+class AlignedAcquisition(NamedTuple):
+    """The aligned samples of a multi-device acquisition.
+
+    Times are given in seconds, relative to the trigger of the first device.
+    """
+    samples: List[np.ndarray]               # The (count, channels) samples of each device; the same count for all devices.
+    sample_frequency: float                 # The sample frequency of all devices, in Hz.
+    start_time: float                       # The time of the first aligned sample.
+    trigger_offsets: List[float]            # The trigger time of each device, derived from its statusTime(), or zero for a shared hardware trigger.
+    sample_offsets: List[int]               # The index of the first aligned sample in the acquired samples of each device.
+    residual_offsets: List[float]           # The time of the first aligned sample of each device, relative to start_time.
+    statuses: List[DeviceAcquisitionStatus] # The samples and timing of each device, before alignment.
+
+    @property
+    def count(self) -> int:
+        """The number of aligned samples per channel."""
+        return len(self.samples[0])
+
+    def times(self) -> np.ndarray:
+        """Return the times of the aligned samples."""
+        return self.start_time + np.arange(self.count) / self.sample_frequency
+
+    def stacked(self) -> np.ndarray:
+        """Return the aligned samples of all devices as a single (count, total channels) array."""
+        return np.hstack(self.samples)
+
+
+# The instrument states that show that the instrument is ready for its trigger, or has already been triggered.
+_ARMED_STATES = (DwfState.Armed, DwfState.Triggered, DwfState.Done)
+
+
+def _trigger_offset(timestamp: Tuple[int, int, int], reference: Tuple[int, int, int]) -> float:
+    """Return the time of a statusTime() timestamp relative to a reference timestamp, in seconds.
+
+    The whole seconds and the ticks are subtracted separately, since a float doesn't have the precision
+    to represent the ticks of an absolute timestamp.
+
+    Raises:
+        PyDwfError: one of the timestamps is missing, i.e., its 'ticks_per_second' is zero.
+    """
+    if timestamp[2] == 0 or reference[2] == 0:
+        raise PyDwfError("Cannot align acquisitions: a device reported no trigger timestamp.")
+    (sec_utc, tick, ticks_per_second) = timestamp
+    (reference_sec_utc, reference_tick, reference_ticks_per_second) = reference
+    return (sec_utc - reference_sec_utc) + (tick / ticks_per_second - reference_tick / reference_ticks_per_second)
+
+
+def align(statuses: Sequence[DeviceAcquisitionStatus], tolerance: float=1e-9, shared_trigger: bool=False) -> AlignedAcquisition:
+    """Align the acquisitions of several devices in time, and trim them to the time window that all devices have acquired.
+
+    The time of sample i of a device, relative to its trigger, is trigger_position + (i - count / 2) / sample_frequency,
+    i.e., a trigger position of zero puts the trigger in the middle of the buffer.
+
+    If the devices were triggered by a shared hardware trigger signal, they were triggered simultaneously, and their
+    trigger offsets are zero. Otherwise, the trigger times of the devices are compared using their statusTime()
+    timestamps, which are taken from the clock of the host; some devices don't report a timestamp (statusTime() then
+    returns zeroes), and can then only be aligned using a shared trigger signal.
+
+    Args:
+        statuses: The acquisitions of the devices. The first device is the time reference.
+        tolerance: The maximum relative difference of the sample frequencies of the devices.
+        shared_trigger: True if the devices were triggered by a shared hardware trigger signal.
+
+    Returns:
+        The aligned acquisition.
+
+    Raises:
+        PyDwfError: the sample frequencies of the devices differ, their acquisitions don't overlap in time, or a
+            timestamp is missing while the devices were not triggered by a shared trigger signal.
+    """
+    if len(statuses) == 0:
+        raise PyDwfError("No acquisitions to align.")
+
+    sample_frequency = statuses[0].sample_frequency
+    for status in statuses:
+        if abs(status.sample_frequency - sample_frequency) > tolerance * sample_frequency:
+            raise PyDwfError("Cannot align acquisitions with sample frequencies of {} Hz and {} Hz.".format(sample_frequency, status.sample_frequency))
+
+    if shared_trigger:
+        trigger_offsets = [0.0] * len(statuses)
+    else:
+        reference = statuses[0].timestamp
+        trigger_offsets = [_trigger_offset(status.timestamp, reference) for status in statuses]
+
+    # The time of the first sample of each device, relative to the trigger of the first device.
+    first_sample_times = [trigger_offset + status.trigger_position - len(status.samples) / 2 / sample_frequency
+                          for (trigger_offset, status) in zip(trigger_offsets, statuses)]
+
+    start_time = max(first_sample_times)
+    sample_offsets = [round((start_time - first_sample_time) * sample_frequency) for first_sample_time in first_sample_times]
+    count = min(len(status.samples) - sample_offset for (status, sample_offset) in zip(statuses, sample_offsets))
+    if count <= 0:
+        raise PyDwfError("The acquisitions of the devices don't overlap in time.")
+
+    residual_offsets = [first_sample_time + sample_offset / sample_frequency - start_time
+                        for (first_sample_time, sample_offset) in zip(first_sample_times, sample_offsets)]
+
+    samples = [status.samples[sample_offset:sample_offset + count] for (status, sample_offset) in zip(statuses, sample_offsets)]
+
+    return AlignedAcquisition(samples, sample_frequency, start_time, trigger_offsets, sample_offsets, residual_offsets, list(statuses))
+
+
+class MultiDeviceAcquisition:
+    """Coordinate single acquisitions on the AnalogIn instruments of several devices, started by a shared trigger.
+
+    The devices' AnalogIn instruments should be configured (sample frequency, buffer size, channel ranges, trigger position)
+    before the acquisition; the sample frequency must be the same for all devices. The coordinator selects the
+    Single acquisition mode and the trigger source of each device.
+
+    With the default 'external_trigger' of None, the AnalogIn instrument of each device is triggered by the device's own PC
+    trigger, and the PC triggers of all devices are pulsed at the same time from their executor threads. The trigger times
+    of the devices then differ by the jitter of the triggerPC() calls, which is corrected when the samples are aligned.
+
+    If 'external_trigger' is given (one of TRIGSRC.External1 .. TRIGSRC.External4), the first device is the master:
+    its AnalogIn instrument is triggered by its PC trigger, which it also outputs on the corresponding trigger pin
+    (pin 0 for TRIGSRC.External1). The AnalogIn instruments of the other devices are triggered by that pin, which must
+    be wired to the same pin of the master device.
+    """
+
+    def __init__(self, devices: Sequence[DigilentWaveformsDevice], channels: Sequence[Sequence[int]],
+                 external_trigger: Optional[TRIGSRC]=None, dtype=np.float64) -> None:
+        """Prepare the devices for multi-device acquisitions.
+
+        Args:
+            devices: The devices. The first device is the time reference and, with an external trigger, the master.
+            channels: For each device, the AnalogIn channel indices to acquire.
+            external_trigger: The trigger source of the AnalogIn instruments of all devices but the first, or None
+                              to trigger each device by its own PC trigger.
+            dtype: Either np.float64 (samples in Volts) or np.int16 (raw samples).
+
+        Raises:
+            DigilentWaveformsLibraryError: the devices cannot be configured.
+            PyDwfError: the arguments are not valid.
+        """
+        if len(devices) == 0:
+            raise PyDwfError("No devices to acquire from.")
+
+        if len(channels) != len(devices):
+            raise PyDwfError("Expected a channel group for each of the {} devices, got {}.".format(len(devices), len(channels)))
+
+        # A device that occurs twice would be set up twice, and would deadlock fire(), since its executor thread
+        # cannot wait at the barrier for both occurrences.
+        if len(set(id(device) for device in devices)) != len(devices):
+            raise PyDwfError("A device occurs more than once.")
+
+        external_triggers = (TRIGSRC.External1, TRIGSRC.External2, TRIGSRC.External3, TRIGSRC.External4)
+        if external_trigger is not None and external_trigger not in external_triggers:
+            raise PyDwfError("Bad external trigger source: {!r}.".format(external_trigger))
+
+        self.devices = list(devices)
+        self.channels = [list(channel_group) for channel_group in channels]
+        self.external_trigger = external_trigger
+        self.dtype = np.dtype(dtype)
+
+        def setup(device_index: int, device: DigilentWaveformsDevice) -> None:
+            analogIn = device.analogIn
+            analogIn.acquisitionModeSet(ACQMODE.Single)
+            for channel_index in self.channels[device_index]:
+                analogIn.channelEnableSet(channel_index, True)
+            if external_trigger is None or device_index == 0:
+                analogIn.triggerSourceSet(TRIGSRC.PC)
+            else:
+                analogIn.triggerSourceSet(external_trigger)
+            if external_trigger is not None and device_index == 0:
+                device.triggerSet(external_trigger.value - TRIGSRC.External1.value, TRIGSRC.PC)
+
+        self._run(setup)
+
+    def _run(self, function: Callable[[int, DigilentWaveformsDevice], object]) -> list:
+        """Call a function for each device on the device's executor thread, and return the results.
+
+        All calls are waited for, even if some of them fail; the first exception is then raised.
+        """
+        futures = [device._async_executor().submit(function, device_index, device) for (device_index, device) in enumerate(self.devices)]
+        concurrent.futures.wait(futures)
+        return [future.result() for future in futures]
+
+    def arm(self, timeout: float=10.0) -> None:
+        """Start the acquisitions, and wait until the AnalogIn instruments of all devices are armed.
+
+        Args:
+            timeout: The maximum time to wait for the instruments to be armed, in seconds.
+
+        Raises:
+            DigilentWaveformsLibraryError: an acquisition cannot be started.
+            PyDwfError: an instrument was not armed in time.
+        """
+        deadline = time.monotonic() + timeout
+
+        def arm_device(device_index: int, device: DigilentWaveformsDevice) -> None:
+            analogIn = device.analogIn
+            analogIn.configure(False, True)
+            while analogIn.status(False) not in _ARMED_STATES:
+                if time.monotonic() > deadline:
+                    raise PyDwfError("The AnalogIn instrument of device #{} was not armed within {} seconds.".format(device_index, timeout))
+                time.sleep(0.001)
+
+        self._run(arm_device)
+
+    def fire(self) -> None:
+        """Fire the shared trigger.
+
+        With an external trigger, the PC trigger of the master device is pulsed. Otherwise, the PC triggers of all
+        devices are pulsed by their executor threads, which are released simultaneously by a barrier.
+
+        Raises:
+            DigilentWaveformsLibraryError: the PC trigger cannot be pulsed.
+        """
+        if self.external_trigger is not None:
+            master = self.devices[0]
+            master._async_executor().submit(master.triggerPC).result()
+            return
+
+        barrier = threading.Barrier(len(self.devices))
+
+        def fire_device(device_index: int, device: DigilentWaveformsDevice) -> None:
+            barrier.wait()
+            device.triggerPC()
+
+        self._run(fire_device)
+
+    def wait(self, timeout: float=10.0) -> List[DeviceAcquisitionStatus]:
+        """Wait for the acquisitions of all devices to complete, and read their samples and timing.
+
+        In between calls to status(), the executor thread of each device sleeps for a quarter of the time it takes
+        to fill the instrument's buffer (limited to the range 1 ms .. 100 ms), rather than polling continuously.
+
+        Args:
+            timeout: The maximum time to wait for the acquisitions to complete, in seconds.
+
+        Returns:
+            The samples and timing of the acquisition of each device.
+
+        Raises:
+            DigilentWaveformsLibraryError: an acquisition failed.
+            PyDwfError: an acquisition didn't complete in time.
+        """
+        deadline = time.monotonic() + timeout
+
+        def wait_device(device_index: int, device: DigilentWaveformsDevice) -> DeviceAcquisitionStatus:
+            analogIn = device.analogIn
+            poll_interval = min(max(analogIn._poll_interval(0.25), 0.001), 0.100)
+            while analogIn.status(True) != DwfState.Done:
+                if time.monotonic() > deadline:
+                    raise PyDwfError("The acquisition of device #{} didn't complete within {} seconds.".format(device_index, timeout))
+                time.sleep(poll_interval)
+            count = analogIn.statusSamplesValid()
+            samples = analogIn.statusDataMulti(self.channels[device_index], 0, count, self.dtype)
+            return DeviceAcquisitionStatus(samples, analogIn.frequencyGet(), analogIn.triggerPositionStatus(), analogIn.statusTime())
+
+        return self._run(wait_device)
+
+    def stop(self) -> None:
+        """Stop the acquisitions of all devices."""
+        self._run(lambda device_index, device: device.analogIn.configure(False, False))
+
+    def acquire(self, timeout: float=10.0) -> AlignedAcquisition:
+        """Perform a synchronized acquisition: arm all devices, fire the shared trigger, wait, and align the samples.
+
+        If the acquisition fails, the acquisitions of all devices are stopped.
+
+        Args:
+            timeout: The maximum time to wait for the instruments to be armed, and for the acquisitions to complete, in seconds.
+
+        Returns:
+            The aligned acquisition.
+
+        Raises:
+            DigilentWaveformsLibraryError: the acquisition failed.
+            PyDwfError: the acquisition didn't complete in time, or the samples cannot be aligned.
+        """
+        try:
+            self.arm(timeout)
+            self.fire()
+            statuses = self.wait(timeout)
+        except BaseException:
+            try:
+                self.stop()
+            except Exception:  # pylint: disable=broad-except
+                # Report the original error, rather than an error caused by it.
+                pass
+            raise
+        return align(statuses, shared_trigger=(self.external_trigger is not None))
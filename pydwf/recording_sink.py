@@ -0,0 +1,239 @@
+"""On-disk recording of long AnalogIn and DigitalIn record-mode acquisitions.
+
+The NpyRecordingSink class stores the samples of a record-mode acquisition in a '.npy' file, which is memory-mapped
+and grown as the acquisition proceeds. The instrument's recordStream() method reads the samples directly into the
+memory-mapped file, so the recording is not limited by the available RAM.
+
+Information about lost and corrupt samples, and the timestamps of the polls that completed each chunk, are stored
+in a JSON file next to the '.npy' file.
+"""
+
+import os
+import json
+import time
+import struct
+from typing import Optional
+
+import numpy as np
+
+from . import PyDwfError, RecordChunk
+
+
+class NpyRecordingSink:
+    """Store the samples of a record-mode acquisition in a growable, memory-mapped '.npy' file.
+
+    The file has a fixed-size header, so the header can be rewritten in place whenever the number of samples changes.
+    Between flushes the file is larger than its header indicates; the excess is truncated when the sink is closed.
+    After each flush, the file is a valid '.npy' file, which can be opened by another process while the recording
+    continues, e.g. using np.load(filename, mmap_mode='r').
+
+    Typical use:
+
+        with NpyRecordingSink("capture.npy", np.float64, num_channels=2) as sink:
+            sink.record(device.analogIn, channels=[0, 1], chunk_hint=65536)
+
+    The samples are stored as a (count, num_channels) array for AnalogIn samples, or as a (count, ) array if 'num_channels'
+    is None, as for DigitalIn samples. The (count, num_channels) array is stored in column-major (Fortran) order, so the
+    samples of each channel are contiguous, and the instrument reads the samples of each channel directly into the file.
+    While recording, the column of each channel has room for the capacity of the file, and the header describes a
+    (capacity, num_channels) array of which the first 'count' rows (as given in the metadata file) hold samples; when
+    the sink is closed, the columns are moved together, and the file holds a (count, num_channels) array.
+
+    The metadata file (the filename with its extension replaced by '.json') records:
+
+    * gaps: [index, length, lost] for each chunk that contains placeholders for lost samples;
+    * corrupt: [index, length, corrupt] for each chunk during which corrupt samples were reported;
+    * timestamps: [index, sec_utc, tick, ticks_per_second] for each chunk, as returned by the instrument's statusTime();
+    * count: the number of samples recorded.
+    """
+
+    _HEADER_SIZE = 128  # The size of the '.npy' header, in bytes, including the magic string.
+
+    def __init__(self, filename: str, dtype, num_channels: Optional[int]=None, initial_capacity: int=1048576) -> None:
+        """Create a recording file.
+
+        Args:
+            filename: The name of the '.npy' file to create. An existing file is overwritten.
+            dtype: The sample type, i.e., np.float64 or np.int16 for AnalogIn samples, or the unsigned integer type
+                   that matches the sample format for DigitalIn samples.
+            num_channels: The number of channels, or None for 1D samples.
+            initial_capacity: The number of samples for which room is made in the file initially.
+                              The capacity is doubled whenever it runs out.
+        """
+        if initial_capacity <= 0:
+            raise PyDwfError("Bad initial capacity: {!r}.".format(initial_capacity))
+
+        self.filename = filename
+        self.metadata_filename = os.path.splitext(filename)[0] + ".json"
+        self._dtype = np.dtype(dtype)
+        self._num_channels = num_channels
+        self._count = 0
+        self._capacity = 0
+        self._memmap = None
+        self._closed = False
+
+        self._gaps = []
+        self._corrupt = []
+        self._timestamps = []
+
+        with open(filename, "wb") as fo:
+            fo.write(self._header(0, 0))
+
+        self._grow(initial_capacity)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *dummy):
+        self.close()
+
+    @property
+    def count(self) -> int:
+        """The number of samples recorded."""
+        return self._count
+
+    @property
+    def samples(self) -> np.ndarray:
+        """A memory-mapped view of the samples recorded so far."""
+        if self._closed:
+            raise PyDwfError("Recording sink is closed.")
+        if self._num_channels is None:
+            return self._memmap[0, :self._count]
+        return self._memmap[:, :self._count].T
+
+    def _header(self, count: int, capacity: int) -> bytes:
+        """Make the fixed-size '.npy' (version 1.0) header for the given number of samples, in a file with the given capacity."""
+        if self._num_channels is None:
+            (fortran_order, shape) = (False, (count, ))
+        else:
+            (fortran_order, shape) = (True, (capacity, self._num_channels))
+        header = "{{'descr': {!r}, 'fortran_order': {}, 'shape': {!r}, }}".format(
+            np.lib.format.dtype_to_descr(self._dtype), fortran_order, shape)
+        header_size = self._HEADER_SIZE - 10  # 6 bytes magic string, 2 bytes version, 2 bytes header size.
+        if len(header) + 1 > header_size:
+            raise PyDwfError("Recording file header too large.")
+        header = header.ljust(header_size - 1) + "\n"
+        return b"\x93NUMPY\x01\x00" + struct.pack("<H", header_size) + header.encode("latin1")
+
+    def _grow(self, capacity: int) -> None:
+        """Extend the file to hold at least 'capacity' samples, and map it into memory.
+
+        The file is mapped as a (channels, capacity) array, i.e., a column of the (capacity, num_channels) array per row.
+        """
+        if self._memmap is not None:
+            self._memmap.flush()
+        num_columns = 1 if self._num_channels is None else self._num_channels
+        # Mapping the file with a larger shape extends the file.
+        samples = np.memmap(self.filename, dtype=self._dtype, mode="r+", offset=self._HEADER_SIZE, shape=(num_columns * capacity, ))
+        # Move the recorded samples of each column to its new position, starting at the last column, which moves the farthest.
+        for column in reversed(range(1, num_columns)):
+            samples[column * capacity:column * capacity + self._count] = samples[column * self._capacity:column * self._capacity + self._count]
+        self._memmap = samples.reshape(num_columns, capacity)
+        self._capacity = capacity
+
+    def allocate(self, count: int) -> np.ndarray:
+        """Return the writeable, memory-mapped destination for the next 'count' samples.
+
+        This method is passed as the 'allocate' argument of an instrument's recordStream() method.
+        Each chunk that is filled in the returned array must be committed by passing it to append()
+        before the next chunk is allocated. The samples of each channel are contiguous in the returned array.
+        """
+        if self._closed:
+            raise PyDwfError("Recording sink is closed.")
+        required = self._count + count
+        if required > self._capacity:
+            capacity = self._capacity
+            while capacity < required:
+                capacity *= 2
+            self._grow(capacity)
+        if self._num_channels is None:
+            return self._memmap[0, self._count:required]
+        return self._memmap[:, self._count:required].T
+
+    def append(self, chunk: RecordChunk, timestamp=None) -> None:
+        """Commit a chunk whose samples were read into an array obtained from allocate().
+
+        Args:
+            chunk: The chunk, as yielded by the instrument's recordStream() method.
+            timestamp: An optional (sec_utc, tick, ticks_per_second) tuple, as returned by statusTime().
+        """
+        if chunk.index != self._count:
+            raise PyDwfError("Chunk index {} doesn't follow the recorded samples ({}).".format(chunk.index, self._count))
+
+        length = len(chunk.samples)
+        if chunk.lost != 0:
+            self._gaps.append([chunk.index, length, chunk.lost])
+        if chunk.corrupt != 0:
+            self._corrupt.append([chunk.index, length, chunk.corrupt])
+        if timestamp is not None:
+            self._timestamps.append([chunk.index] + list(timestamp))
+
+        self._count += length
+
+    def record(self, instrument, flush_interval: float=1.0, **stream_args) -> int:
+        """Perform a record-mode acquisition, storing all samples in the recording file.
+
+        Args:
+            instrument: The instrument to acquire from, i.e., a device's analogIn or digitalIn sub-API.
+                        It should be configured for record mode.
+            flush_interval: The time between flushes of the recording file, in seconds.
+            stream_args: Arguments passed on to the instrument's recordStream() method
+                         (e.g., 'channels' and 'chunk_hint').
+
+        Returns:
+            The number of samples recorded.
+        """
+        count = self._count
+        next_flush = time.monotonic() + flush_interval
+        for chunk in instrument.recordStream(allocate=self.allocate, **stream_args):
+            self.append(chunk, instrument.statusTime())
+            if time.monotonic() >= next_flush:
+                self.flush()
+                next_flush = time.monotonic() + flush_interval
+        self.flush()
+        return self._count - count
+
+    def _write_metadata(self) -> None:
+        """Write the metadata file."""
+        metadata = {
+            "count": self._count,
+            "dtype": self._dtype.str,
+            "gaps": self._gaps,
+            "corrupt": self._corrupt,
+            "timestamps": self._timestamps
+        }
+        temp_filename = self.metadata_filename + ".tmp"
+        with open(temp_filename, "w") as fo:
+            json.dump(metadata, fo)
+        os.replace(temp_filename, self.metadata_filename)
+
+    def flush(self) -> None:
+        """Write the recorded samples to disk, and update the file header and the metadata file."""
+        if self._closed:
+            raise PyDwfError("Recording sink is closed.")
+        self._memmap.flush()
+        with open(self.filename, "r+b") as fo:
+            fo.write(self._header(self._count, self._capacity))
+        self._write_metadata()
+
+    def close(self) -> None:
+        """Finish the recording file, truncating it to the recorded samples.
+
+        Arrays obtained from the 'samples' property or from allocate() should no longer be used after closing.
+        """
+        if self._closed:
+            return
+        self.flush()
+        # Move the columns together, starting at the second column, which moves the least.
+        samples = self._memmap.reshape(-1)
+        (count, capacity) = (self._count, self._capacity)
+        for column in range(1, self._memmap.shape[0]):
+            samples[column * count:column * count + count] = samples[column * capacity:column * capacity + count]
+        samples.flush()
+        num_samples = samples.size // capacity * count
+        self._memmap = None
+        del samples
+        self._closed = True
+        with open(self.filename, "r+b") as fo:
+            fo.write(self._header(count, count))
+        os.truncate(self.filename, self._HEADER_SIZE + num_samples * self._dtype.itemsize)